@@ -1,13 +1,22 @@
-from fastapi import APIRouter, HTTPException, Depends, WebSocket
-from typing import List, Dict
+from fastapi import APIRouter, HTTPException, Depends, WebSocket, Request, Response
+from decimal import Decimal
+from typing import List, Dict, Optional, Tuple
 from src.services.binance_service import BinanceService
+from src.services.candle_service import INTERVALS
+from src.services.risk_engine import RiskEngine
 from src.services.settings_service import SettingsService
-from src.models.trading import OrderRequest
+from src.models.trading import OrderRequest, Position
+from src.utils.exceptions import TradingException
 from src.utils.logger import logger
 
 router = APIRouter(prefix="/api/v1")
 binance_service = BinanceService()
 settings_service = SettingsService()
+# HTTP 주문과 TradingService가 공유하는 사전 리스크 엔진
+risk_engine = RiskEngine()
+
+# 일괄 주문 요청당 최대 주문 수
+MAX_BATCH_ORDERS = 100
 
 @router.get("/health")
 async def health_check():
@@ -24,16 +33,89 @@ async def get_positions():
         logger.error(f"포지션 조회 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def check_order_risk(orders: List[OrderRequest]) -> List[Tuple[Optional[str], Optional[float]]]:
+    """주문별 사전 리스크 검사 (메모리 상태와 캐시된 마크 가격만 사용, 주문별 (거부 사유, 빈도 슬롯 예약) 반환)"""
+    store = binance_service.account_store
+    if not store.is_synced:
+        # REST 포지션 조회를 주문 앞에 두지 않음 (유저 스트림 재동기화 후 재시도)
+        raise HTTPException(
+            status_code=503,
+            detail="Account state is not synced",
+            headers={"Retry-After": "1"}
+        )
+    trading_settings = await settings_service.get_trading_settings()
+    risk_engine.compile(trading_settings, settings_service.version)
+    positions = {pos["symbol"]: Position.from_binance(pos) for pos in store.get_positions()}
+    equity = Decimal(str(store.account["totalMarginBalance"])) if store.account else None
+    checks: List[Tuple[Optional[str], Optional[float]]] = []
+    for order in orders:
+        try:
+            price = order.price or binance_service._cached_mark_price(order.symbol)
+            checks.append((None, risk_engine.check(order, positions, price, equity)))
+        except TradingException as e:
+            checks.append((e.detail, None))
+    return checks
+
 @router.post("/orders")
 async def create_order(order: OrderRequest):
-    """주문 생성"""
+    """주문 생성 (사전 리스크 검사 후 전송)"""
     try:
-        result = await binance_service.create_order(order)
-        return result
+        error, reservation = (await check_order_risk([order]))[0]
+        if error:
+            raise HTTPException(status_code=400, detail=error)
+        try:
+            return await binance_service.create_order(order)
+        except Exception:
+            risk_engine.release(reservation)
+            raise
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"주문 생성 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/orders/batch")
+async def create_orders(orders: List[OrderRequest]):
+    """주문 일괄 생성 (리스크 검사를 통과한 주문만 전송, 주문별 결과를 한 번에 반환)"""
+    if not orders:
+        raise HTTPException(status_code=400, detail="orders must not be empty")
+    if len(orders) > MAX_BATCH_ORDERS:
+        raise HTTPException(status_code=400, detail=f"at most {MAX_BATCH_ORDERS} orders per request")
+    try:
+        checks = await check_order_risk(orders)
+        passed = [index for index, (error, _) in enumerate(checks) if error is None]
+        results = [
+            {"index": index, "status": "rejected", "error": error}
+            for index, (error, _) in enumerate(checks)
+        ]
+        sent = []
+        try:
+            if passed:
+                sent = await binance_service.create_orders([orders[index] for index in passed])
+        finally:
+            # 접수되지 않은 주문의 빈도 슬롯 반환
+            for sent_index, index in enumerate(passed):
+                if sent_index >= len(sent) or sent[sent_index]["status"] != "accepted":
+                    risk_engine.release(checks[index][1])
+        for index, result in zip(passed, sent):
+            results[index] = {**result, "index": index}
+        return {"results": results}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"일괄 주문 생성 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/orders/open")
+async def get_open_orders(symbol: str = None):
+    """미체결 주문 조회"""
+    try:
+        orders = await binance_service.get_open_orders(symbol)
+        return orders
+    except Exception as e:
+        logger.error(f"미체결 주문 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/account")
 async def get_account():
     """계정 정보 조회"""
@@ -65,11 +147,54 @@ async def update_settings(settings: Dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/exchange-info")
-async def get_exchange_info():
-    """거래소 정보 조회"""
+async def get_exchange_info(request: Request):
+    """거래소 정보 조회 (캐시, ETag 지원)"""
     try:
-        info = await binance_service.get_exchange_info()
-        return info
+        await binance_service.get_exchange_info()
+        cache = binance_service.exchange_info
+        headers = {
+            "ETag": cache.etag,
+            "Cache-Control": f"max-age={int(cache.ttl)}"
+        }
+        if cache.matches_etag(request.headers.get("if-none-match")):
+            return Response(status_code=304, headers=headers)
+        return Response(content=cache.body, media_type="application/json", headers=headers)
     except Exception as e:
         logger.error(f"거래소 정보 조회 실패: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/depth/{symbol}")
+async def get_depth(symbol: str, limit: int = None):
+    """상위 호가 조회 (구독 중인 심볼은 로컬 호가창에서 제공)"""
+    if limit is not None and not 1 <= limit <= 1000:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 1000")
+    return await binance_service.get_order_book(symbol.upper(), limit)
+
+@router.get("/candles/{symbol}")
+async def get_candles(symbol: str, interval: str = "1m", limit: int = 500):
+    """캔들 조회 (바이낸스 klines 형식)"""
+    if interval not in INTERVALS:
+        raise HTTPException(status_code=400, detail=f"Unsupported interval: {interval}")
+    if not 1 <= limit <= 1500:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 1500")
+    return await binance_service.get_candles(symbol.upper(), interval, limit)
+
+@router.get("/indicators/{symbol}")
+async def get_indicators(symbol: str):
+    """설정된 지표 값 조회 (value: 마감 캔들 기준, live: 진행 중 캔들 포함)"""
+    symbol = symbol.upper()
+    if symbol not in binance_service.indicators.config:
+        raise HTTPException(status_code=404, detail=f"No indicators configured for {symbol}")
+    return {
+        "symbol": symbol,
+        "updated_at": binance_service.indicators.updated_at.get(symbol),
+        "values": binance_service.indicators.get_values(symbol)
+    }
+
+@router.get("/exchange-info/{symbol}")
+async def get_symbol_filters(symbol: str):
+    """심볼 필터 조회"""
+    filters = await binance_service.get_symbol_filters(symbol.upper())
+    if not filters:
+        raise HTTPException(status_code=404, detail=f"Unknown symbol: {symbol}")
+    return filters
@@ -1,97 +1,197 @@
 from fastapi import APIRouter, Header, HTTPException, Request
-from typing import Optional
-from services.trading_service import TradingService
-from config.env import EnvConfig
-from utils.logger import logger
+from typing import List, Optional, Tuple
+from src.models.trading import Position
+from src.services.trading_service import TradingService
+from src.services.webhook_queue import WebhookQueue
+from src.api.routes import binance_service
+from src.config.env import EnvConfig
+from src.utils.logger import logger
+from src.utils.metrics import metrics_manager
+from src.utils.replay_cache import ReplayCache, ReplayCacheFull
+from src.utils.serialization import loads
 import hmac
 import hashlib
+import time
 
 router = APIRouter()
+# 검증된 이벤트는 큐에 넣고 즉시 응답 (워커는 lifespan에서 시작)
+webhook_queue = WebhookQueue()
+
+# 특정 심볼에 묶이지 않는 계정 이벤트의 큐 키
+ACCOUNT_KEY = '__account__'
+
+# 허용 시간 창 안에서 이미 처리한 서명 (재전송 차단)
+replay_cache = ReplayCache(
+    max_size=EnvConfig.WEBHOOK_REPLAY_CACHE_SIZE,
+    ttl=EnvConfig.WEBHOOK_TIMESTAMP_TOLERANCE * 2
+)
 
 def verify_webhook_signature(
     signature: str, 
     timestamp: str, 
     body: bytes
 ) -> bool:
-    """웹훅 서명 검증"""
-    if not EnvConfig.WEBHOOK_SECRET:
+    """웹훅 서명 검증 (본문 바이트에 대해 디코딩/복사 없이 HMAC 계산)"""
+    if not EnvConfig.WEBHOOK_SECRET or not signature or not timestamp:
         return False
         
-    # 서명 생성
-    message = f"{timestamp}{body.decode()}"
-    expected_signature = hmac.new(
-        EnvConfig.WEBHOOK_SECRET.encode(),
-        message.encode(),
-        hashlib.sha256
-    ).hexdigest()
+    # 서명 생성 (timestamp + body)
+    mac = hmac.new(EnvConfig.WEBHOOK_SECRET.encode(), timestamp.encode(), hashlib.sha256)
+    mac.update(body)
     
-    return hmac.compare_digest(signature, expected_signature)
+    return hmac.compare_digest(signature, mac.hexdigest())
+
+def verify_webhook_timestamp(timestamp: str) -> bool:
+    """타임스탬프(ms)가 허용 시간 창 안인지 확인"""
+    try:
+        sent_at = int(timestamp) / 1000
+    except (TypeError, ValueError):
+        return False
+    return abs(time.time() - sent_at) <= EnvConfig.WEBHOOK_TIMESTAMP_TOLERANCE
+
+def reject_webhook(reason: str, status_code: int, detail: str, headers: Optional[dict] = None):
+    metrics_manager.webhook_requests_rejected.labels(reason=reason).inc()
+    raise HTTPException(status_code=status_code, detail=detail, headers=headers)
 
-@router.post("/webhook/binance")
+def webhook_key(data: dict) -> str:
+    """이벤트 합치기 기준 키 (심볼에 묶인 이벤트는 심볼, 그 외 계정 이벤트는 공통 키)"""
+    event_type = data.get('e')
+    if event_type == 'ORDER_TRADE_UPDATE':
+        return data.get('o', {}).get('s') or ACCOUNT_KEY
+    if event_type == 'ACCOUNT_UPDATE':
+        symbols = {pos.get('s') for pos in data.get('a', {}).get('P', [])}
+        return symbols.pop() if len(symbols) == 1 and None not in symbols else ACCOUNT_KEY
+    if event_type == 'ACCOUNT_CONFIG_UPDATE':
+        return data.get('ac', {}).get('s') or ACCOUNT_KEY
+    return ACCOUNT_KEY
+
+def split_webhook_event(data: dict) -> List[Tuple[str, dict]]:
+    """큐 등록 단위로 분리 (여러 심볼 포지션이 담긴 ACCOUNT_UPDATE는 심볼별로 나눠 주문 이벤트와 같은 키로 직렬화)"""
+    positions = data.get('a', {}).get('P', []) if data.get('e') == 'ACCOUNT_UPDATE' else []
+    symbols = list(dict.fromkeys(pos.get('s') for pos in positions))
+    if len(symbols) <= 1 or None in symbols:
+        return [(webhook_key(data), data)]
+    items = []
+    for index, symbol in enumerate(symbols):
+        account = {
+            **data['a'],
+            # 잔고 변경은 첫 번째 묶음에만 포함
+            'B': data['a'].get('B', []) if index == 0 else [],
+            'P': [pos for pos in positions if pos.get('s') == symbol]
+        }
+        items.append((symbol, {**data, 'a': account}))
+    return items
+
+@router.post("/webhook/binance", status_code=202)
 async def binance_webhook(
     request: Request,
     x_binance_signature: Optional[str] = Header(None),
     x_binance_timestamp: Optional[str] = Header(None)
 ):
-    """바이낸스 웹훅 처리"""
+    """바이낸스 웹훅 수신 (검증 후 큐에 넣고 202 응답)"""
     try:
         # 요청 본문 읽기
         body = await request.body()
         
-        # 서명 검증
+        # 시간 창 -> 서명 -> 재전송 순으로 검증 (서명이 맞는 요청만 캐시에 등록)
+        if not verify_webhook_timestamp(x_binance_timestamp):
+            reject_webhook("timestamp", 401, "Timestamp outside allowed window")
         if not verify_webhook_signature(
             x_binance_signature, 
             x_binance_timestamp, 
             body
         ):
-            raise HTTPException(status_code=401, detail="Invalid signature")
+            reject_webhook("signature", 401, "Invalid signature")
+        try:
+            is_new = replay_cache.check_and_add(x_binance_signature)
+        except ReplayCacheFull:
+            # 유효한 서명을 밀어내지 않고 발신 측 재시도 유도
+            reject_webhook("replay_cache_full", 503, "Replay cache is full", headers={"Retry-After": "1"})
+        if not is_new:
+            reject_webhook("replay", 409, "Webhook already received")
             
-        # 웹훅 데이터 파싱
-        data = await request.json()
-        event_type = data.get('e')
+        # 웹훅 데이터 파싱 (본문은 한 번만 파싱, 이벤트 객체가 아니면 서명 등록 취소)
+        try:
+            data = loads(body)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            replay_cache.discard(x_binance_signature)
+            reject_webhook("payload", 400, "Invalid JSON payload")
         
-        # 이벤트 타입별 처리
-        if event_type == 'ORDER_TRADE_UPDATE':
-            await handle_order_update(data)
-        elif event_type == 'ACCOUNT_UPDATE':
-            await handle_account_update(data)
+        # 처리 큐 등록 (가득 차면 발신 측 재시도 유도)
+        if not webhook_queue.submit_many(split_webhook_event(data)):
+            replay_cache.discard(x_binance_signature)
+            raise HTTPException(
+                status_code=503,
+                detail="Webhook queue is full",
+                headers={"Retry-After": "1"}
+            )
             
-        return {"message": "Webhook processed successfully"}
+        return {"message": "Webhook accepted"}
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"웹훅 처리 실패: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-async def handle_order_update(data: dict):
+async def process_webhook_events(trading_service: TradingService, key: str, events: List[dict]):
+    """같은 키로 합쳐진 웹훅 이벤트 일괄 처리 (포지션은 이벤트 값으로 갱신, 누락 감지 시에만 REST 대조)"""
+    binance = trading_service.binance
+    changed = {}
+    reconcile = {}
+    for data in events:
+        # 계정 상태에 직접 반영 (오래된 이벤트는 버려지고 누락 감지 심볼 반환)
+        gaps = binance.account_store.apply_event(data, leverage_lookup=binance.get_leverage)
+        reconcile.update(dict.fromkeys(gaps))
+        event_type = data.get('e')
+        if event_type == 'ORDER_TRADE_UPDATE':
+            handle_order_update(data)
+        elif event_type == 'ACCOUNT_UPDATE':
+            changed.update(dict.fromkeys(handle_account_update(data)))
+        elif event_type == 'ACCOUNT_CONFIG_UPDATE':
+            handle_account_config_update(data)
+
+    for symbol in reconcile:
+        position = await binance.reconcile_position(symbol)
+        await trading_service.apply_position(symbol, position)
+    for symbol in changed:
+        if symbol in reconcile:
+            continue
+        data = binance.account_store.get_position(symbol)
+        await trading_service.apply_position(symbol, Position.from_binance(data) if data else None)
+    if len(events) > 1:
+        logger.info(
+            f"웹훅 이벤트 {len(events)}건 일괄 처리 ({key}): "
+            f"포지션 반영 {len(changed)}개, REST 대조 {len(reconcile)}개"
+        )
+
+def handle_order_update(data: dict):
     """주문 업데이트 처리"""
+    order_data = data.get('o', {})
+    logger.info(f"주문 업데이트 수신: {order_data.get('s')} {order_data.get('X')}")
+
+def handle_account_update(data: dict) -> List[str]:
+    """계정 업데이트 처리 (포지션이 바뀐 심볼 반환)"""
+    # 포지션 변경 확인
+    positions = data.get('a', {}).get('P', [])
+    logger.info(f"계정 업데이트 수신: {len(positions)}개 포지션")
+    return [pos['s'] for pos in positions if pos.get('s')]
+
+def handle_account_config_update(data: dict):
+    """계정 설정 업데이트 처리 (레버리지 변경)"""
     try:
-        order_data = data.get('o', {})
-        symbol = order_data.get('s')
+        config = data.get('ac', {})
+        symbol = config.get('s')
+        leverage = config.get('l')
         
-        if symbol:
-            # 포지션 정보 업데이트
-            await trading_service.update_position(symbol)
+        if symbol and leverage is not None:
+            # 레버리지 테이블만 갱신 (REST 호출 없음)
+            binance_service.apply_leverage_update(symbol, leverage)
             
-        logger.info(f"주문 업데이트 처리 완료: {symbol}")
+        logger.info(f"계정 설정 업데이트 처리 완료: {symbol}")
         
     except Exception as e:
-        logger.error(f"주문 업데이트 처리 실패: {e}")
+        logger.error(f"계정 설정 업데이트 처리 실패: {e}")
         raise
-
-async def handle_account_update(data: dict):
-    """계정 업데이트 처리"""
-    try:
-        # 포지션 변경 확인
-        positions = data.get('a', {}).get('P', [])
-        
-        for pos in positions:
-            symbol = pos.get('s')
-            if symbol:
-                # 포지션 정보 업데이트
-                await trading_service.update_position(symbol)
-                
-        logger.info(f"계정 업데이트 처리 완료: {len(positions)}개 포지션")
-        
-    except Exception as e:
-        logger.error(f"계정 업데이트 처리 실패: {e}")
-        raise
\ No newline at end of file
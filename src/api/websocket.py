@@ -1,20 +1,31 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict, Set
+from typing import Dict, List, Optional, Set
 import json
+import math
 import asyncio
 from src.services.websocket_manager import WebSocketManager
-from src.services.binance_service import BinanceService
+from src.api.routes import binance_service
+from src.services.account_store import CHANGE_ACCOUNT, CHANGE_ORDERS, CHANGE_POSITIONS
+from src.config.env import EnvConfig
 from src.utils.logger import logger
 from src.utils.metrics import metrics_manager
+from src.utils.wire_format import WireFormat, negotiate, symbol_registry
 
 router = APIRouter()
 ws_manager = WebSocketManager()
-binance_service = BinanceService()
+market_hub = binance_service.market_data
+order_books = binance_service.order_books
+candle_service = binance_service.candles
+indicator_service = binance_service.indicators
 
 class WebSocketConnection:
     def __init__(self, websocket: WebSocket):
         self.websocket = websocket
         self.subscribed_symbols: Set[str] = set()
+        self.subscribed_channels: Set[str] = set()
+        self.subscribed_depth: Set[str] = set()
+        self.subscribed_candles: Set[str] = set()
+        self.subscribed_indicators: Set[str] = set()
 
 @router.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
@@ -28,10 +39,37 @@ async def websocket_endpoint(websocket: WebSocket):
         return
         
     try:
-        await websocket.accept()
-        logger.info("WebSocket 연결 수락됨")
+        # 서브프로토콜(wuya.msgpack 등) 또는 ?format= 으로 전송 포맷 협상 (기본값 JSON)
+        format_error = None
+        try:
+            wire_format, subprotocol = negotiate(
+                websocket.scope.get('subprotocols', []),
+                websocket.query_params.get('format')
+            )
+        except ValueError as e:
+            wire_format, subprotocol = WireFormat.JSON, None
+            format_error = str(e)
+        await websocket.accept(subprotocol=subprotocol)
+        logger.info(f"WebSocket 연결 수락됨 (format: {wire_format.value})")
         connection = WebSocketConnection(websocket)
+        # 연결별 송신 큐/writer 등록 (모든 송신은 이 큐를 통과)
+        ws_manager.register(websocket, wire_format)
+        if format_error:
+            await ws_manager.send_personal_message({
+                'type': 'error',
+                'message': format_error
+            }, websocket)
         metrics_manager.active_connections.inc()
+        try:
+            batch_ms = parse_batch_ms(websocket.query_params.get('batch_ms'))
+            if batch_ms:
+                ws_manager.set_batch_interval(websocket, batch_ms)
+        except ValueError as e:
+            # 잘못된 ?batch_ms 는 연결을 끊지 않고 오류만 알림 (배치 비활성화)
+            await ws_manager.send_personal_message({
+                'type': 'error',
+                'message': f"invalid batch_ms: {e}"
+            }, websocket)
         
         try:
             while True:
@@ -39,43 +77,82 @@ async def websocket_endpoint(websocket: WebSocket):
                     # 클라이언트로부터 메시지 수신
                     data = await websocket.receive_json()
                     logger.info(f"수신된 메시지: {data}")
+                    if not isinstance(data, dict):
+                        raise ValueError("message must be a JSON object")
                     
                     # 메시지 타입에 따른 처리
                     message_type = data.get('type')
                     if message_type == 'subscribe':
-                        symbol = data.get('symbol')
-                        if symbol:
-                            if symbol not in connection.subscribed_symbols:
-                                connection.subscribed_symbols.add(symbol)
-                                asyncio.create_task(
-                                    start_market_updates(connection, symbol)
-                                )
-                                logger.info(f"심볼 구독 시작: {symbol}")
-                                # 구독 성공 응답
-                                await websocket.send_json({
-                                    'type': 'subscribed',
-                                    'symbol': symbol
-                                })
-                            else:
-                                logger.info(f"이미 구독 중인 심볼: {symbol}")
+                        # 단일 심볼(symbol) 또는 여러 심볼(symbols), 계정 채널(channels) 구독
+                        symbols = parse_symbols(data.get('symbols') or ([data['symbol']] if data.get('symbol') else []))
+                        channels = parse_channels(data.get('channels'))
+                        depth_symbols = parse_symbols(data.get('depth'))
+                        # 캔들은 "BTCUSDT@1m" 형식
+                        candle_keys = parse_candles(data.get('candles'))
+                        indicator_symbols = parse_symbols(data.get('indicators'))
+                        # 클라이언트별 최대 수신 빈도 (없으면 전체 속도)
+                        max_hz = parse_max_hz(data.get('max_hz'))
+                        # 재연결 시 마지막으로 받은 시퀀스 (채널별 dict 또는 단일 채널이면 정수)
+                        resume_from = parse_resume_from(
+                            data.get('resume_from'),
+                            [
+                                *symbols, *channels,
+                                *map(depth_channel, depth_symbols), *map(candle_channel, candle_keys),
+                                *map(indicator_channel, indicator_symbols)
+                            ]
+                        )
+                        epoch = data.get('epoch')
+                        for symbol in symbols:
+                            await subscribe_symbol(connection, symbol, max_hz, resume_from.get(symbol), epoch)
+                        for channel in channels:
+                            await subscribe_channel(connection, channel, resume_from.get(channel), epoch)
+                        for symbol in depth_symbols:
+                            await subscribe_depth(
+                                connection, symbol, max_hz, resume_from.get(depth_channel(symbol)), epoch
+                            )
+                        for key in candle_keys:
+                            await subscribe_candles(
+                                connection, key, max_hz, resume_from.get(candle_channel(key)), epoch
+                            )
+                        for symbol in indicator_symbols:
+                            await subscribe_indicators(
+                                connection, symbol, max_hz, resume_from.get(indicator_channel(symbol)), epoch
+                            )
                             
                     elif message_type == 'unsubscribe':
-                        symbol = data.get('symbol')
-                        if symbol in connection.subscribed_symbols:
-                            connection.subscribed_symbols.remove(symbol)
-                            logger.info(f"심볼 구독 취소: {symbol}")
-                            # 구독 취소 성공 응답
-                            await websocket.send_json({
-                                'type': 'unsubscribed',
-                                'symbol': symbol
-                            })
+                        symbols = parse_symbols(data.get('symbols') or ([data['symbol']] if data.get('symbol') else []))
+                        for symbol in symbols:
+                            await unsubscribe_symbol(connection, symbol)
+                        for channel in parse_channels(data.get('channels')):
+                            await unsubscribe_channel(connection, channel)
+                        for symbol in parse_symbols(data.get('depth')):
+                            await unsubscribe_depth(connection, symbol)
+                        for key in parse_candles(data.get('candles')):
+                            await unsubscribe_candles(connection, key)
+                        for symbol in parse_symbols(data.get('indicators')):
+                            await unsubscribe_indicators(connection, symbol)
+
+                    elif message_type == 'batch':
+                        # 여러 심볼 업데이트를 주기별 한 프레임으로 묶어서 수신
+                        batch_ms = parse_batch_ms(data.get('interval_ms'))
+                        ws_manager.set_batch_interval(websocket, batch_ms)
+                        await ws_manager.send_personal_message({
+                            'type': 'batch_configured',
+                            'interval_ms': batch_ms
+                        }, websocket)
                             
                 except json.JSONDecodeError:
                     logger.error("잘못된 JSON 형식")
-                    await websocket.send_json({
+                    await ws_manager.send_personal_message({
                         'type': 'error',
                         'message': 'Invalid JSON format'
-                    })
+                    }, websocket)
+                except (TypeError, ValueError) as e:
+                    logger.error(f"잘못된 구독 옵션: {e}")
+                    await ws_manager.send_personal_message({
+                        'type': 'error',
+                        'message': str(e)
+                    }, websocket)
                     
         except WebSocketDisconnect:
             logger.info(f"WebSocket 연결 종료: {websocket.client}")
@@ -83,10 +160,10 @@ async def websocket_endpoint(websocket: WebSocket):
         except Exception as e:
             logger.error(f"WebSocket 오류: {str(e)}")
             try:
-                await websocket.send_json({
+                await ws_manager.send_personal_message({
                     'type': 'error',
                     'message': str(e)
-                })
+                }, websocket)
             except:
                 pass
             
@@ -98,38 +175,401 @@ async def websocket_endpoint(websocket: WebSocket):
         # 연결 종료 시 정리
         metrics_manager.active_connections.dec()
         for symbol in connection.subscribed_symbols:
-            await ws_manager.disconnect(websocket, symbol)
+            await market_hub.release(symbol)
+        for symbol in connection.subscribed_depth:
+            await order_books.release(symbol)
+        for key in connection.subscribed_candles:
+            await candle_service.release(key.split('@')[0])
+        await ws_manager.unregister(websocket)
         logger.info(f"WebSocket 연결 정리 완료: {websocket.client}")
 
-async def start_market_updates(connection: WebSocketConnection, symbol: str):
-    """실시간 시장 데이터 업데이트"""
-    logger.info(f"시장 데이터 업데이트 시작: {symbol}")
+async def subscribe_symbol(
+    connection: WebSocketConnection,
+    symbol: str,
+    max_hz: Optional[float],
+    resume_from: Optional[int] = None,
+    epoch: Optional[str] = None
+):
+    """심볼 구독 등록 및 누락분 재전송 (없으면 최신 가격 전송)"""
+    websocket = connection.websocket
+    if symbol not in connection.subscribed_symbols:
+        connection.subscribed_symbols.add(symbol)
+        await ws_manager.subscribe(websocket, symbol)
+        ws_manager.set_rate(websocket, symbol, max_hz)
+        logger.info(f"심볼 구독 시작: {symbol} (max_hz: {max_hz}, resume_from: {resume_from})")
+        # 구독 성공 응답
+        await ws_manager.send_personal_message({
+            'type': 'subscribed',
+            'symbol': symbol,
+            'symbol_id': symbol_registry.get_id(symbol),
+            'max_hz': max_hz,
+            'seq': ws_manager.get_channel(symbol).seq,
+            'epoch': ws_manager.epoch
+        }, websocket)
+        # 누락 구간 재전송, 버퍼에 없으면 캐시된 최신 가격 전송
+        await ws_manager.resume(websocket, symbol, resume_from, epoch, lambda: price_snapshot(symbol))
+        await market_hub.acquire(symbol)
+    else:
+        # 이미 구독 중이면 전송 빈도만 변경
+        ws_manager.set_rate(websocket, symbol, max_hz)
+        logger.info(f"이미 구독 중인 심볼: {symbol} (max_hz 변경: {max_hz})")
+        await ws_manager.send_personal_message({
+            'type': 'subscribed',
+            'symbol': symbol,
+            'symbol_id': symbol_registry.get_id(symbol),
+            'max_hz': max_hz,
+            'seq': ws_manager.get_channel(symbol).seq,
+            'epoch': ws_manager.epoch
+        }, websocket)
+
+async def unsubscribe_symbol(connection: WebSocketConnection, symbol: str):
+    """심볼 구독 취소"""
+    if symbol not in connection.subscribed_symbols:
+        return
+    connection.subscribed_symbols.remove(symbol)
+    await ws_manager.disconnect(connection.websocket, symbol)
+    await market_hub.release(symbol)
+    logger.info(f"심볼 구독 취소: {symbol}")
+    # 구독 취소 성공 응답
+    await ws_manager.send_personal_message({
+        'type': 'unsubscribed',
+        'symbol': symbol
+    }, connection.websocket)
+
+async def subscribe_channel(
+    connection: WebSocketConnection,
+    channel: str,
+    resume_from: Optional[int] = None,
+    epoch: Optional[str] = None
+):
+    """계정 채널 구독 및 누락분 재전송 (없으면 스냅샷)"""
+    websocket = connection.websocket
+    if channel in connection.subscribed_channels:
+        return
+    connection.subscribed_channels.add(channel)
+    await ws_manager.subscribe(websocket, channel)
+    await ws_manager.send_personal_message({
+        'type': 'subscribed',
+        'channel': channel,
+        'seq': ws_manager.get_channel(channel).seq,
+        'epoch': ws_manager.epoch
+    }, websocket)
+    mode = await ws_manager.resume(
+        websocket, channel, resume_from, epoch, ACCOUNT_CHANNELS[channel]
+    )
+    logger.info(f"채널 구독 시작: {channel} (resume_from: {resume_from}, {mode})")
+
+async def unsubscribe_channel(connection: WebSocketConnection, channel: str):
+    """계정 채널 구독 취소"""
+    if channel not in connection.subscribed_channels:
+        return
+    connection.subscribed_channels.remove(channel)
+    await ws_manager.disconnect(connection.websocket, channel)
+    await ws_manager.send_personal_message({
+        'type': 'unsubscribed',
+        'channel': channel
+    }, connection.websocket)
+
+def depth_channel(symbol: str) -> str:
+    return f"depth:{symbol}"
+
+async def subscribe_depth(
+    connection: WebSocketConnection,
+    symbol: str,
+    max_hz: Optional[float],
+    resume_from: Optional[int] = None,
+    epoch: Optional[str] = None
+):
+    """호가창 구독 (심볼당 업스트림 호가창 1개를 모든 구독자가 공유)"""
+    websocket = connection.websocket
+    channel = depth_channel(symbol)
+    ws_manager.set_rate(websocket, channel, max_hz)
+    if symbol in connection.subscribed_depth:
+        return
+    connection.subscribed_depth.add(symbol)
+    await ws_manager.subscribe(websocket, channel)
+    await ws_manager.send_personal_message({
+        'type': 'subscribed',
+        'channel': channel,
+        'max_hz': max_hz,
+        'seq': ws_manager.get_channel(channel).seq,
+        'epoch': ws_manager.epoch
+    }, websocket)
+    await ws_manager.resume(websocket, channel, resume_from, epoch, lambda: depth_snapshot(symbol))
+    await order_books.acquire(symbol)
+    logger.info(f"호가창 구독 시작: {symbol} (max_hz: {max_hz})")
+
+async def unsubscribe_depth(connection: WebSocketConnection, symbol: str):
+    """호가창 구독 취소"""
+    if symbol not in connection.subscribed_depth:
+        return
+    connection.subscribed_depth.remove(symbol)
+    await ws_manager.disconnect(connection.websocket, depth_channel(symbol))
+    await order_books.release(symbol)
+    await ws_manager.send_personal_message({
+        'type': 'unsubscribed',
+        'channel': depth_channel(symbol)
+    }, connection.websocket)
+
+async def depth_snapshot(symbol: str) -> Optional[dict]:
+    book = order_books.get_book(symbol)
+    return build_depth_message(book) if book else None
+
+def candle_channel(key: str) -> str:
+    return f"candle:{key}"
+
+async def subscribe_candles(
+    connection: WebSocketConnection,
+    key: str,
+    max_hz: Optional[float],
+    resume_from: Optional[int] = None,
+    epoch: Optional[str] = None
+):
+    """캔들 구독 (진행 중 캔들은 병합 전송, 마감 캔들은 항상 전송)"""
+    websocket = connection.websocket
+    channel = candle_channel(key)
+    ws_manager.set_rate(websocket, channel, max_hz)
+    if key in connection.subscribed_candles:
+        return
+    connection.subscribed_candles.add(key)
+    await ws_manager.subscribe(websocket, channel)
+    await ws_manager.send_personal_message({
+        'type': 'subscribed',
+        'channel': channel,
+        'max_hz': max_hz,
+        'seq': ws_manager.get_channel(channel).seq,
+        'epoch': ws_manager.epoch
+    }, websocket)
+    await ws_manager.resume(websocket, channel, resume_from, epoch, lambda: candle_snapshot(key))
+    await candle_service.acquire(key.split('@')[0])
+    logger.info(f"캔들 구독 시작: {key} (max_hz: {max_hz})")
+
+async def unsubscribe_candles(connection: WebSocketConnection, key: str):
+    """캔들 구독 취소"""
+    if key not in connection.subscribed_candles:
+        return
+    connection.subscribed_candles.remove(key)
+    await ws_manager.disconnect(connection.websocket, candle_channel(key))
+    await candle_service.release(key.split('@')[0])
+    await ws_manager.send_personal_message({
+        'type': 'unsubscribed',
+        'channel': candle_channel(key)
+    }, connection.websocket)
+
+async def candle_snapshot(key: str) -> Optional[dict]:
+    symbol, interval = key.split('@')
+    series = candle_service.get_series(symbol, interval)
+    if series is None or len(series) == 0:
+        return None
+    return {'type': 'candle', 'data': {**series.candle(), 'closed': False}}
+
+def parse_candles(value) -> List[str]:
+    """캔들 구독 키 파싱 ("BTCUSDT@1m", 지원하지 않는 주기는 ValueError)"""
+    if value is not None and not isinstance(value, list):
+        raise ValueError(f"candles must be a list: {value}")
+    keys = []
+    for key in value or []:
+        if not isinstance(key, str):
+            raise ValueError(f"invalid candle subscription: {key}")
+        symbol, _, interval = key.partition('@')
+        if not symbol or interval not in candle_service.intervals:
+            raise ValueError(f"invalid candle subscription: {key}")
+        keys.append(f"{normalize_symbol(symbol)}@{interval}")
+    return keys
+
+def indicator_channel(symbol: str) -> str:
+    return f"indicators:{symbol}"
+
+async def subscribe_indicators(
+    connection: WebSocketConnection,
+    symbol: str,
+    max_hz: Optional[float],
+    resume_from: Optional[int] = None,
+    epoch: Optional[str] = None
+):
+    """설정된 지표 값 구독"""
+    websocket = connection.websocket
+    channel = indicator_channel(symbol)
+    ws_manager.set_rate(websocket, channel, max_hz)
+    if symbol in connection.subscribed_indicators:
+        return
+    connection.subscribed_indicators.add(symbol)
+    await ws_manager.subscribe(websocket, channel)
+    await ws_manager.send_personal_message({
+        'type': 'subscribed',
+        'channel': channel,
+        'max_hz': max_hz,
+        'seq': ws_manager.get_channel(channel).seq,
+        'epoch': ws_manager.epoch
+    }, websocket)
+    await ws_manager.resume(websocket, channel, resume_from, epoch, lambda: indicator_snapshot(symbol))
+    logger.info(f"지표 구독 시작: {symbol} (max_hz: {max_hz})")
+
+async def unsubscribe_indicators(connection: WebSocketConnection, symbol: str):
+    """지표 구독 취소"""
+    if symbol not in connection.subscribed_indicators:
+        return
+    connection.subscribed_indicators.remove(symbol)
+    await ws_manager.disconnect(connection.websocket, indicator_channel(symbol))
+    await ws_manager.send_personal_message({
+        'type': 'unsubscribed',
+        'channel': indicator_channel(symbol)
+    }, connection.websocket)
+
+async def indicator_snapshot(symbol: str) -> Optional[dict]:
+    if symbol not in indicator_service.config:
+        return None
+    return build_indicator_message(symbol, indicator_service.get_values(symbol))
+
+async def price_snapshot(symbol: str) -> Optional[dict]:
+    latest = market_hub.get_mark_price(symbol)
+    return build_price_message(latest) if latest else None
+
+async def positions_snapshot() -> Optional[dict]:
     try:
-        while symbol in connection.subscribed_symbols:
-            try:
-                # 현재가 조회
-                price = await binance_service.get_mark_price(symbol)
-                
-                # 클라이언트로 데이터 전송
-                await connection.websocket.send_json({
-                    'type': 'price',
-                    'data': {
-                        'symbol': symbol,
-                        'price': str(price),
-                        'timestamp': str(asyncio.get_event_loop().time())
-                    }
-                })
-                
-                # 1초 대기
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"가격 업데이트 오류 ({symbol}): {str(e)}")
-                await asyncio.sleep(5)  # 오류 발생 시 더 긴 대기
-            
+        return {'type': 'positions', 'data': await binance_service.get_all_positions()}
     except Exception as e:
-        logger.error(f"시장 데이터 업데이트 오류 ({symbol}): {str(e)}")
-    finally:
-        if symbol in connection.subscribed_symbols:
-            connection.subscribed_symbols.remove(symbol)
-        logger.info(f"시장 데이터 업데이트 종료: {symbol}")
\ No newline at end of file
+        logger.error(f"포지션 스냅샷 조회 실패: {e}")
+        return None
+
+async def account_snapshot() -> Optional[dict]:
+    try:
+        return {'type': 'account', 'data': await binance_service.get_account_info()}
+    except Exception as e:
+        logger.error(f"계정 스냅샷 조회 실패: {e}")
+        return None
+
+async def orders_snapshot() -> Optional[dict]:
+    try:
+        return {'type': 'orders', 'data': await binance_service.get_open_orders()}
+    except Exception as e:
+        logger.error(f"미체결 주문 스냅샷 조회 실패: {e}")
+        return None
+
+# 계정 채널별 스냅샷 조회 함수
+ACCOUNT_CHANNELS = {
+    CHANGE_POSITIONS: positions_snapshot,
+    CHANGE_ACCOUNT: account_snapshot,
+    CHANGE_ORDERS: orders_snapshot
+}
+
+def parse_channels(value) -> List[str]:
+    """subscribe 메시지의 계정 채널 파싱 (알 수 없는 채널은 ValueError)"""
+    channels = value or []
+    if not isinstance(channels, list):
+        raise ValueError(f"channels must be a list: {value}")
+    for channel in channels:
+        if not isinstance(channel, str) or channel not in ACCOUNT_CHANNELS:
+            raise ValueError(f"unknown channel: {channel}")
+    return channels
+
+def normalize_symbol(symbol) -> str:
+    """심볼 대문자 정규화 (거래소 정보에 없는 심볼은 ValueError)"""
+    if not isinstance(symbol, str):
+        raise ValueError(f"invalid symbol: {symbol}")
+    symbol = symbol.upper()
+    if binance_service.exchange_info.get_symbol(symbol) is None:
+        raise ValueError(f"unknown symbol: {symbol}")
+    return symbol
+
+def parse_symbols(value) -> List[str]:
+    """구독 메시지의 심볼 목록 파싱 (목록이 아니면 ValueError)"""
+    symbols = value or []
+    if not isinstance(symbols, list):
+        raise ValueError(f"symbols must be a list: {value}")
+    return [normalize_symbol(symbol) for symbol in symbols]
+
+def parse_resume_from(value, targets: List[str]) -> Dict[str, int]:
+    """resume_from 파싱 (정수는 단일 채널 구독일 때만 허용)"""
+    if value is None:
+        return {}
+    if isinstance(value, dict):
+        return {channel: parse_seq(seq) for channel, seq in value.items()}
+    if len(targets) != 1:
+        raise ValueError("resume_from must be an object keyed by channel when subscribing to multiple channels")
+    return {targets[0]: parse_seq(value)}
+
+def parse_seq(value) -> int:
+    """resume_from 시퀀스 파싱 (정수가 아니면 ValueError)"""
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"invalid resume_from sequence: {value}")
+    return int(value)
+
+def parse_batch_ms(value) -> Optional[int]:
+    """배치 전송 주기 파싱 (0/None이면 배치 비활성화, 잘못된 값은 ValueError)"""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"invalid batch interval: {value}")
+    try:
+        batch_ms = int(value)
+    except OverflowError:
+        raise ValueError(f"invalid batch interval: {value}")
+    if batch_ms < 0:
+        raise ValueError(f"batch interval must not be negative: {value}")
+    return min(batch_ms, EnvConfig.WS_MAX_BATCH_MS) or None
+
+def parse_max_hz(value) -> Optional[float]:
+    """subscribe 메시지의 max_hz 파싱 (잘못된 값은 ValueError)"""
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        raise ValueError(f"max_hz must be a positive finite number: {value}")
+    max_hz = float(value)
+    if not math.isfinite(max_hz) or max_hz <= 0:
+        raise ValueError(f"max_hz must be a positive finite number: {value}")
+    return min(max_hz, EnvConfig.WS_MAX_HZ)
+
+def build_price_message(update: dict) -> dict:
+    """마크 가격 업데이트를 클라이언트 메시지로 변환"""
+    return {
+        'type': 'price',
+        'data': {
+            'symbol': update['symbol'],
+            'price': update['price'],
+            'timestamp': str(update['timestamp'])
+        }
+    }
+
+async def broadcast_mark_price(update: dict):
+    """허브의 마크 가격 업데이트를 구독 클라이언트에 팬아웃"""
+    ws_manager.publish(update['symbol'], build_price_message(update))
+
+def build_depth_message(book) -> dict:
+    """로컬 호가창의 상위 호가를 클라이언트 메시지로 변환"""
+    return {
+        'type': 'depth',
+        'data': book.top(EnvConfig.ORDER_BOOK_PUBLISH_DEPTH)
+    }
+
+def publish_order_book(book):
+    """호가창 갱신을 구독 클라이언트에 팬아웃"""
+    ws_manager.publish(depth_channel(book.symbol), build_depth_message(book))
+
+def publish_candle(series, candle: dict, closed: bool):
+    """캔들 갱신을 구독 클라이언트에 팬아웃 (마감 캔들은 병합되지 않도록 전송, 구독자가 없어도 재연결 재전송용으로 버퍼링)"""
+    channel = candle_channel(f"{series.symbol}@{series.interval}")
+    ws_manager.publish(channel, {'type': 'candle', 'data': {**candle, 'closed': closed}}, conflate=not closed)
+
+def build_indicator_message(symbol: str, values: list) -> dict:
+    return {'type': 'indicators', 'data': {'symbol': symbol, 'values': values}}
+
+def publish_indicators(symbol: str, values: list):
+    """지표 갱신을 구독 클라이언트에 팬아웃 (구독자가 없어도 재연결 재전송용으로 버퍼링)"""
+    ws_manager.publish(indicator_channel(symbol), build_indicator_message(symbol, values))
+
+def publish_account_state(change: str):
+    """계정 상태 변경을 계정 채널에 발행 (구독자가 없어도 재연결 재전송용으로 버퍼링)"""
+    store = binance_service.account_store
+    if change == CHANGE_POSITIONS:
+        ws_manager.publish(change, {'type': 'positions', 'data': store.get_positions()})
+    elif change == CHANGE_ACCOUNT:
+        ws_manager.publish(change, {'type': 'account', 'data': store.get_account()})
+    elif change == CHANGE_ORDERS:
+        ws_manager.publish(change, {'type': 'orders', 'data': store.get_open_orders()})
+
+market_hub.add_listener(broadcast_mark_price)
+order_books.add_listener(publish_order_book)
+candle_service.add_listener(publish_candle)
+indicator_service.add_listener(publish_indicators)
+binance_service.account_store.add_listener(publish_account_state)
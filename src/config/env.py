@@ -23,6 +23,29 @@ class EnvConfig:
     BINANCE_API_KEY = os.getenv('BINANCE_API_KEY')
     BINANCE_API_SECRET = os.getenv('BINANCE_API_SECRET')
     USE_TESTNET = os.getenv('USE_TESTNET', 'False').lower() == 'true'
+    BINANCE_MAX_CONCURRENCY = int(os.getenv('BINANCE_MAX_CONCURRENCY', '10'))
+    BINANCE_REQUEST_TIMEOUT = float(os.getenv('BINANCE_REQUEST_TIMEOUT', '10'))
+    EXCHANGE_INFO_TTL = float(os.getenv('EXCHANGE_INFO_TTL', '300'))
+    BINANCE_READ_WEIGHT_RATIO = float(os.getenv('BINANCE_READ_WEIGHT_RATIO', '0.8'))
+    BINANCE_MAX_READ_QUEUE = int(os.getenv('BINANCE_MAX_READ_QUEUE', '50'))
+    USER_STREAM_ENABLED = os.getenv('USER_STREAM_ENABLED', 'True').lower() == 'true'
+    USER_STREAM_KEEPALIVE_INTERVAL = float(os.getenv('USER_STREAM_KEEPALIVE_INTERVAL', '1800'))
+    USER_STREAM_RESYNC_INTERVAL = float(os.getenv('USER_STREAM_RESYNC_INTERVAL', '900'))
+    MARK_PRICE_ALL_MARKET_THRESHOLD = int(os.getenv('MARK_PRICE_ALL_MARKET_THRESHOLD', '50'))
+    ORDER_BOOK_SNAPSHOT_LIMIT = int(os.getenv('ORDER_BOOK_SNAPSHOT_LIMIT', '1000'))
+    ORDER_BOOK_PUBLISH_DEPTH = int(os.getenv('ORDER_BOOK_PUBLISH_DEPTH', '20'))
+    CANDLE_INTERVALS = os.getenv('CANDLE_INTERVALS', '1s,1m,5m,1h').split(',')
+    CANDLE_HISTORY_SIZE = int(os.getenv('CANDLE_HISTORY_SIZE', '1000'))
+    INDICATOR_TICK_MS = int(os.getenv('INDICATOR_TICK_MS', '250'))
+    
+    # WebSocket 송신 설정
+    WS_SEND_QUEUE_SIZE = int(os.getenv('WS_SEND_QUEUE_SIZE', '256'))
+    WS_OVERFLOW_POLICY = os.getenv('WS_OVERFLOW_POLICY', 'conflate')  # drop_oldest, conflate, disconnect
+    WS_MAX_HZ = float(os.getenv('WS_MAX_HZ', '10'))
+    WS_MAX_BATCH_MS = int(os.getenv('WS_MAX_BATCH_MS', '1000'))
+    WS_PER_MESSAGE_DEFLATE = os.getenv('WS_PER_MESSAGE_DEFLATE', 'True').lower() == 'true'
+    WS_REPLAY_BUFFER_SIZE = int(os.getenv('WS_REPLAY_BUFFER_SIZE', '1024'))
+    WS_REPLAY_IDLE_TTL = float(os.getenv('WS_REPLAY_IDLE_TTL', '300'))
     
     # 데이터베이스 설정
     DB_URL = os.getenv('DB_URL', 'sqlite:///./trading.db')
@@ -36,17 +59,25 @@ class EnvConfig:
     
     # 웹훅 설정
     WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET', 'your-webhook-secret')
+    WEBHOOK_TIMESTAMP_TOLERANCE = int(os.getenv('WEBHOOK_TIMESTAMP_TOLERANCE', '300'))
+    WEBHOOK_REPLAY_CACHE_SIZE = int(os.getenv('WEBHOOK_REPLAY_CACHE_SIZE', '10000'))
+    WEBHOOK_QUEUE_SIZE = int(os.getenv('WEBHOOK_QUEUE_SIZE', '1000'))
+    WEBHOOK_WORKERS = int(os.getenv('WEBHOOK_WORKERS', '4'))
+    WEBHOOK_MAX_RETRIES = int(os.getenv('WEBHOOK_MAX_RETRIES', '3'))
     
     # 텔레그램 설정
     TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
     TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
     TELEGRAM_CHAT_IDS = os.getenv('TELEGRAM_CHAT_IDS', '').split(',') if os.getenv('TELEGRAM_CHAT_IDS') else []
+    NOTIFICATION_OUTBOX_SIZE = int(os.getenv('NOTIFICATION_OUTBOX_SIZE', '1000'))
     
     # 거래 설정
     DEFAULT_LEVERAGE = int(os.getenv('DEFAULT_LEVERAGE', '10'))
     MAX_POSITION_SIZE = float(os.getenv('MAX_POSITION_SIZE', '1000'))
     STOP_LOSS_PERCENT = float(os.getenv('STOP_LOSS_PERCENT', '2.0'))
     TAKE_PROFIT_PERCENT = float(os.getenv('TAKE_PROFIT_PERCENT', '4.0'))
+    RISK_LIQUIDATION_ALERT_PERCENT = float(os.getenv('RISK_LIQUIDATION_ALERT_PERCENT', '5.0'))
+    RISK_MARGIN_RATIO_ALERT = float(os.getenv('RISK_MARGIN_RATIO_ALERT', '0.8'))
     
     @classmethod
     def validate(cls):
@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 from contextlib import asynccontextmanager
+from functools import partial
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -8,9 +9,9 @@ from fastapi.middleware.cors import CORSMiddleware
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
-from src.api.routes import router as api_router
-from src.api.websocket import router as ws_router
-from src.api.webhooks import router as webhook_router
+from src.api.routes import router as api_router, binance_service, settings_service, risk_engine
+from src.api.websocket import router as ws_router, ws_manager as websocket_manager
+from src.api.webhooks import router as webhook_router, webhook_queue, process_webhook_events
 from src.config.env import EnvConfig
 from src.services.settings_service import SettingsService
 from src.services.binance_service import BinanceService
@@ -20,12 +21,9 @@ from src.services.notification_service import NotificationService
 from src.utils.logger import logger
 from src.utils.metrics import metrics_manager
 
-# 서비스 초기화
-settings_service = SettingsService()
-binance_service = BinanceService()
-trading_service = TradingService(settings_service, binance_service)
-websocket_manager = WebSocketManager()
+# 서비스 초기화 (바이낸스/설정 서비스는 라우터와 같은 인스턴스를 공유)
 notification_service = NotificationService()
+trading_service = TradingService(binance_service, settings_service, notification_service, risk_engine)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -34,8 +32,30 @@ async def lifespan(app: FastAPI):
         # Startup
         logger.info("서버 시작 중...")
         await settings_service._load_settings()
+        # 유저 데이터 스트림의 체결 누락 대조 결과를 거래 서비스 포지션에 반영
+        binance_service.user_stream.add_reconcile_listener(trading_service.apply_position)
         await binance_service.initialize()
+        # 설정에 선언된 지표 계산 시작 (설정 변경 시 재구성)
+        trading_settings = await settings_service.get_trading_settings()
+        try:
+            await binance_service.indicators.configure(trading_settings.indicators)
+        except ValueError as e:
+            # 저장된 설정이 현재 CANDLE_INTERVALS와 맞지 않아도 서버는 시작
+            logger.error(f"지표 설정 적용 실패: {e}")
+        settings_service.add_listener(
+            lambda settings: binance_service.indicators.configure(settings.indicators)
+        )
+        # 허용 심볼 마크 가격 구독 (사전 리스크 검사는 REST 없이 캐시된 마크 가격만 사용)
+        await binance_service.watch_mark_prices(trading_settings.allowed_symbols)
+        settings_service.add_listener(
+            lambda settings: binance_service.watch_mark_prices(settings.allowed_symbols)
+        )
+        # 포트폴리오 리스크 모니터 시작 (포지션 심볼 마크 가격 구독)
+        await trading_service.risk_monitor.start()
+        # 웹훅 이벤트 처리 워커 시작
+        await webhook_queue.start(partial(process_webhook_events, trading_service))
         await notification_service.initialize()
+        await notification_service.start()
         await notification_service.send_message("🚀 트레이딩 서버가 시작되었습니다.")
         logger.info("서버 초기화 완료")
         yield
@@ -43,6 +63,8 @@ async def lifespan(app: FastAPI):
         # Shutdown
         logger.info("서버 종료 중...")
         await notification_service.send_message("🔴 트레이딩 서버가 종료되었습니다.")
+        await webhook_queue.stop()
+        await trading_service.stop()
         await binance_service.cleanup()
         await notification_service.cleanup()
         await settings_service._save_settings()
@@ -143,5 +165,6 @@ if __name__ == "__main__":
         host=EnvConfig.SERVER_HOST,
         port=EnvConfig.SERVER_PORT,
         reload=EnvConfig.DEBUG,
-        log_level="info"
+        log_level="info",
+        ws_per_message_deflate=EnvConfig.WS_PER_MESSAGE_DEFLATE
     )
\ No newline at end of file
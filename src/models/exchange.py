@@ -0,0 +1,49 @@
+from pydantic import BaseModel
+from typing import Optional
+from decimal import Decimal
+
+class SymbolFilters(BaseModel):
+    symbol: str
+    status: str
+    tick_size: Decimal
+    step_size: Decimal
+    min_price: Decimal = Decimal('0')
+    max_price: Decimal = Decimal('0')
+    min_qty: Decimal = Decimal('0')
+    max_qty: Decimal = Decimal('0')
+    min_notional: Decimal = Decimal('0')
+    # 시장가 주문 수량 규칙 (MARKET_LOT_SIZE, 0이면 LOT_SIZE 사용)
+    market_step_size: Decimal = Decimal('0')
+    market_min_qty: Decimal = Decimal('0')
+    market_max_qty: Decimal = Decimal('0')
+    price_precision: Optional[int] = None
+    quantity_precision: Optional[int] = None
+
+    @property
+    def is_trading(self) -> bool:
+        return self.status == 'TRADING'
+
+    @classmethod
+    def from_binance(cls, data: dict) -> 'SymbolFilters':
+        filters = {f['filterType']: f for f in data.get('filters', [])}
+        price_filter = filters.get('PRICE_FILTER', {})
+        lot_size = filters.get('LOT_SIZE', {})
+        min_notional = filters.get('MIN_NOTIONAL', {})
+        market_lot_size = filters.get('MARKET_LOT_SIZE', {})
+        return cls(
+            symbol=data['symbol'],
+            status=data.get('status', 'UNKNOWN'),
+            tick_size=Decimal(str(price_filter.get('tickSize', '0'))),
+            step_size=Decimal(str(lot_size.get('stepSize', '0'))),
+            min_price=Decimal(str(price_filter.get('minPrice', '0'))),
+            max_price=Decimal(str(price_filter.get('maxPrice', '0'))),
+            min_qty=Decimal(str(lot_size.get('minQty', '0'))),
+            max_qty=Decimal(str(lot_size.get('maxQty', '0'))),
+            # 선물은 'notional', 현물은 'minNotional' 키 사용
+            min_notional=Decimal(str(min_notional.get('notional', min_notional.get('minNotional', '0')))),
+            market_step_size=Decimal(str(market_lot_size.get('stepSize', '0'))),
+            market_min_qty=Decimal(str(market_lot_size.get('minQty', '0'))),
+            market_max_qty=Decimal(str(market_lot_size.get('maxQty', '0'))),
+            price_precision=data.get('pricePrecision'),
+            quantity_precision=data.get('quantityPrecision')
+        )
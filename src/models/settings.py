@@ -1,5 +1,12 @@
-from pydantic import BaseModel
-from typing import Dict, Any
+from pydantic import BaseModel, Field
+from typing import Dict, Any, List, Literal
+
+IndicatorType = Literal['ema', 'rsi', 'atr', 'vwap']
+
+class IndicatorConfig(BaseModel):
+    type: IndicatorType
+    period: int = Field(default=14, ge=1)
+    interval: str = "1m"
 
 class TradingSettings(BaseModel):
     default_leverage: int = 10
@@ -7,6 +14,12 @@ class TradingSettings(BaseModel):
     risk_limit: float = 0.1
     max_positions: int = 5
     allowed_symbols: list[str] = ["BTCUSDT", "ETHUSDT"]
+    # 사전 리스크 한도 (risk_limit: 계정 증거금 잔고 대비 사용 가능한 최대 증거금 비율)
+    max_leverage: int = Field(default=20, ge=1, le=125)
+    max_position_notional: Dict[str, float] = {}  # 심볼별 최대 포지션 명목가 (USDT, 없으면 MAX_POSITION_SIZE)
+    max_orders_per_minute: int = Field(default=60, ge=1)
+    # 심볼별 서버 계산 지표
+    indicators: Dict[str, List[IndicatorConfig]] = {}
 
 class APISettings(BaseModel):
     testnet: bool = True
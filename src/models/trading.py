@@ -5,15 +5,21 @@ from datetime import datetime
 
 OrderSide = Literal['BUY', 'SELL']
 PositionSide = Literal['LONG', 'SHORT']
-OrderStatus = Literal['NEW', 'FILLED', 'CANCELED', 'REJECTED']
+OrderType = Literal['MARKET', 'LIMIT']
+TriggerMode = Literal['price', 'percent']
+OrderStatus = Literal['NEW', 'PARTIALLY_FILLED', 'FILLED', 'CANCELED', 'REJECTED', 'EXPIRED']
 
 class OrderRequest(BaseModel):
     symbol: str
     side: OrderSide
     quantity: Decimal
     leverage: int = Field(ge=1, le=125)
+    type: OrderType = 'MARKET'
+    price: Optional[Decimal] = None
     stop_loss: Optional[Decimal] = None
     take_profit: Optional[Decimal] = None
+    # stop_loss/take_profit 해석 방식 (price: 트리거 가격, percent: 진입가 대비 %)
+    trigger_mode: TriggerMode = 'price'
 
 class Order(BaseModel):
     id: str
@@ -60,6 +66,6 @@ class Position(BaseModel):
             entry_price=Decimal(str(data['entryPrice'])),
             leverage=int(data['leverage']),
             margin=Decimal(str(data['isolatedMargin'])),
-            liquidation_price=Decimal(str(data['liquidationPrice'])) if data['liquidationPrice'] != '0' else None,
+            liquidation_price=Decimal(str(data['liquidationPrice'])) if float(data['liquidationPrice']) != 0 else None,
             unrealized_pnl=Decimal(str(data['unrealizedProfit']))
         )
\ No newline at end of file
@@ -0,0 +1,330 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from src.config.env import EnvConfig
+from src.utils.logger import LoggerMixin
+from src.utils.metrics import metrics_manager
+
+# 주문이 더 이상 대기 상태가 아닌 경우
+CLOSED_ORDER_STATUSES = {'FILLED', 'CANCELED', 'EXPIRED', 'REJECTED', 'EXPIRED_IN_MATCH'}
+
+# 누적 체결 수량 비교 허용 오차
+FILL_TOLERANCE = 1e-9
+# 중복 종료 이벤트 판별용으로 기억할 최근 종료 주문 수
+CLOSED_ORDER_MEMORY = 1000
+
+# 변경 알림 종류
+CHANGE_ACCOUNT = 'account'
+CHANGE_POSITIONS = 'positions'
+CHANGE_ORDERS = 'orders'
+
+class AccountStore(LoggerMixin):
+    """유저 데이터 스트림으로 유지되는 계정/포지션/미체결 주문 상태"""
+
+    def __init__(self):
+        self.account: Dict[str, float] = {}
+        self.balances: Dict[str, dict] = {}
+        self.positions: Dict[Tuple[str, str], dict] = {}
+        self.open_orders: Dict[int, dict] = {}
+        self.is_synced = False
+        self.synced_at = 0.0
+        self.last_event_time = 0
+        # 이벤트 시각 순서 보장용 마지막 반영 시각 (포지션/자산/주문별)
+        self._position_times: Dict[Tuple[str, str], int] = {}
+        self._balance_times: Dict[str, int] = {}
+        self._order_times: Dict[int, int] = {}
+        # 주문별 누적 체결 수량 (체결 이벤트 누락 감지용)
+        self._filled: Dict[int, float] = {}
+        # 최근 종료된 주문 (중복 종료 이벤트 무시용)
+        self._closed_orders: OrderedDict = OrderedDict()
+        # 체결 누락이 감지됐지만 아직 REST 대조가 끝나지 않은 심볼 (재시도 시에도 다시 반환)
+        self._unreconciled: Set[str] = set()
+        self._listeners: List[Callable[[str], None]] = []
+        self._order_listeners: List[Callable[[dict], None]] = []
+
+    def add_order_listener(self, listener: Callable[[dict], None]):
+        """주문 이벤트 리스너 등록 (ORDER_TRADE_UPDATE의 'o' 항목을 인자로 호출)"""
+        self._order_listeners.append(listener)
+
+    def add_listener(self, listener: Callable[[str], None]):
+        """상태 변경 리스너 등록 (변경 종류를 인자로 호출)"""
+        self._listeners.append(listener)
+
+    def _notify(self, *changes: str):
+        for change in changes:
+            for listener in self._listeners:
+                try:
+                    listener(change)
+                except Exception as e:
+                    self.logger.error(f"계정 상태 리스너 실패 ({change}): {e}")
+
+    def load_snapshot(self, account: dict, positions: List[dict], open_orders: List[dict]):
+        """REST 스냅샷으로 상태 초기화"""
+        self.account = {
+            "totalWalletBalance": float(account["totalWalletBalance"]),
+            "totalUnrealizedProfit": float(account["totalUnrealizedProfit"]),
+            "totalMarginBalance": float(account["totalMarginBalance"]),
+            "availableBalance": float(account["availableBalance"]),
+            "maxWithdrawAmount": float(account["maxWithdrawAmount"])
+        }
+        self.balances = {
+            asset["asset"]: {
+                "walletBalance": float(asset.get("walletBalance", 0)),
+                "crossWalletBalance": float(asset.get("crossWalletBalance", 0))
+            }
+            for asset in account.get("assets", [])
+        }
+        self.positions = {
+            (pos["symbol"], pos.get("positionSide", "BOTH")): pos
+            for pos in positions
+        }
+        self.open_orders = {
+            int(order["orderId"]): order
+            for order in open_orders
+        }
+        self._filled = {
+            order_id: float(order.get("executedQty") or 0)
+            for order_id, order in self.open_orders.items()
+        }
+        # 종료된 주문의 시각 기록 정리
+        self._order_times = {
+            order_id: event_time for order_id, event_time in self._order_times.items()
+            if order_id in self.open_orders
+        }
+        self._unreconciled.clear()
+        self.is_synced = True
+        self.synced_at = time.time()
+        self.logger.info(
+            f"계정 스냅샷 로드 완료: 포지션 {len(self.positions)}개, 미체결 주문 {len(self.open_orders)}개"
+        )
+        self._notify(CHANGE_ACCOUNT, CHANGE_POSITIONS, CHANGE_ORDERS)
+
+    def invalidate(self):
+        """스트림 단절 시 상태 무효화 (재동기화 전까지 REST 사용)"""
+        self.is_synced = False
+
+    def apply_event(self, event: dict, leverage_lookup=None) -> List[str]:
+        """유저 데이터 스트림/웹훅 이벤트 반영 (REST 대조가 필요한 심볼 반환)"""
+        event_type = event.get('e')
+        self.last_event_time = max(self.last_event_time, int(event.get('E', 0)))
+
+        if event_type == 'ACCOUNT_UPDATE':
+            if self.apply_account_update(event, leverage_lookup):
+                self._notify(CHANGE_ACCOUNT, CHANGE_POSITIONS)
+        elif event_type == 'ORDER_TRADE_UPDATE':
+            applied, gap = self.apply_order_update(event)
+            if applied:
+                self._notify(CHANGE_ORDERS)
+            symbol = event['o']['s']
+            if gap:
+                self._unreconciled.add(symbol)
+            if symbol in self._unreconciled:
+                return [symbol]
+        elif event_type == 'ACCOUNT_CONFIG_UPDATE':
+            config = event.get('ac', {})
+            if config.get('s') and config.get('l') is not None:
+                self.apply_leverage(config['s'], int(config['l']))
+                self._notify(CHANGE_POSITIONS)
+        return []
+
+    @staticmethod
+    def _is_stale(times: dict, key, event_time: int) -> bool:
+        """이미 더 최근 이벤트가 반영된 항목이면 True (아니면 시각 기록)"""
+        if event_time < times.get(key, 0):
+            return True
+        times[key] = event_time
+        return False
+
+    def apply_account_update(self, event: dict, leverage_lookup=None) -> bool:
+        """ACCOUNT_UPDATE 이벤트의 잔고/포지션 반영 (더 오래된 항목은 버림, 반영한 항목이 있으면 True)"""
+        data = event.get('a', {})
+        event_time = int(event.get('E', 0))
+        applied = False
+
+        for balance in data.get('B', []):
+            asset = balance['a']
+            if self._is_stale(self._balance_times, asset, event_time):
+                metrics_manager.account_events_stale.labels(event='balance').inc()
+                continue
+            applied = True
+            wallet_balance = float(balance['wb'])
+            previous = self.balances.get(asset, {}).get("walletBalance", wallet_balance)
+            self.balances[asset] = {
+                "walletBalance": wallet_balance,
+                "crossWalletBalance": float(balance.get('cw', wallet_balance))
+            }
+            if asset == "USDT" and self.account:
+                # 지갑 잔고 변동분을 계정 합계에 반영
+                delta = wallet_balance - previous
+                self.account["totalWalletBalance"] = wallet_balance
+                self.account["availableBalance"] += delta
+                self.account["maxWithdrawAmount"] += delta
+
+        for pos in data.get('P', []):
+            key = (pos['s'], pos.get('ps', 'BOTH'))
+            if self._is_stale(self._position_times, key, event_time):
+                metrics_manager.account_events_stale.labels(event='position').inc()
+                continue
+            applied = True
+            self._apply_position(pos, leverage_lookup)
+
+        if applied and self.account:
+            unrealized = sum(p["unrealizedProfit"] for p in self.positions.values())
+            self.account["totalUnrealizedProfit"] = unrealized
+            self.account["totalMarginBalance"] = self.account["totalWalletBalance"] + unrealized
+        return applied
+
+    def _apply_position(self, pos: dict, leverage_lookup=None) -> Optional[dict]:
+        """ACCOUNT_UPDATE 포지션 항목 반영"""
+        symbol = pos['s']
+        position_side = pos.get('ps', 'BOTH')
+        key = (symbol, position_side)
+        amount = float(pos['pa'])
+
+        if amount == 0:
+            self.positions.pop(key, None)
+            return None
+
+        current = self.positions.get(key, {})
+        mark_price = current.get("markPrice", float(pos['ep']))
+        leverage = current.get("leverage")
+        if leverage is None:
+            leverage = leverage_lookup(symbol) if leverage_lookup else EnvConfig.DEFAULT_LEVERAGE
+
+        position = {
+            "symbol": symbol,
+            "positionAmt": amount,
+            "entryPrice": float(pos['ep']),
+            "markPrice": mark_price,
+            "unrealizedProfit": float(pos['up']),
+            "liquidationPrice": current.get("liquidationPrice", 0.0),
+            "notional": abs(amount * mark_price),
+            "isolatedMargin": float(pos.get('iw', 0)),
+            "marginAsset": current.get("marginAsset", "USDT"),
+            "leverage": leverage,
+            "positionSide": position_side
+        }
+        self.positions[key] = position
+        return position
+
+    def apply_order_update(self, event: dict) -> Tuple[bool, bool]:
+        """ORDER_TRADE_UPDATE 이벤트의 미체결 주문 반영 (반영 여부, 체결 누락 여부)"""
+        order = event.get('o', {})
+        order_id = int(order['i'])
+        status = order.get('X')
+        event_time = int(event.get('E', 0))
+        filled = float(order.get('z') or 0)
+        last_filled = float(order.get('l') or 0)
+        previous = self._filled.get(order_id)
+
+        # 중복/역순 도착 이벤트와 이미 종료된 주문의 이벤트는 버림
+        if (
+            order_id in self._closed_orders
+            or event_time < self._order_times.get(order_id, 0)
+            or (previous is not None and last_filled > 0 and filled <= previous + FILL_TOLERANCE)
+        ):
+            metrics_manager.account_events_stale.labels(event='order').inc()
+            return False, False
+        self._order_times[order_id] = event_time
+        for listener in self._order_listeners:
+            try:
+                listener(order)
+            except Exception as e:
+                self.logger.error(f"주문 이벤트 리스너 실패 ({order_id}): {e}")
+
+        # 직전 누적 체결량 + 이번 체결량이 누적 체결량과 다르면 중간 체결 이벤트 누락
+        expected = (previous or 0.0) + last_filled
+        gap = abs(expected - filled) > FILL_TOLERANCE * max(1.0, filled)
+        if gap:
+            self.logger.warning(
+                f"체결 이벤트 누락 감지: {order['s']} 주문 {order_id} "
+                f"(예상 누적 {expected}, 수신 누적 {filled})"
+            )
+
+        if status in CLOSED_ORDER_STATUSES:
+            self.open_orders.pop(order_id, None)
+            self._filled.pop(order_id, None)
+            self._order_times.pop(order_id, None)
+            self._closed_orders[order_id] = event_time
+            if len(self._closed_orders) > CLOSED_ORDER_MEMORY:
+                self._closed_orders.popitem(last=False)
+            return True, gap
+
+        self._filled[order_id] = filled
+
+        self.open_orders[order_id] = {
+            "orderId": order_id,
+            "symbol": order['s'],
+            "clientOrderId": order.get('c'),
+            "side": order.get('S'),
+            "type": order.get('o'),
+            "timeInForce": order.get('f'),
+            "origQty": order.get('q'),
+            "price": order.get('p'),
+            "avgPrice": order.get('ap'),
+            "stopPrice": order.get('sp'),
+            "executedQty": order.get('z'),
+            "status": status,
+            "reduceOnly": order.get('R', False),
+            "positionSide": order.get('ps', 'BOTH'),
+            "updateTime": order.get('T', event.get('E'))
+        }
+        return True, gap
+
+    def reconcile_positions(self, symbol: str, positions: List[dict]):
+        """REST로 조회한 심볼 포지션으로 교체 (이벤트 누락 대조)"""
+        for key in [key for key in self.positions if key[0] == symbol]:
+            del self.positions[key]
+        for pos in positions:
+            self.positions[(symbol, pos.get("positionSide", "BOTH"))] = pos
+        self._unreconciled.discard(symbol)
+        self._notify(CHANGE_POSITIONS)
+
+    def apply_mark_price(self, symbol: str, mark_price: float) -> bool:
+        """마크 가격 틱으로 포지션 평가 금액/미실현 손익 및 계정 합계 재계산"""
+        updated = False
+        for (pos_symbol, _), position in self.positions.items():
+            if pos_symbol != symbol:
+                continue
+            amount = float(position["positionAmt"])
+            position["markPrice"] = mark_price
+            position["unrealizedProfit"] = amount * (mark_price - float(position["entryPrice"]))
+            position["notional"] = abs(amount * mark_price)
+            updated = True
+        if updated and self.account:
+            unrealized = sum(float(p["unrealizedProfit"]) for p in self.positions.values())
+            self.account["totalUnrealizedProfit"] = unrealized
+            self.account["totalMarginBalance"] = self.account["totalWalletBalance"] + unrealized
+        return updated
+
+    def get_position_symbols(self) -> Set[str]:
+        """보유 포지션 심볼"""
+        return {symbol for symbol, _ in self.positions}
+
+    def apply_leverage(self, symbol: str, leverage: int):
+        """레버리지 변경 반영"""
+        for (pos_symbol, _), position in self.positions.items():
+            if pos_symbol == symbol:
+                position["leverage"] = leverage
+
+    def get_account(self) -> dict:
+        """계정 정보"""
+        return dict(self.account)
+
+    def get_positions(self) -> List[dict]:
+        """활성 포지션 목록"""
+        return [dict(pos) for pos in self.positions.values()]
+
+    def get_position(self, symbol: str) -> Optional[dict]:
+        """심볼 포지션 (단방향 모드 기준 첫 번째 항목)"""
+        for (pos_symbol, _), position in self.positions.items():
+            if pos_symbol == symbol:
+                return dict(position)
+        return None
+
+    def get_open_orders(self, symbol: Optional[str] = None) -> List[dict]:
+        """미체결 주문 목록"""
+        return [
+            dict(order) for order in self.open_orders.values()
+            if symbol is None or order["symbol"] == symbol
+        ]
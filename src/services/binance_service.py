@@ -1,68 +1,293 @@
-from typing import List, Optional
+import asyncio
+from decimal import Decimal
+from typing import Dict, List, Optional, Set
+import aiohttp
 from fastapi import HTTPException
-from binance.client import Client
+from binance import AsyncClient
 from binance.exceptions import BinanceAPIException
 from src.utils.logger import logger
-from src.models.trading import OrderRequest
+from src.utils.metrics import metrics_manager
+from src.models.trading import Order, OrderRequest, Position
+from src.models.exchange import SymbolFilters
+from src.utils.exceptions import ValidationError
+from src.services.exchange_info_service import ExchangeInfoService
+from src.services.rate_limiter import RateLimitScheduler
+from src.services.account_store import AccountStore, CHANGE_POSITIONS
+from src.services.user_stream_service import UserStreamService
+from src.services.bracket_service import BracketService
+from src.services.order_validator import OrderValidator
+from src.services.binance_stream import BinanceStreamClient
+from src.services.market_data_hub import MarketDataHub
+from src.services.order_book_service import OrderBookService
+from src.services.candle_service import CandleService, REST_INTERVALS
+from src.services.indicator_service import IndicatorService
 from src.config.env import EnvConfig
 
+# batchOrders 한 번에 보낼 수 있는 최대 주문 수
+BATCH_ORDER_SIZE = 5
+
 class BinanceService:
     def __init__(self):
-        self.client = None
+        self.client: Optional[AsyncClient] = None
         self.testnet = EnvConfig.USE_TESTNET
         self.api_key = EnvConfig.BINANCE_API_KEY
         self.api_secret = EnvConfig.BINANCE_API_SECRET
+        # 동시 REST 요청 수 제한 (커넥션 풀 크기와 동일)
+        self._semaphore = asyncio.Semaphore(EnvConfig.BINANCE_MAX_CONCURRENCY)
+        self._init_lock = asyncio.Lock()
+        self._initialized = False
+        # 심볼별 레버리지/브래킷 테이블 (레버리지 변경 시에만 갱신)
+        self._leverage: Dict[str, int] = {}
+        self._brackets: Dict[str, List[dict]] = {}
+        self._leverage_loaded = False
+        # 요청 가중치 스케줄러 (모든 REST 호출이 통과)
+        self.rate_limiter = RateLimitScheduler()
+        # 거래소 메타데이터 캐시
+        self.exchange_info = ExchangeInfoService(self)
+        self.exchange_info.add_listener(
+            lambda info: self.rate_limiter.configure(info.get("rateLimits", []))
+        )
+        # 심볼 필터 기반 주문 사전 검증/정규화
+        self.validator = OrderValidator(self.exchange_info)
+        # 유저 데이터 스트림 기반 계정 상태
+        self.account_store = AccountStore()
+        self.user_stream = UserStreamService(self, self.account_store)
+        # 브래킷 주문 (진입 + 손절/익절을 batchOrders 한 번으로)
+        self.brackets = BracketService(self, self.account_store)
+        # 공유 마켓 데이터 스트림 (업스트림 연결 1개)
+        self.streams = BinanceStreamClient(self.testnet)
+        self.market_data = MarketDataHub(self.streams)
+        # 보유 포지션 심볼의 마크 가격으로 계정 상태의 평가 손익 갱신
+        self._mark_symbols: Set[str] = set()
+        # 포지션과 무관하게 마크 가격을 유지할 심볼 (주문 사전 리스크 검사용)
+        self._watched_symbols: Set[str] = set()
+        self._mark_lock = asyncio.Lock()
+        self._mark_tasks: Set[asyncio.Task] = set()
+        self.market_data.add_listener(self._on_mark_price)
+        self.account_store.add_listener(self._on_account_change)
+        self.order_books = OrderBookService(self, self.streams)
+        self.candles = CandleService(self, self.streams)
+        self.indicators = IndicatorService(self.candles)
 
     async def initialize(self):
         """바이낸스 클라이언트 초기화"""
-        try:
-            self.client = Client(self.api_key, self.api_secret, testnet=self.testnet)
-            # 선물 계정 접근 권한 확인
-            account = self.client.futures_account()
-            logger.info(f"선물 계정 접근 권한 확인 완료")
-            logger.info(f"계정 정보: {account['totalWalletBalance']} USDT")
-            logger.info("바이낸스 클라이언트 초기화 완료")
-        except Exception as e:
-            logger.error(f"바이낸스 클라이언트 초기화 실패: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
+        async with self._init_lock:
+            if self._initialized:
+                return
+            try:
+                # aiohttp 기반 비동기 클라이언트 (전용 커넥션 풀 사용)
+                self.client = await AsyncClient.create(
+                    self.api_key,
+                    self.api_secret,
+                    testnet=self.testnet,
+                    session_params={
+                        "connector": aiohttp.TCPConnector(
+                            limit=EnvConfig.BINANCE_MAX_CONCURRENCY,
+                            ttl_dns_cache=300
+                        ),
+                        "timeout": aiohttp.ClientTimeout(
+                            total=EnvConfig.BINANCE_REQUEST_TIMEOUT
+                        )
+                    }
+                )
+                # 선물 계정 접근 권한 확인
+                account = await self._request("futures_account")
+                logger.info(f"선물 계정 접근 권한 확인 완료")
+                logger.info(f"계정 정보: {account['totalWalletBalance']} USDT")
+                await self._load_leverage_table(account)
+                await self.exchange_info.start()
+                if EnvConfig.USER_STREAM_ENABLED:
+                    await self.user_stream.start()
+                    await self._sync_mark_subscriptions(self.account_store.get_position_symbols())
+                self._initialized = True
+                logger.info("바이낸스 클라이언트 초기화 완료")
+            except Exception as e:
+                logger.error(f"바이낸스 클라이언트 초기화 실패: {e}")
+                if self.client:
+                    await self.client.close_connection()
+                    self.client = None
+                raise HTTPException(status_code=500, detail=str(e))
+
+    async def _ensure_initialized(self):
+        """클라이언트 초기화 확인"""
+        if not self._initialized:
+            await self.initialize()
+
+    def is_connected(self) -> bool:
+        """바이낸스 클라이언트 연결 여부"""
+        return self._initialized and self.client is not None
 
     async def cleanup(self):
         """바이낸스 클라이언트 정리"""
         try:
+            await self.user_stream.stop()
+            for task in list(self._mark_tasks):
+                task.cancel()
+            self._watched_symbols = set()
+            await self._sync_mark_subscriptions(set())
+            await self.order_books.stop()
+            await self.indicators.stop()
+            await self.candles.stop()
+            await self.streams.stop()
+            await self.exchange_info.stop()
             if self.client:
-                self.client.close_connection()
+                await self.client.close_connection()
+                self.client = None
+            self._initialized = False
             logger.info("바이낸스 클라이언트 연결 종료")
         except Exception as e:
             logger.error(f"바이낸스 클라이언트 정리 실패: {e}")
 
+    def _on_mark_price(self, update: dict):
+        """마크 가격 틱을 계정 상태 포지션에 반영"""
+        self.account_store.apply_mark_price(update["symbol"], float(update["price"]))
+
+    def _on_account_change(self, change: str):
+        """보유 포지션이 바뀌면 마크 가격 구독 심볼 갱신"""
+        if change != CHANGE_POSITIONS or not self._initialized:
+            return
+        task = asyncio.create_task(
+            self._sync_mark_subscriptions(self.account_store.get_position_symbols())
+        )
+        self._mark_tasks.add(task)
+        task.add_done_callback(self._mark_tasks.discard)
+
+    async def watch_mark_prices(self, symbols: List[str]):
+        """보유 포지션 외에 마크 가격을 항상 구독할 심볼 지정"""
+        self._watched_symbols = set(symbols)
+        await self._sync_mark_subscriptions(self.account_store.get_position_symbols())
+
+    async def _sync_mark_subscriptions(self, symbols: Set[str]):
+        """보유 포지션 심볼과 지정 심볼만 마크 가격 허브에 구독"""
+        symbols = symbols | self._watched_symbols
+        async with self._mark_lock:
+            try:
+                for symbol in symbols - self._mark_symbols:
+                    await self.market_data.acquire(symbol)
+                    self._mark_symbols.add(symbol)
+                for symbol in self._mark_symbols - symbols:
+                    await self.market_data.release(symbol)
+                    self._mark_symbols.discard(symbol)
+            except Exception as e:
+                logger.error(f"포지션 마크 가격 구독 갱신 실패: {e}")
+
+    async def _request(self, method: str, **params):
+        """바이낸스 REST 호출 (이벤트 루프를 막지 않는 단일 진입점)"""
+        # 가중치 예산 확보 (주문 우선, 예산 부족 시 조회 대기/차단)
+        await self.rate_limiter.acquire(method, params)
+        async with self._semaphore:
+            try:
+                result = await getattr(self.client, method)(**params)
+                metrics_manager.binance_requests.labels(endpoint=method, status="success").inc()
+                response = getattr(self.client, "response", None)
+                if response is not None:
+                    self.rate_limiter.update_from_headers(response.headers)
+                return result
+            except BinanceAPIException as e:
+                metrics_manager.binance_requests.labels(endpoint=method, status="error").inc()
+                headers = getattr(e.response, "headers", None)
+                self.rate_limiter.update_from_headers(headers)
+                self.rate_limiter.handle_rate_limit_error(e.status_code, headers)
+                raise
+            except Exception:
+                metrics_manager.binance_requests.labels(endpoint=method, status="error").inc()
+                raise
+
+    async def _load_leverage_table(self, account: Optional[dict] = None):
+        """심볼별 레버리지/브래킷 테이블 로드"""
+        if account is None:
+            account = await self._request("futures_account")
+        brackets = await self._request("futures_leverage_bracket")
+
+        self._leverage = {
+            pos["symbol"]: int(pos["leverage"])
+            for pos in account.get("positions", [])
+            if "leverage" in pos
+        }
+        self._brackets = {
+            item["symbol"]: item.get("brackets", [])
+            for item in brackets
+        }
+        self._leverage_loaded = True
+        logger.info(f"레버리지 테이블 로드 완료: {len(self._leverage)}개 심볼")
+
+    def apply_leverage_update(self, symbol: str, leverage: int):
+        """레버리지 변경 반영 (change_leverage 또는 유저 스트림 ACCOUNT_CONFIG_UPDATE)"""
+        self._leverage[symbol] = int(leverage)
+        logger.info(f"레버리지 테이블 갱신: {symbol} -> {leverage}x")
+
+    def get_leverage(self, symbol: str) -> int:
+        """캐시된 심볼 레버리지 조회"""
+        return self._leverage.get(symbol, EnvConfig.DEFAULT_LEVERAGE)
+
+    def get_leverage_brackets(self, symbol: str) -> List[dict]:
+        """캐시된 심볼 레버리지 브래킷 조회"""
+        return self._brackets.get(symbol, [])
+
+    def get_max_leverage(self, symbol: str) -> int:
+        """심볼 최대 레버리지 (첫 번째 브래킷 기준)"""
+        brackets = self.get_leverage_brackets(symbol)
+        if not brackets:
+            return 125
+        return int(brackets[0].get("initialLeverage", 125))
+
+    async def change_leverage(self, symbol: str, leverage: int) -> dict:
+        """레버리지 변경"""
+        await self._ensure_initialized()
+        try:
+            response = await self._request(
+                "futures_change_leverage",
+                symbol=symbol,
+                leverage=leverage
+            )
+            self.apply_leverage_update(symbol, response.get("leverage", leverage))
+            self.account_store.apply_leverage(symbol, int(response.get("leverage", leverage)))
+            return response
+        except BinanceAPIException as e:
+            logger.error(f"바이낸스 API 오류: {e}")
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+        except Exception as e:
+            logger.error(f"레버리지 변경 실패: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    def _format_position(self, pos: dict) -> dict:
+        """positionRisk 응답을 포지션 정보로 변환"""
+        symbol = pos["symbol"]
+        # 레버리지 테이블 우선, 없으면 응답 값 사용
+        leverage = self._leverage.get(symbol)
+        if leverage is None:
+            leverage = int(pos.get("leverage", EnvConfig.DEFAULT_LEVERAGE))
+        return {
+            "symbol": symbol,
+            "positionAmt": float(pos["positionAmt"]),
+            "entryPrice": float(pos["entryPrice"]),
+            "markPrice": float(pos["markPrice"]),
+            "unrealizedProfit": float(pos["unRealizedProfit"]),
+            "liquidationPrice": float(pos.get("liquidationPrice", 0)),
+            "notional": abs(float(pos.get("notional", 0))),
+            "isolatedMargin": float(pos.get("isolatedMargin", 0)),
+            "marginAsset": pos.get("marginAsset", "USDT"),
+            "leverage": leverage,
+            "positionSide": pos.get("positionSide", "BOTH")
+        }
+
     async def get_all_positions(self) -> List[dict]:
-        """현재 포지션 조회"""
+        """현재 포지션 조회 (단일 positionRisk 호출 + 레버리지 테이블)"""
+        await self._ensure_initialized()
+        # 유저 스트림으로 동기화된 상태가 있으면 REST 호출 없이 반환
+        if self.account_store.is_synced:
+            return self.account_store.get_positions()
         try:
-            positions = self.client.futures_position_information()
+            if not self._leverage_loaded:
+                await self._load_leverage_table()
+
+            positions = await self._request("futures_position_information")
             active_positions = []
             
             for pos in positions:
                 if float(pos["positionAmt"]) != 0:
                     try:
-                        # 레버리지 정보 직접 조회
-                        symbol_leverage = self.client.futures_position_information(symbol=pos["symbol"])
-                        leverage = int(symbol_leverage[0].get("leverage", 10))  # 기본값 10
-                        
-                        position_info = {
-                            "symbol": pos["symbol"],
-                            "positionAmt": float(pos["positionAmt"]),
-                            "entryPrice": float(pos["entryPrice"]),
-                            "markPrice": float(pos["markPrice"]),
-                            "unrealizedProfit": float(pos["unRealizedProfit"]),
-                            "liquidationPrice": float(pos.get("liquidationPrice", 0)),
-                            "notional": abs(float(pos.get("notional", 0))),
-                            "isolatedMargin": float(pos.get("isolatedMargin", 0)),
-                            "marginAsset": pos.get("marginAsset", "USDT"),
-                            "leverage": leverage,
-                            "positionSide": pos.get("positionSide", "BOTH")
-                        }
-                        
-                        active_positions.append(position_info)
+                        active_positions.append(self._format_position(pos))
                     except (KeyError, ValueError) as e:
                         logger.error(f"포지션 데이터 처리 실패: {e}, 데이터: {pos}")
                         continue
@@ -76,28 +301,23 @@ class BinanceService:
             raise HTTPException(status_code=500, detail=str(e))
 
     async def create_order(self, order: OrderRequest) -> dict:
-        """주문 생성"""
+        """주문 생성 (손절/익절이 있으면 브래킷 주문)"""
+        await self._ensure_initialized()
+        order = await self.normalize_order(order)
+        if order.stop_loss is not None or order.take_profit is not None:
+            return await self.brackets.place(order)
         try:
-            # 주문 파라미터 설정
-            params = {
-                "symbol": order.symbol,
-                "side": order.side,
-                "type": order.type,
-                "quantity": order.quantity
-            }
-
-            # 지정가 주문인 경우 가격 추가
-            if order.type == "LIMIT":
-                if not order.price:
-                    raise HTTPException(status_code=400, detail="Limit order requires price")
-                params["price"] = order.price
-                params["timeInForce"] = "GTC"
+            # 지정가 주문은 가격 필수
+            if order.type == "LIMIT" and not order.price:
+                raise HTTPException(status_code=400, detail="Limit order requires price")
 
             # 주문 실행
-            response = self.client.futures_create_order(**params)
+            response = await self._request("futures_create_order", **self._order_params(order))
             logger.info(f"주문 생성 완료: {response}")
             return response
 
+        except HTTPException:
+            raise
         except BinanceAPIException as e:
             logger.error(f"바이낸스 API 오류: {e}")
             raise HTTPException(status_code=e.status_code, detail=str(e))
@@ -105,10 +325,214 @@ class BinanceService:
             logger.error(f"주문 생성 실패: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
+    @staticmethod
+    def _order_params(order: OrderRequest) -> dict:
+        """주문 요청을 REST/batchOrders 파라미터로 변환 (값은 문자열)"""
+        params = {
+            "symbol": order.symbol,
+            "side": order.side,
+            "type": order.type,
+            "quantity": str(order.quantity)
+        }
+        # 지정가 주문인 경우 가격 추가
+        if order.type == "LIMIT":
+            params["price"] = str(order.price)
+            params["timeInForce"] = "GTC"
+        return params
+
+    def _cached_mark_price(self, symbol: str) -> Optional[Decimal]:
+        """스트림 캐시의 마크 가격 (REST 호출 없음)"""
+        cached = self.market_data.get_mark_price(symbol)
+        return Decimal(cached["price"]) if cached else None
+
+    async def normalize_order(self, order: OrderRequest) -> OrderRequest:
+        """심볼 필터로 수량/가격 정규화 (규칙 위반은 거래소에 보내기 전에 ValidationError)"""
+        await self.exchange_info.ensure_loaded()
+        return self.validator.normalize(order, self._cached_mark_price(order.symbol))
+
+    async def create_orders(self, orders: List[OrderRequest]) -> List[dict]:
+        """주문 묶음 실행 (로컬 검증 후 5개 단위 batchOrders를 동시 전송, 주문별 결과 반환)"""
+        await self._ensure_initialized()
+        await self.exchange_info.ensure_loaded()
+        results: List[Optional[dict]] = [None] * len(orders)
+        orders = list(orders)
+        plain: List[int] = []
+        brackets: List[int] = []
+        for index, order in enumerate(orders):
+            try:
+                order = orders[index] = self.validator.normalize(order, self._cached_mark_price(order.symbol))
+            except ValidationError as e:
+                results[index] = {"index": index, "status": "rejected", "error": e.detail}
+                continue
+            if order.stop_loss is not None or order.take_profit is not None:
+                brackets.append(index)
+            else:
+                plain.append(index)
+
+        async def send_chunk(indices: List[int]):
+            try:
+                responses = await self._request(
+                    "futures_place_batch_order",
+                    batchOrders=[self._order_params(orders[i]) for i in indices]
+                )
+            except Exception as e:
+                logger.error(f"일괄 주문 전송 실패: {e}")
+                for i in indices:
+                    results[i] = {"index": i, "status": "failed", "error": str(e)}
+                return
+            for i, response in zip(indices, responses):
+                if "code" in response:
+                    results[i] = {"index": i, "status": "failed", "error": response.get("msg")}
+                else:
+                    results[i] = {"index": i, "status": "accepted", "order": response}
+            # 응답 개수가 모자라면 남은 주문은 실패 처리 (접수 여부는 미체결 주문 조회로 확인)
+            for i in indices[len(responses):]:
+                logger.error(f"일괄 주문 응답 누락: {orders[i].symbol} (요청 {len(indices)}개, 응답 {len(responses)}개)")
+                results[i] = {"index": i, "status": "failed", "error": "no response"}
+
+        async def send_bracket(index: int):
+            # 브래킷 주문은 자체 batchOrders(최대 3다리)로 전송
+            try:
+                results[index] = {"index": index, "status": "accepted", "order": await self.brackets.place(orders[index])}
+            except Exception as e:
+                detail = getattr(e, "detail", None) or str(e)
+                results[index] = {"index": index, "status": "failed", "error": detail}
+
+        chunks = [plain[i:i + BATCH_ORDER_SIZE] for i in range(0, len(plain), BATCH_ORDER_SIZE)]
+        # 가중치 예산은 요청 스케줄러가 관리
+        await asyncio.gather(
+            *(send_chunk(chunk) for chunk in chunks),
+            *(send_bracket(index) for index in brackets)
+        )
+        accepted = sum(1 for result in results if result["status"] == "accepted")
+        logger.info(f"일괄 주문 처리 완료: {accepted}/{len(orders)}개 접수 (batchOrders {len(chunks)}회)")
+        return results
+
+    def _to_order(self, response: dict, leverage: int) -> Order:
+        """주문 응답을 Order 모델로 변환"""
+        return Order.from_binance({
+            **response,
+            "orderId": str(response["orderId"]),
+            "leverage": leverage,
+            "time": response.get("updateTime", 0)
+        })
+
+    async def place_order(self, request: OrderRequest) -> Order:
+        """주문 실행 (요청 레버리지가 현재와 다르면 먼저 변경, 손절/익절이 있으면 브래킷 주문)"""
+        await self._ensure_initialized()
+        request = await self.normalize_order(request)
+        if self.get_leverage(request.symbol) != request.leverage:
+            await self.change_leverage(request.symbol, request.leverage)
+        try:
+            if request.stop_loss is not None or request.take_profit is not None:
+                result = await self.brackets.place(request)
+                order = self._to_order(result["entry"], request.leverage)
+                return order.copy(update={
+                    "stop_loss": self._trigger_price(result.get("stopLoss")),
+                    "take_profit": self._trigger_price(result.get("takeProfit"))
+                })
+            response = await self._request(
+                "futures_create_order",
+                **self._order_params(request),
+                newOrderRespType="RESULT"
+            )
+            logger.info(f"주문 접수: {request.symbol} {request.side} {request.type} {request.quantity} ({response.get('status')})")
+            return self._to_order(response, request.leverage)
+        except HTTPException:
+            raise
+        except BinanceAPIException as e:
+            logger.error(f"바이낸스 API 오류: {e}")
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+        except Exception as e:
+            logger.error(f"주문 실행 실패: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @staticmethod
+    def _trigger_price(response: Optional[dict]) -> Optional[Decimal]:
+        """보호 주문 응답의 트리거 가격 (접수 실패 시 None)"""
+        if not response or "stopPrice" not in response:
+            return None
+        return Decimal(str(response["stopPrice"]))
+
+    async def close_position(self, symbol: str) -> Optional[Order]:
+        """심볼 포지션 시장가 청산 (reduceOnly, 포지션이 없으면 None)"""
+        position = await self.get_position(symbol)
+        if position is None:
+            return None
+        try:
+            response = await self._request(
+                "futures_create_order",
+                symbol=symbol,
+                side="SELL" if position.side == "LONG" else "BUY",
+                type="MARKET",
+                quantity=str(position.quantity),
+                reduceOnly="true",
+                newOrderRespType="RESULT"
+            )
+            logger.info(f"포지션 청산 주문 체결: {symbol} {position.quantity} ({response.get('status')})")
+            return self._to_order(response, position.leverage)
+        except BinanceAPIException as e:
+            logger.error(f"바이낸스 API 오류: {e}")
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+        except Exception as e:
+            logger.error(f"포지션 청산 실패: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    async def cancel_all_orders(self, symbol: str) -> dict:
+        """심볼 미체결 주문 전체 취소"""
+        await self._ensure_initialized()
+        try:
+            return await self._request("futures_cancel_all_open_orders", symbol=symbol)
+        except BinanceAPIException as e:
+            logger.error(f"바이낸스 API 오류: {e}")
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+
+    async def get_position(self, symbol: str) -> Optional[Position]:
+        """심볼 포지션 조회"""
+        if self.account_store.is_synced:
+            data = self.account_store.get_position(symbol)
+        else:
+            data = next(
+                (pos for pos in await self.get_all_positions() if pos["symbol"] == symbol),
+                None
+            )
+        return Position.from_binance(data) if data else None
+
+    async def reconcile_position(self, symbol: str) -> Optional[Position]:
+        """이벤트 누락 시 REST로 심볼 포지션을 다시 조회해 계정 상태 대조"""
+        await self._ensure_initialized()
+        positions = [
+            self._format_position(pos)
+            for pos in await self._request("futures_position_information", symbol=symbol)
+            if float(pos["positionAmt"]) != 0
+        ]
+        self.account_store.reconcile_positions(symbol, positions)
+        metrics_manager.position_reconciliations.labels(symbol=symbol).inc()
+        logger.info(f"포지션 대조 완료: {symbol} ({len(positions)}개)")
+        return Position.from_binance(positions[0]) if positions else None
+
+    async def get_open_orders(self, symbol: Optional[str] = None) -> List[dict]:
+        """미체결 주문 조회"""
+        await self._ensure_initialized()
+        if self.account_store.is_synced:
+            return self.account_store.get_open_orders(symbol)
+        try:
+            params = {"symbol": symbol} if symbol else {}
+            return await self._request("futures_get_open_orders", **params)
+        except BinanceAPIException as e:
+            logger.error(f"바이낸스 API 오류: {e}")
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+        except Exception as e:
+            logger.error(f"미체결 주문 조회 실패: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
     async def get_account_info(self) -> dict:
         """계정 정보 조회"""
+        await self._ensure_initialized()
+        if self.account_store.is_synced:
+            return self.account_store.get_account()
         try:
-            account = self.client.futures_account()
+            account = await self._request("futures_account")
             return {
                 "totalWalletBalance": float(account["totalWalletBalance"]),
                 "totalUnrealizedProfit": float(account["totalUnrealizedProfit"]),
@@ -123,14 +547,83 @@ class BinanceService:
             logger.error(f"계정 정보 조회 실패: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
+    async def get_mark_price(self, symbol: str) -> Decimal:
+        """마크 가격 조회 (구독 중이면 스트림 캐시, 아니면 REST)"""
+        cached = self.market_data.get_mark_price(symbol)
+        if cached:
+            return Decimal(cached["price"])
+        await self._ensure_initialized()
+        try:
+            data = await self._request("futures_mark_price", symbol=symbol)
+            return Decimal(str(data["markPrice"]))
+        except BinanceAPIException as e:
+            logger.error(f"바이낸스 API 오류: {e}")
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+        except Exception as e:
+            logger.error(f"마크 가격 조회 실패: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    async def get_order_book(self, symbol: str, limit: int = None) -> dict:
+        """상위 호가 조회 (로컬 호가창이 동기화돼 있으면 REST 호출 없이 반환)"""
+        limit = limit or EnvConfig.ORDER_BOOK_PUBLISH_DEPTH
+        book = self.order_books.get_book(symbol)
+        if book:
+            return book.top(limit)
+        await self._ensure_initialized()
+        try:
+            # 바이낸스가 허용하는 limit 중 요청 이상인 가장 작은 값 사용
+            rest_limit = next((n for n in (5, 10, 20, 50, 100, 500, 1000) if n >= limit), 1000)
+            data = await self._request("futures_order_book", symbol=symbol, limit=rest_limit)
+            return {
+                "symbol": symbol,
+                "lastUpdateId": data["lastUpdateId"],
+                "timestamp": data.get("E", 0),
+                "bids": [[float(p), float(q)] for p, q in data["bids"][:limit]],
+                "asks": [[float(p), float(q)] for p, q in data["asks"][:limit]]
+            }
+        except BinanceAPIException as e:
+            logger.error(f"바이낸스 API 오류: {e}")
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+        except Exception as e:
+            logger.error(f"호가 조회 실패: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    async def get_candles(self, symbol: str, interval: str, limit: int = 500) -> List[list]:
+        """캔들 조회 (집계 중인 심볼은 메모리 이력, 아니면 REST klines)"""
+        series = self.candles.get_series(symbol, interval)
+        if series is not None and len(series) > 0:
+            return series.to_klines(limit)
+        if interval not in REST_INTERVALS:
+            raise HTTPException(status_code=404, detail=f"{interval} candles are only available for streamed symbols")
+        await self._ensure_initialized()
+        try:
+            klines = await self._request("futures_klines", symbol=symbol, interval=interval, limit=limit)
+            return [
+                [k[0], float(k[1]), float(k[2]), float(k[3]), float(k[4]), float(k[5]), k[6], float(k[7]), k[8]]
+                for k in klines
+            ]
+        except BinanceAPIException as e:
+            logger.error(f"바이낸스 API 오류: {e}")
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+        except Exception as e:
+            logger.error(f"캔들 조회 실패: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
     async def get_exchange_info(self) -> dict:
-        """거래소 정보 조회"""
+        """거래소 정보 조회 (캐시)"""
+        await self._ensure_initialized()
         try:
-            exchange_info = self.client.futures_exchange_info()
-            return exchange_info
+            await self.exchange_info.ensure_loaded()
+            return self.exchange_info.payload
         except BinanceAPIException as e:
             logger.error(f"바이낸스 API 오류: {e}")
             raise HTTPException(status_code=e.status_code, detail=str(e))
         except Exception as e:
             logger.error(f"거래소 정보 조회 실패: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+            raise HTTPException(status_code=500, detail=str(e))
+
+    async def get_symbol_filters(self, symbol: str) -> Optional[SymbolFilters]:
+        """심볼 필터 조회 (캐시)"""
+        await self._ensure_initialized()
+        await self.exchange_info.ensure_loaded()
+        return self.exchange_info.get_symbol(symbol)
@@ -0,0 +1,131 @@
+import asyncio
+import itertools
+import json
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+import websockets
+from src.utils.logger import LoggerMixin
+
+FSTREAM_COMBINED_URL = "wss://fstream.binance.com/stream"
+FSTREAM_TESTNET_COMBINED_URL = "wss://stream.binancefuture.com/stream"
+
+# 바이낸스 SUBSCRIBE 요청당 최대 스트림 수
+MAX_STREAMS_PER_REQUEST = 200
+
+StreamHandler = Callable[[Union[dict, list]], Union[None, Awaitable[None]]]
+
+class BinanceStreamClient(LoggerMixin):
+    """단일 업스트림 연결로 여러 마켓 스트림을 구독하는 combined stream 클라이언트"""
+
+    def __init__(self, testnet: bool = False):
+        self.url = FSTREAM_TESTNET_COMBINED_URL if testnet else FSTREAM_COMBINED_URL
+        self._handlers: Dict[str, StreamHandler] = {}
+        self._reconnect_listeners: List[Callable[[], Union[None, Awaitable[None]]]] = []
+        self._ws = None
+        self._task: Optional[asyncio.Task] = None
+        self._ids = itertools.count(1)
+        self._running = False
+
+    @property
+    def streams(self) -> List[str]:
+        return list(self._handlers)
+
+    def add_reconnect_listener(self, listener: Callable[[], Union[None, Awaitable[None]]]):
+        """재연결 시 호출될 리스너 등록 (스트림 공백 보정용)"""
+        self._reconnect_listeners.append(listener)
+
+    async def subscribe(self, stream: str, handler: StreamHandler):
+        """스트림 구독"""
+        is_new = stream not in self._handlers
+        self._handlers[stream] = handler
+        self._ensure_running()
+        if is_new:
+            await self._send("SUBSCRIBE", [stream])
+            self.logger.info(f"업스트림 스트림 구독: {stream}")
+
+    async def unsubscribe(self, stream: str):
+        """스트림 구독 해제"""
+        if self._handlers.pop(stream, None) is not None:
+            await self._send("UNSUBSCRIBE", [stream])
+            self.logger.info(f"업스트림 스트림 구독 해제: {stream}")
+
+    async def stop(self):
+        """연결 종료"""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._handlers.clear()
+
+    def _ensure_running(self):
+        if not self._running:
+            self._running = True
+            self._task = asyncio.create_task(self._run())
+
+    async def _send(self, method: str, streams: List[str]):
+        """SUBSCRIBE/UNSUBSCRIBE 요청 전송 (연결 전이면 연결 시 일괄 구독)"""
+        if self._ws is None:
+            return
+        for i in range(0, len(streams), MAX_STREAMS_PER_REQUEST):
+            try:
+                await self._ws.send(json.dumps({
+                    "method": method,
+                    "params": streams[i:i + MAX_STREAMS_PER_REQUEST],
+                    "id": next(self._ids)
+                }))
+            except Exception as e:
+                self.logger.error(f"스트림 {method} 요청 실패: {e}")
+
+    async def _run(self):
+        """연결/수신 루프 (끊기면 지수 백오프로 재연결 후 재구독)"""
+        backoff = 1
+        first_connect = True
+        while self._running:
+            try:
+                async with websockets.connect(self.url, max_queue=None) as ws:
+                    self._ws = ws
+                    backoff = 1
+                    await self._send("SUBSCRIBE", self.streams)
+                    if not first_connect:
+                        await self._notify_reconnect()
+                    first_connect = False
+                    async for message in ws:
+                        await self._dispatch(json.loads(message))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"마켓 스트림 연결 오류: {e}")
+            finally:
+                self._ws = None
+
+            if self._running:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+
+    async def _dispatch(self, message: dict):
+        """스트림 메시지를 핸들러로 전달"""
+        stream = message.get("stream")
+        if stream is None:
+            # SUBSCRIBE 응답 등
+            return
+        handler = self._handlers.get(stream)
+        if handler is None:
+            return
+        try:
+            result = handler(message.get("data"))
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            self.logger.error(f"스트림 메시지 처리 실패 ({stream}): {e}")
+
+    async def _notify_reconnect(self):
+        for listener in self._reconnect_listeners:
+            try:
+                result = listener()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.logger.error(f"재연결 리스너 실패: {e}")
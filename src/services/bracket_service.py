@@ -0,0 +1,224 @@
+import asyncio
+import uuid
+from decimal import Decimal, ROUND_DOWN, ROUND_UP
+from typing import Dict, List, Optional, Set, Tuple
+from binance.exceptions import BinanceAPIException
+from src.models.trading import OrderRequest
+from src.services.account_store import AccountStore
+from src.services.order_validator import quantize_to_step
+from src.utils.exceptions import BracketProtectionError, OrderError, ValidationError
+from src.utils.logger import LoggerMixin
+
+# 브래킷 주문 clientOrderId: {접두어}{브래킷 ID}-{다리} (형제 다리 ID를 상태 없이 계산)
+BRACKET_PREFIX = 'brk'
+LEG_ENTRY = 'E'
+LEG_STOP = 'SL'
+LEG_TAKE = 'TP'
+
+# 형제 다리가 남아 있으면 안 되는 진입 주문 상태 (체결 없이 종료)
+ENTRY_ABORTED_STATUSES = {'CANCELED', 'EXPIRED', 'REJECTED', 'EXPIRED_IN_MATCH'}
+
+# 이미 취소/체결된 주문 취소 시 오류 코드
+UNKNOWN_ORDER_CODE = -2011
+
+def leg_client_id(bracket_id: str, leg: str) -> str:
+    return f"{BRACKET_PREFIX}{bracket_id}-{leg}"
+
+def parse_client_id(client_id: Optional[str]) -> Optional[Tuple[str, str]]:
+    """브래킷 다리 clientOrderId면 (브래킷 ID, 다리) 반환"""
+    if not client_id or not client_id.startswith(BRACKET_PREFIX) or '-' not in client_id:
+        return None
+    bracket_id, leg = client_id[len(BRACKET_PREFIX):].rsplit('-', 1)
+    if leg not in (LEG_ENTRY, LEG_STOP, LEG_TAKE):
+        return None
+    return bracket_id, leg
+
+def compute_triggers(
+    side: str,
+    reference: Decimal,
+    stop_loss: Optional[Decimal],
+    take_profit: Optional[Decimal],
+    mode: str,
+    tick_size: Decimal = Decimal('0')
+) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+    """진입 기준가 대비 손절/익절 트리거 가격 계산 (percent 모드는 진입가 대비 %, 보호 방향으로 틱 반올림)"""
+    long = side == 'BUY'
+    stop = take = None
+    if stop_loss is not None:
+        if mode == 'percent':
+            stop = reference * (1 - stop_loss / 100 if long else 1 + stop_loss / 100)
+        else:
+            stop = stop_loss
+        # 손절은 진입가에 가까운 쪽으로 반올림
+        stop = quantize_to_step(stop, tick_size, ROUND_UP if long else ROUND_DOWN)
+        if (stop >= reference) if long else (stop <= reference):
+            raise ValidationError(f"손절 가격이 진입가 기준 잘못된 방향: {stop} (기준 {reference})")
+    if take_profit is not None:
+        if mode == 'percent':
+            take = reference * (1 + take_profit / 100 if long else 1 - take_profit / 100)
+        else:
+            take = take_profit
+        take = quantize_to_step(take, tick_size, ROUND_DOWN if long else ROUND_UP)
+        if (take <= reference) if long else (take >= reference):
+            raise ValidationError(f"익절 가격이 진입가 기준 잘못된 방향: {take} (기준 {reference})")
+    return stop, take
+
+class BracketService(LoggerMixin):
+    """진입/손절/익절 주문을 batchOrders 한 번으로 보내고 한쪽 체결 시 반대쪽을 취소 (OCO)"""
+
+    def __init__(self, binance_service, store: AccountStore):
+        self.binance = binance_service
+        self._tasks: Set[asyncio.Task] = set()
+        store.add_order_listener(self._on_order_update)
+
+    def build_legs(self, request: OrderRequest, bracket_id: str, stop: Optional[Decimal], take: Optional[Decimal]) -> Dict[str, dict]:
+        """batchOrders 다리 파라미터 (값은 모두 문자열)"""
+        quantity = str(request.quantity)
+        exit_side = 'SELL' if request.side == 'BUY' else 'BUY'
+        entry = {
+            "symbol": request.symbol,
+            "side": request.side,
+            "type": request.type,
+            "quantity": quantity,
+            "newClientOrderId": leg_client_id(bracket_id, LEG_ENTRY),
+            "newOrderRespType": "RESULT"
+        }
+        if request.type == 'LIMIT':
+            entry["price"] = str(request.price)
+            entry["timeInForce"] = "GTC"
+        legs = {LEG_ENTRY: entry}
+        for leg, order_type, trigger in ((LEG_STOP, "STOP_MARKET", stop), (LEG_TAKE, "TAKE_PROFIT_MARKET", take)):
+            if trigger is None:
+                continue
+            legs[leg] = {
+                "symbol": request.symbol,
+                "side": exit_side,
+                "type": order_type,
+                "quantity": quantity,
+                "stopPrice": str(trigger),
+                "reduceOnly": "true",
+                "workingType": "MARK_PRICE",
+                "newClientOrderId": leg_client_id(bracket_id, leg)
+            }
+        return legs
+
+    async def place(self, request: OrderRequest) -> dict:
+        """브래킷 주문 실행"""
+        if request.type == 'LIMIT':
+            if not request.price:
+                raise ValidationError("지정가 주문에는 price가 필요합니다")
+            reference = request.price
+        else:
+            reference = await self.binance.get_mark_price(request.symbol)
+        filters = await self.binance.get_symbol_filters(request.symbol)
+        stop, take = compute_triggers(
+            request.side,
+            reference,
+            request.stop_loss,
+            request.take_profit,
+            request.trigger_mode,
+            filters.tick_size if filters else Decimal('0')
+        )
+
+        bracket_id = uuid.uuid4().hex[:24]
+        legs = self.build_legs(request, bracket_id, stop, take)
+        responses = await self.binance._request("futures_place_batch_order", batchOrders=list(legs.values()))
+        # 응답이 모자란 다리는 실패로 간주
+        results = {
+            leg: responses[i] if i < len(responses) else {"code": None, "msg": "no response"}
+            for i, leg in enumerate(legs)
+        }
+
+        errors = {leg: result for leg, result in results.items() if "code" in result}
+        if LEG_ENTRY in errors:
+            # 진입 실패 시 이미 접수된 보호 주문 취소 (응답이 없는 다리는 접수됐을 수 있으므로 함께 취소)
+            await self._cancel_legs(
+                request.symbol, bracket_id,
+                [leg for leg, result in results.items() if result.get("code", 0) is None or leg not in errors]
+            )
+            raise OrderError(f"브래킷 진입 주문 실패: {errors[LEG_ENTRY].get('msg')}")
+        for leg, error in errors.items():
+            # 보호 주문 실패는 개별 재시도 (진입은 이미 접수됨)
+            self.logger.error(f"브래킷 보호 주문 실패, 개별 재시도: {legs[leg]['newClientOrderId']} ({error.get('msg')})")
+            try:
+                results[leg] = await self.binance._request("futures_create_order", **legs[leg])
+            except Exception as e:
+                # 보호 주문 없이 포지션을 남기지 않도록 진입 취소/청산
+                self.logger.error(f"브래킷 보호 주문 재시도 실패, 진입 정리: {legs[leg]['newClientOrderId']} ({e})")
+                placed = [placed for placed, result in results.items() if "code" not in result]
+                unwound = await self._unwind(request, bracket_id, results[LEG_ENTRY], placed)
+                raise BracketProtectionError(
+                    f"브래킷 보호 주문 실패로 진입 {'정리' if unwound else '정리 실패'}: {e}",
+                    results[LEG_ENTRY]
+                )
+
+        self.logger.info(
+            f"브래킷 주문 접수: {request.symbol} {request.side} {request.quantity} "
+            f"(SL: {stop}, TP: {take}, id: {bracket_id})"
+        )
+        return {
+            "bracketId": bracket_id,
+            "entry": results[LEG_ENTRY],
+            "stopLoss": results.get(LEG_STOP),
+            "takeProfit": results.get(LEG_TAKE)
+        }
+
+    def _on_order_update(self, order: dict):
+        """브래킷 다리 상태 변화 처리 (익절/손절 체결 시 형제 취소, 진입 무산 시 보호 주문 취소)"""
+        parsed = parse_client_id(order.get('c'))
+        if parsed is None:
+            return
+        bracket_id, leg = parsed
+        status = order.get('X')
+        if leg in (LEG_STOP, LEG_TAKE) and status == 'FILLED':
+            siblings = [LEG_TAKE if leg == LEG_STOP else LEG_STOP]
+        elif leg == LEG_ENTRY and status in ENTRY_ABORTED_STATUSES and float(order.get('z') or 0) == 0:
+            siblings = [LEG_STOP, LEG_TAKE]
+        else:
+            return
+        task = asyncio.create_task(self._cancel_legs(order['s'], bracket_id, siblings))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _unwind(self, request: OrderRequest, bracket_id: str, entry: dict, placed: List[str]) -> bool:
+        """진입 미체결분 취소 후 체결분을 reduceOnly 시장가로 청산 (성공 여부 반환)"""
+        await self._cancel_legs(request.symbol, bracket_id, [leg for leg in placed if leg != LEG_ENTRY])
+        executed = Decimal(str(entry.get("executedQty") or 0))
+        try:
+            canceled = await self.binance._request(
+                "futures_cancel_order", symbol=request.symbol, origClientOrderId=leg_client_id(bracket_id, LEG_ENTRY)
+            )
+            executed = Decimal(str(canceled.get("executedQty") or executed))
+        except BinanceAPIException as e:
+            # 이미 체결된 시장가 진입은 취소할 주문이 없음
+            if e.code != UNKNOWN_ORDER_CODE:
+                self.logger.error(f"브래킷 진입 취소 실패: {bracket_id} ({e})")
+        except Exception as e:
+            self.logger.error(f"브래킷 진입 취소 실패: {bracket_id} ({e})")
+        if executed <= 0:
+            return True
+        try:
+            await self.binance._request(
+                "futures_create_order",
+                symbol=request.symbol,
+                side='SELL' if request.side == 'BUY' else 'BUY',
+                type="MARKET",
+                quantity=str(executed),
+                reduceOnly="true",
+                newOrderRespType="RESULT"
+            )
+            self.logger.warning(f"보호 없는 브래킷 진입 청산: {request.symbol} {executed} (id: {bracket_id})")
+            return True
+        except Exception as e:
+            self.logger.error(f"보호 없는 브래킷 진입 청산 실패: {request.symbol} {executed} (id: {bracket_id}, {e})")
+            return False
+
+    async def _cancel_legs(self, symbol: str, bracket_id: str, legs: List[str]):
+        for leg in legs:
+            client_id = leg_client_id(bracket_id, leg)
+            try:
+                await self.binance._request("futures_cancel_order", symbol=symbol, origClientOrderId=client_id)
+                self.logger.info(f"브래킷 주문 취소: {client_id}")
+            except BinanceAPIException as e:
+                if e.code != UNKNOWN_ORDER_CODE:
+                    self.logger.error(f"브래킷 주문 취소 실패: {client_id} ({e})")
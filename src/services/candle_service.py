@@ -0,0 +1,263 @@
+import asyncio
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+import numpy as np
+from src.config.env import EnvConfig
+from src.services.binance_stream import BinanceStreamClient
+from src.utils.logger import LoggerMixin
+
+# 지원 주기 (ms)
+INTERVALS: Dict[str, int] = {
+    '1s': 1_000,
+    '1m': 60_000,
+    '5m': 300_000,
+    '1h': 3_600_000,
+}
+
+# REST klines로 과거 데이터를 채울 수 있는 주기 (선물 API는 1s 미지원)
+REST_INTERVALS = {'1m', '5m', '1h'}
+
+# values 배열 열 순서
+OPEN, HIGH, LOW, CLOSE, VOLUME, QUOTE_VOLUME = range(6)
+
+CandleListener = Callable[['CandleSeries', dict, bool], Union[None, Awaitable[None]]]
+
+class CandleSeries:
+    """심볼/주기별 캔들 이력을 담는 미리 할당된 NumPy 링 버퍼 (마지막 슬롯이 진행 중 캔들)"""
+
+    def __init__(self, symbol: str, interval: str, capacity: int):
+        self.symbol = symbol
+        self.interval = interval
+        self.interval_ms = INTERVALS[interval]
+        self.capacity = capacity
+        self.open_time = np.zeros(capacity, dtype=np.int64)
+        self.values = np.zeros((capacity, 6), dtype=np.float64)
+        self.trades = np.zeros(capacity, dtype=np.int64)
+        self.head = -1
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _indices(self, limit: Optional[int] = None) -> np.ndarray:
+        """오래된 순서의 슬롯 인덱스"""
+        n = self.count if limit is None else min(limit, self.count)
+        return (self.head - np.arange(n - 1, -1, -1)) % self.capacity
+
+    def _start(self, open_times: np.ndarray, price: float):
+        """새 슬롯 시작 (공백 구간은 직전 종가의 거래 없는 캔들로 채움)"""
+        idx = (self.head + 1 + np.arange(len(open_times))) % self.capacity
+        self.open_time[idx] = open_times
+        self.values[idx, OPEN:VOLUME] = price
+        self.values[idx, VOLUME:] = 0.0
+        self.trades[idx] = 0
+        self.head = int(idx[-1])
+        self.count = min(self.count + len(open_times), self.capacity)
+
+    def update(self, trade_time: int, price: float, quantity: float) -> int:
+        """체결 반영 (새로 마감된 캔들 수 반환, 늦게 도착한 이전 주기 체결은 무시)"""
+        bucket = trade_time - trade_time % self.interval_ms
+        closed = 0
+        if self.count == 0:
+            self._start(np.array([bucket], dtype=np.int64), price)
+        else:
+            current = int(self.open_time[self.head])
+            if bucket < current:
+                return 0
+            if bucket > current:
+                closed = (bucket - current) // self.interval_ms
+                # 버퍼보다 긴 공백은 최근 capacity개만 유지
+                first = max(current + self.interval_ms, bucket - (self.capacity - 1) * self.interval_ms)
+                open_times = np.arange(first, bucket + 1, self.interval_ms, dtype=np.int64)
+                self._start(open_times, float(self.values[self.head, CLOSE]))
+                self.values[self.head, OPEN:VOLUME] = price
+
+        row = self.values[self.head]
+        if price > row[HIGH]:
+            row[HIGH] = price
+        if price < row[LOW]:
+            row[LOW] = price
+        row[CLOSE] = price
+        row[VOLUME] += quantity
+        row[QUOTE_VOLUME] += price * quantity
+        self.trades[self.head] += 1
+        return min(closed, self.capacity - 1)
+
+    def candle(self, offset: int = 0) -> dict:
+        """offset번째 이전 캔들 (0이면 진행 중 캔들)"""
+        i = (self.head - offset) % self.capacity
+        open_time = int(self.open_time[i])
+        o, h, l, c, v, q = self.values[i].tolist()
+        return {
+            'symbol': self.symbol,
+            'interval': self.interval,
+            'openTime': open_time,
+            'closeTime': open_time + self.interval_ms - 1,
+            'open': o,
+            'high': h,
+            'low': l,
+            'close': c,
+            'volume': v,
+            'quoteVolume': q,
+            'trades': int(self.trades[i])
+        }
+
+    def history(self, limit: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """오래된 순서의 (open_time, values) 복사본"""
+        idx = self._indices(limit)
+        return self.open_time[idx], self.values[idx]
+
+    def to_klines(self, limit: Optional[int] = None) -> List[list]:
+        """바이낸스 klines 형식 [openTime, o, h, l, c, v, closeTime, quoteVolume, trades]"""
+        idx = self._indices(limit)
+        return [
+            [open_time, o, h, l, c, v, open_time + self.interval_ms - 1, q, trades]
+            for open_time, (o, h, l, c, v, q), trades in zip(
+                self.open_time[idx].tolist(), self.values[idx].tolist(), self.trades[idx].tolist()
+            )
+        ]
+
+    def load_klines(self, klines: List[list]):
+        """REST klines로 과거 이력 채우기 (이미 스트림으로 만든 이후 캔들은 유지)"""
+        if not klines:
+            return
+        history_times = np.array([int(k[0]) for k in klines], dtype=np.int64)
+        history_values = np.array([[float(x) for x in k[1:6]] + [float(k[7])] for k in klines])
+        history_trades = np.array([int(k[8]) for k in klines], dtype=np.int64)
+
+        idx = self._indices()
+        live = idx[self.open_time[idx] > history_times[-1]]
+        open_times = np.concatenate([history_times, self.open_time[live]])[-self.capacity:]
+        values = np.concatenate([history_values, self.values[live]])[-self.capacity:]
+        trades = np.concatenate([history_trades, self.trades[live]])[-self.capacity:]
+
+        n = len(open_times)
+        self.open_time[:n] = open_times
+        self.values[:n] = values
+        self.trades[:n] = trades
+        self.head = n - 1
+        self.count = n
+
+class CandleService(LoggerMixin):
+    """aggTrade 스트림으로 심볼별 캔들을 증분 집계하는 서비스 (업스트림 구독 1개/심볼)"""
+
+    def __init__(
+        self,
+        binance_service,
+        streams: BinanceStreamClient,
+        intervals: List[str] = None,
+        capacity: int = None
+    ):
+        self.binance = binance_service
+        self.streams = streams
+        self.intervals = intervals or EnvConfig.CANDLE_INTERVALS
+        for interval in self.intervals:
+            if interval not in INTERVALS:
+                raise ValueError(f"unsupported candle interval: {interval}")
+        self.capacity = capacity or EnvConfig.CANDLE_HISTORY_SIZE
+        self.series: Dict[Tuple[str, str], CandleSeries] = {}
+        self._refcounts: Dict[str, int] = {}
+        self._backfill_tasks: Dict[str, asyncio.Task] = {}
+        self._listeners: List[CandleListener] = []
+        self._history_listeners: List[Callable[[str], None]] = []
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _stream_name(symbol: str) -> str:
+        return f"{symbol.lower()}@aggTrade"
+
+    def add_listener(self, listener: CandleListener):
+        """캔들 갱신 리스너 등록 (series, candle, closed)"""
+        self._listeners.append(listener)
+
+    def add_history_listener(self, listener: Callable[[str], None]):
+        """과거 이력 로드 완료 리스너 등록 (symbol)"""
+        self._history_listeners.append(listener)
+
+    def get_series(self, symbol: str, interval: str) -> Optional[CandleSeries]:
+        return self.series.get((symbol, interval))
+
+    def get_symbols(self) -> List[str]:
+        return list(self._refcounts)
+
+    async def acquire(self, symbol: str):
+        """심볼 캔들 집계 시작 (첫 구독자일 때만 업스트림 구독 및 과거 이력 로드)"""
+        async with self._lock:
+            count = self._refcounts.get(symbol, 0) + 1
+            self._refcounts[symbol] = count
+            if count > 1:
+                return
+            for interval in self.intervals:
+                self.series[(symbol, interval)] = CandleSeries(symbol, interval, self.capacity)
+            await self.streams.subscribe(self._stream_name(symbol), partial(self._on_trade, symbol))
+            self._backfill_tasks[symbol] = asyncio.create_task(self._backfill(symbol))
+
+    async def release(self, symbol: str):
+        """심볼 캔들 집계 중지 (마지막 구독자일 때 업스트림 해제)"""
+        async with self._lock:
+            count = self._refcounts.get(symbol, 0) - 1
+            if count > 0:
+                self._refcounts[symbol] = count
+                return
+            self._refcounts.pop(symbol, None)
+            for interval in self.intervals:
+                self.series.pop((symbol, interval), None)
+            task = self._backfill_tasks.pop(symbol, None)
+            if task:
+                task.cancel()
+            await self.streams.unsubscribe(self._stream_name(symbol))
+
+    async def stop(self):
+        """과거 이력 로드 태스크 정리"""
+        for task in self._backfill_tasks.values():
+            task.cancel()
+        self._backfill_tasks.clear()
+        self.series.clear()
+        self._refcounts.clear()
+
+    async def _backfill(self, symbol: str):
+        """REST klines로 마감된 과거 캔들 로드 (진행 중 캔들은 스트림으로 집계)"""
+        try:
+            await self.binance._ensure_initialized()
+            for interval in self.intervals:
+                if interval not in REST_INTERVALS:
+                    continue
+                klines = await self.binance._request(
+                    "futures_klines", symbol=symbol, interval=interval, limit=min(self.capacity, 1500)
+                )
+                series = self.get_series(symbol, interval)
+                if series is not None:
+                    series.load_klines(klines[:-1])
+            for listener in self._history_listeners:
+                listener(symbol)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error(f"캔들 과거 이력 로드 실패 ({symbol}): {e}")
+        finally:
+            # 해제 후 재구독으로 새 태스크가 등록됐으면 그대로 둠
+            if self._backfill_tasks.get(symbol) is asyncio.current_task():
+                del self._backfill_tasks[symbol]
+
+    async def _on_trade(self, symbol: str, event: dict):
+        """aggTrade 이벤트를 모든 주기 캔들에 반영"""
+        price = float(event['p'])
+        quantity = float(event['q'])
+        trade_time = int(event['T'])
+        for interval in self.intervals:
+            series = self.series.get((symbol, interval))
+            if series is None:
+                return
+            closed = series.update(trade_time, price, quantity)
+            for offset in range(closed, 0, -1):
+                await self._notify(series, series.candle(offset), True)
+            await self._notify(series, series.candle(), False)
+
+    async def _notify(self, series: CandleSeries, candle: dict, closed: bool):
+        for listener in self._listeners:
+            try:
+                result = listener(series, candle, closed)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.logger.error(f"캔들 리스너 실패 ({series.symbol} {series.interval}): {e}")
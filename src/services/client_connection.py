@@ -0,0 +1,267 @@
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Set
+from fastapi import WebSocket
+from src.config.env import EnvConfig
+from src.utils.logger import LoggerMixin
+from src.utils.metrics import metrics_manager
+from src.utils.wire_format import Frame, WireFormat, join_frames
+
+# 배치 프레임의 송신 큐 키 (이전 배치가 전송되기 전에는 다음 배치를 만들지 않음)
+BATCH_KEY = '__batch__'
+
+class OverflowPolicy(str, Enum):
+    DROP_OLDEST = 'drop_oldest'   # 가장 오래된 메시지 버림
+    CONFLATE = 'conflate'         # 같은 키(심볼)는 최신 값만 유지
+    DISCONNECT = 'disconnect'     # 느린 클라이언트 연결 종료
+
+class Throttle:
+    """키(심볼)별 최대 전송 빈도 제한 상태"""
+    __slots__ = ('interval', 'last_sent', 'pending', 'timer')
+
+    def __init__(self, max_hz: float):
+        self.interval = 1.0 / max_hz
+        self.last_sent = 0.0
+        self.pending: Optional[Frame] = None
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+class ClientConnection(LoggerMixin):
+    """연결별 송신 큐와 전용 writer 태스크 (브로드캐스트는 논블로킹 enqueue)"""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_queue: int = None,
+        policy: OverflowPolicy = None,
+        on_close: Optional[Callable[['ClientConnection'], Awaitable[None]]] = None,
+        wire_format: WireFormat = WireFormat.JSON
+    ):
+        self.websocket = websocket
+        # 협상된 전송 포맷 (브로드캐스트는 포맷별로 한 번만 직렬화)
+        self.format = wire_format
+        self.max_queue = max_queue or EnvConfig.WS_SEND_QUEUE_SIZE
+        self.policy = OverflowPolicy(policy or EnvConfig.WS_OVERFLOW_POLICY)
+        client = getattr(websocket, 'client', None)
+        self.client_id = f"{client.host}:{client.port}" if client else str(id(websocket))
+        self.dropped = 0
+        self.closed = False
+        # 역인덱스: 이 연결이 구독 중인 심볼
+        self.subscriptions: Set[str] = set()
+        # 배치 전송 주기 (None이면 업데이트마다 개별 프레임)
+        self.batch_interval: Optional[float] = None
+        self._batch: Dict[Hashable, Frame] = {}
+        self._batch_timer: Optional[asyncio.TimerHandle] = None
+        self._on_close = on_close
+        # 각 항목: [conflation key, frame, enqueued_at]
+        self._queue: Deque[List] = deque()
+        self._pending: Dict[Hashable, List] = {}
+        self._throttles: Dict[Hashable, Throttle] = {}
+        self._ready = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self._closer: Optional[asyncio.Task] = None
+        # 라벨 조회 비용을 줄이기 위해 연결별 게이지를 미리 바인딩
+        self._lag_gauge = metrics_manager.ws_send_queue_lag.labels(client=self.client_id)
+        self._depth_gauge = metrics_manager.ws_send_queue_depth.labels(client=self.client_id)
+        self._metrics_at = 0.0
+        self._reported_depth = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    @property
+    def lag(self) -> float:
+        """가장 오래 대기 중인 메시지의 대기 시간 (초)"""
+        if not self._queue:
+            return 0.0
+        return time.monotonic() - self._queue[0][2]
+
+    def start(self):
+        """writer 태스크 시작"""
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_loop())
+
+    def set_rate(self, key: Hashable, max_hz: Optional[float]):
+        """키별 최대 전송 빈도 설정 (None이면 전체 속도)"""
+        throttle = self._throttles.pop(key, None)
+        if throttle and throttle.timer:
+            throttle.timer.cancel()
+        if max_hz:
+            self._throttles[key] = Throttle(max_hz)
+
+    def get_rate(self, key: Hashable) -> Optional[float]:
+        throttle = self._throttles.get(key)
+        return 1.0 / throttle.interval if throttle else None
+
+    def set_batch_interval(self, interval_ms: Optional[float]):
+        """배치 전송 주기 설정 (0/None이면 비활성화)"""
+        self.batch_interval = interval_ms / 1000 if interval_ms else None
+        if self.batch_interval is None:
+            self._flush_batch(force=True)
+
+    def enqueue(self, frame: Frame, key: Optional[Hashable] = None) -> bool:
+        """송신 큐에 프레임 추가 (블로킹 없음)"""
+        if self.closed:
+            return False
+
+        throttle = self._throttles.get(key) if key is not None else None
+        if throttle is not None:
+            now = time.monotonic()
+            if throttle.pending is None and now - throttle.last_sent >= throttle.interval:
+                throttle.last_sent = now
+                return self._deliver(frame, key)
+            # 전송 간격 내 업데이트는 최신 값으로 병합 후 다음 슬롯에 전송
+            if throttle.pending is not None:
+                metrics_manager.ws_messages_dropped.labels(policy='throttle').inc()
+            throttle.pending = frame
+            if throttle.timer is None:
+                throttle.timer = asyncio.get_running_loop().call_later(
+                    max(throttle.last_sent + throttle.interval - now, 0),
+                    self._flush_throttled,
+                    key
+                )
+            return True
+
+        return self._deliver(frame, key)
+
+    def _flush_throttled(self, key: Hashable):
+        """병합된 최신 프레임 전송"""
+        throttle = self._throttles.get(key)
+        if throttle is None or self.closed:
+            return
+        throttle.timer = None
+        frame, throttle.pending = throttle.pending, None
+        if frame is not None:
+            throttle.last_sent = time.monotonic()
+            self._deliver(frame, key)
+
+    def _deliver(self, frame: Frame, key: Optional[Hashable]) -> bool:
+        """배치 모드면 배치 버퍼에, 아니면 송신 큐에 추가"""
+        if (
+            self.batch_interval is None or key is None
+            or isinstance(frame, str) != (self.format == WireFormat.JSON)
+        ):
+            return self._enqueue(frame, key)
+        # 배치 주기 안의 같은 심볼 업데이트는 최신 값만 유지
+        self._batch[key] = frame
+        if self._batch_timer is None:
+            self._batch_timer = asyncio.get_running_loop().call_later(
+                self.batch_interval, self._flush_batch
+            )
+        return True
+
+    def _flush_batch(self, force: bool = False):
+        """배치 버퍼를 하나의 프레임으로 전송"""
+        if self._batch_timer:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        if not self._batch or self.closed:
+            return
+        if not force and BATCH_KEY in self._pending:
+            # 이전 배치가 아직 전송 대기 중이면 다음 주기까지 계속 병합
+            self._batch_timer = asyncio.get_running_loop().call_later(
+                self.batch_interval, self._flush_batch
+            )
+            return
+        frames = list(self._batch.values())
+        self._batch.clear()
+        self._enqueue(join_frames(frames, self.format), BATCH_KEY)
+
+    def _enqueue(self, frame: Frame, key: Optional[Hashable]) -> bool:
+        """송신 큐 추가 및 초과 정책 적용"""
+        if key is not None and self.policy == OverflowPolicy.CONFLATE:
+            entry = self._pending.get(key)
+            if entry is not None:
+                # 아직 전송되지 않은 같은 키의 메시지를 최신 값으로 교체
+                entry[1] = frame
+                metrics_manager.ws_messages_dropped.labels(policy=self.policy.value).inc()
+                self.dropped += 1
+                return True
+
+        if len(self._queue) >= self.max_queue:
+            if self.policy == OverflowPolicy.DISCONNECT:
+                self.logger.warning(f"느린 클라이언트 연결 종료: {self.client_id} (대기 {len(self._queue)}개)")
+                metrics_manager.ws_slow_consumer_disconnects.inc()
+                if self._closer is None:
+                    self._closer = asyncio.create_task(self.close(code=1013))
+                return False
+            dropped = self._queue.popleft()
+            if dropped[0] is not None and self._pending.get(dropped[0]) is dropped:
+                del self._pending[dropped[0]]
+            self.dropped += 1
+            metrics_manager.ws_messages_dropped.labels(policy=self.policy.value).inc()
+
+        entry = [key, frame, time.monotonic()]
+        self._queue.append(entry)
+        if key is not None:
+            self._pending[key] = entry
+        self._ready.set()
+        # writer가 멈춰 있어도 적체가 보이도록 enqueue 시점에 기록
+        self._record_metrics()
+        return True
+
+    def _record_metrics(self, force: bool = False):
+        """송신 큐 적체 게이지 기록 (최대 초당 한 번)"""
+        now = time.monotonic()
+        if not force and now - self._metrics_at < 1.0:
+            return
+        self._metrics_at = now
+        self._reported_depth = len(self._queue)
+        self._lag_gauge.set(self.lag)
+        self._depth_gauge.set(self._reported_depth)
+
+    async def _write_loop(self):
+        """큐에 쌓인 프레임을 순서대로 전송"""
+        try:
+            while not self.closed:
+                await self._ready.wait()
+                while self._queue:
+                    key, frame, _ = entry = self._queue.popleft()
+                    if key is not None and self._pending.get(key) is entry:
+                        del self._pending[key]
+
+                    if isinstance(frame, bytes):
+                        await self.websocket.send_bytes(frame)
+                    else:
+                        await self.websocket.send_text(frame)
+                self._ready.clear()
+                # 큐를 비운 뒤에는 마지막 적체 값이 남지 않도록 0으로 기록
+                if self._reported_depth:
+                    self._record_metrics(force=True)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.logger.error(f"WebSocket 송신 실패 ({self.client_id}): {e}")
+            await self.close()
+
+    async def close(self, code: int = 1000):
+        """writer 종료 및 연결 닫기"""
+        if self.closed:
+            return
+        self.closed = True
+        self._ready.set()
+        if self._writer and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        self._queue.clear()
+        self._pending.clear()
+        for throttle in self._throttles.values():
+            if throttle.timer:
+                throttle.timer.cancel()
+        self._throttles.clear()
+        if self._batch_timer:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        self._batch.clear()
+        for gauge in (metrics_manager.ws_send_queue_lag, metrics_manager.ws_send_queue_depth):
+            try:
+                gauge.remove(self.client_id)
+            except KeyError:
+                pass
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
+        if self._on_close:
+            await self._on_close(self)
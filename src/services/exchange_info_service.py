@@ -0,0 +1,112 @@
+import asyncio
+import hashlib
+import json
+import time
+from typing import Callable, Dict, List, Optional
+from src.config.env import EnvConfig
+from src.models.exchange import SymbolFilters
+from src.utils.logger import LoggerMixin
+
+class ExchangeInfoService(LoggerMixin):
+    """거래소 메타데이터 캐시 (TTL 기반 백그라운드 갱신)"""
+
+    def __init__(self, binance_service, ttl: float = None):
+        self.binance = binance_service
+        self.ttl = ttl if ttl is not None else EnvConfig.EXCHANGE_INFO_TTL
+        self.payload: Optional[dict] = None
+        self.body: bytes = b""
+        self.etag: Optional[str] = None
+        self.loaded_at: float = 0.0
+        self._symbols: Dict[str, SymbolFilters] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._listeners: List[Callable[[dict], None]] = []
+
+    def add_listener(self, listener: Callable[[dict], None]):
+        """갱신 시 호출될 리스너 등록"""
+        self._listeners.append(listener)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.payload is not None
+
+    async def start(self):
+        """최초 로드 후 백그라운드 갱신 시작"""
+        if not self.is_loaded:
+            await self.refresh()
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """백그라운드 갱신 중지"""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def _refresh_loop(self):
+        """TTL 주기로 거래소 정보 갱신"""
+        while True:
+            await asyncio.sleep(self.ttl)
+            try:
+                await self.refresh()
+            except Exception as e:
+                # 갱신 실패 시 기존 캐시를 계속 사용
+                self.logger.error(f"거래소 정보 갱신 실패: {e}")
+
+    async def refresh(self):
+        """거래소 정보 다운로드 및 인덱스 재구성"""
+        async with self._lock:
+            await self._refresh()
+
+    async def _refresh(self):
+        info = await self.binance._request("futures_exchange_info")
+        # serverTime은 매 호출마다 바뀌므로 캐시 본문/ETag에서 제외
+        info.pop("serverTime", None)
+
+        symbols = {}
+        for item in info.get("symbols", []):
+            try:
+                symbols[item["symbol"]] = SymbolFilters.from_binance(item)
+            except (KeyError, ValueError, ArithmeticError) as e:
+                self.logger.error(f"심볼 필터 파싱 실패: {e}, 데이터: {item.get('symbol')}")
+
+        body = json.dumps(info, separators=(",", ":")).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if etag != self.etag:
+            self.logger.info(f"거래소 정보 갱신 완료: {len(symbols)}개 심볼")
+
+        self.payload = info
+        self.body = body
+        self.etag = etag
+        self._symbols = symbols
+        self.loaded_at = time.time()
+
+        for listener in self._listeners:
+            listener(info)
+
+    async def ensure_loaded(self):
+        """캐시 로드 확인 (동시 호출 시 다운로드는 한 번만)"""
+        if self.is_loaded:
+            return
+        async with self._lock:
+            if not self.is_loaded:
+                await self._refresh()
+
+    def get_symbol(self, symbol: str) -> Optional[SymbolFilters]:
+        """심볼 필터 조회 (O(1))"""
+        return self._symbols.get(symbol)
+
+    def get_symbols(self) -> Dict[str, SymbolFilters]:
+        """전체 심볼 필터 인덱스"""
+        return self._symbols
+
+    def matches_etag(self, if_none_match: Optional[str]) -> bool:
+        """If-None-Match 헤더와 현재 ETag 비교"""
+        if not if_none_match or not self.etag:
+            return False
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or self.etag in candidates or f"W/{self.etag}" in candidates
@@ -0,0 +1,93 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from src.utils.logger import LoggerMixin
+from src.utils.metrics import metrics_manager
+
+# 대기열 항목: (작업 이름, 실행 함수, 결과 future, 등록 시각)
+Job = Tuple[str, Callable[[], Awaitable[Any]], asyncio.Future, float]
+
+class SymbolExecutor(LoggerMixin):
+    """심볼 하나의 주문 작업을 순서대로 실행하는 액터 (큐 + 전용 워커)"""
+
+    def __init__(self, symbol: str, on_idle: Optional[Callable[['SymbolExecutor'], None]] = None):
+        self.symbol = symbol
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        # 대기열을 모두 처리하고 워커가 끝날 때 호출 (유휴 액터 정리용)
+        self._on_idle = on_idle
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, name: str, job: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        """작업 등록 (완료 시 결과가 설정되는 future 반환)"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((name, job, future, time.perf_counter()))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        return future
+
+    async def stop(self):
+        if self._worker:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        while not self._queue.empty():
+            _, _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+    async def _run(self):
+        # 대기열이 비면 워커 종료 (다음 submit에서 다시 시작)
+        while not self._queue.empty():
+            name, job, future, enqueued_at = self._queue.get_nowait()
+            if future.cancelled():
+                continue
+            started_at = time.perf_counter()
+            queue_wait = started_at - enqueued_at
+            try:
+                result = await job()
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                execution_time = time.perf_counter() - started_at
+                metrics_manager.order_queue_wait.labels(symbol=self.symbol).observe(queue_wait)
+                metrics_manager.order_execution_time.labels(symbol=self.symbol, action=name).observe(execution_time)
+                self.logger.info(
+                    f"{name} 처리: {self.symbol} "
+                    f"(대기 {queue_wait * 1000:.1f}ms, 실행 {execution_time * 1000:.1f}ms)"
+                )
+        if self._on_idle:
+            self._on_idle(self)
+
+class ExecutionPipeline:
+    """심볼별 실행 액터 모음 (같은 심볼은 직렬 실행, 다른 심볼은 병렬 실행)"""
+
+    def __init__(self):
+        self.executors: Dict[str, SymbolExecutor] = {}
+
+    async def run(self, symbol: str, name: str, job: Callable[[], Awaitable[Any]]) -> Any:
+        """심볼 액터에 작업을 넣고 완료까지 대기"""
+        executor = self.executors.get(symbol)
+        if executor is None:
+            executor = self.executors[symbol] = SymbolExecutor(symbol, on_idle=self._retire)
+        return await executor.submit(name, job)
+
+    def _retire(self, executor: SymbolExecutor):
+        """대기 작업이 없는 액터 제거 (거쳐 간 심볼 수만큼 큐/워커가 쌓이지 않도록)"""
+        if self.executors.get(executor.symbol) is executor and executor.pending == 0:
+            del self.executors[executor.symbol]
+
+    async def stop(self):
+        for executor in self.executors.values():
+            await executor.stop()
+        self.executors.clear()
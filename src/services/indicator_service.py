@@ -0,0 +1,262 @@
+import asyncio
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from src.config.env import EnvConfig
+from src.models.settings import IndicatorConfig
+from src.services.candle_service import CandleSeries, CandleService
+from src.utils.logger import LoggerMixin
+
+DAY_MS = 86_400_000
+
+IndicatorListener = Callable[[str, List[dict]], None]
+
+class IndicatorBank:
+    """같은 종류/주기의 지표 상태를 열 벡터로 보관해 여러 심볼을 한 번에 갱신"""
+
+    def __init__(self, kind: str, interval: str, slots: List[Tuple[str, int]]):
+        self.kind = kind
+        self.interval = interval
+        self.slots = slots
+        size = len(slots)
+        self.period = np.array([period for _, period in slots], dtype=np.float64)
+        self.count = np.zeros(size, dtype=np.int64)
+        # 종류별 상태 (ema: [ema], rsi: [평균 상승, 평균 하락, 직전 종가], atr: [atr, 직전 종가], vwap: [Σpv, Σv, 일자])
+        self.state = np.zeros((3, size), dtype=np.float64)
+        # 마감 캔들 기준 값과 진행 중 캔들을 포함한 값
+        self.value = np.full(size, np.nan)
+        self.live = np.full(size, np.nan)
+        self.rows_by_symbol: Dict[str, np.ndarray] = {}
+        rows: Dict[str, List[int]] = {}
+        for row, (symbol, _) in enumerate(slots):
+            rows.setdefault(symbol, []).append(row)
+        for symbol, symbol_rows in rows.items():
+            self.rows_by_symbol[symbol] = np.array(symbol_rows, dtype=np.int64)
+
+    def reset(self, rows: np.ndarray):
+        self.count[rows] = 0
+        self.state[:, rows] = 0.0
+        self.value[rows] = np.nan
+        self.live[rows] = np.nan
+
+    def step(self, rows: np.ndarray, candles: np.ndarray, commit: bool):
+        """rows에 캔들 반영 (candles 열: openTime, high, low, close, volume; commit=False면 임시 값만 계산)"""
+        open_time, high, low, close, volume = candles
+        n = self.period[rows]
+        count = self.count[rows]
+        state = self.state[:, rows]
+
+        if self.kind == 'ema':
+            alpha = 2.0 / (n + 1.0)
+            ema = np.where(count == 0, close, state[0] + alpha * (close - state[0]))
+            new_state = (ema, state[1], state[2])
+            value = ema
+            ready = count + 1 >= n
+        elif self.kind == 'rsi':
+            # 첫 캔들은 기준 종가만, period개 변화량까지 단순 평균, 이후 Wilder 평활
+            delta = np.where(count == 0, 0.0, close - state[2])
+            m = np.maximum(np.minimum(count, n), 1.0)
+            gain = np.where(count == 0, 0.0, (state[0] * (m - 1) + np.maximum(delta, 0.0)) / m)
+            loss = np.where(count == 0, 0.0, (state[1] * (m - 1) + np.maximum(-delta, 0.0)) / m)
+            new_state = (gain, loss, close)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                value = np.where(
+                    loss == 0,
+                    np.where(gain == 0, 50.0, 100.0),
+                    100.0 - 100.0 / (1.0 + gain / loss)
+                )
+            ready = count >= n
+        elif self.kind == 'atr':
+            true_range = np.where(
+                count == 0,
+                high - low,
+                np.maximum(high - low, np.maximum(np.abs(high - state[1]), np.abs(low - state[1])))
+            )
+            m = np.minimum(count + 1, n)
+            atr = (state[0] * (m - 1) + true_range) / m
+            new_state = (atr, close, state[2])
+            value = atr
+            ready = count + 1 >= n
+        else:
+            # 세션(UTC 일) 단위 누적 VWAP
+            day = open_time // DAY_MS
+            reset = (count == 0) | (day != state[2])
+            pv = np.where(reset, 0.0, state[0]) + (high + low + close) / 3.0 * volume
+            vol = np.where(reset, 0.0, state[1]) + volume
+            new_state = (pv, vol, day)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                value = np.where(vol > 0, pv / vol, close)
+            ready = np.ones(len(rows), dtype=bool)
+
+        value = np.where(ready, value, np.nan)
+        if commit:
+            self.state[:, rows] = np.vstack(new_state)
+            self.count[rows] = count + 1
+            self.value[rows] = value
+        self.live[rows] = value
+
+class IndicatorService(LoggerMixin):
+    """스트리밍 캔들로 심볼/주기별 지표를 O(1) 증분 갱신하는 엔진 (틱마다 벡터화 일괄 처리)"""
+
+    def __init__(self, candles: CandleService, tick_interval: float = None):
+        self.candles = candles
+        self.tick_interval = (
+            tick_interval if tick_interval is not None else EnvConfig.INDICATOR_TICK_MS / 1000
+        )
+        self.config: Dict[str, List[IndicatorConfig]] = {}
+        self.banks: Dict[Tuple[str, str], IndicatorBank] = {}
+        self.updated_at: Dict[str, float] = {}
+        # 다음 틱에 반영할 캔들 (마감 캔들은 순서대로, 진행 중 캔들은 최신 값만)
+        self._closed: Dict[Tuple[str, str], List[dict]] = {}
+        self._live: Dict[Tuple[str, str], dict] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._listeners: List[IndicatorListener] = []
+        self._lock = asyncio.Lock()
+        candles.add_listener(self._on_candle)
+        candles.add_history_listener(self._on_history)
+
+    def add_listener(self, listener: IndicatorListener):
+        """지표 갱신 리스너 등록 (symbol, values)"""
+        self._listeners.append(listener)
+
+    async def configure(self, indicators: Dict[str, List[IndicatorConfig]]):
+        """설정의 심볼별 지표 선언 적용 (캔들 집계 구독도 함께 조정)"""
+        async with self._lock:
+            for config in (c for configs in indicators.values() for c in configs):
+                if config.interval not in self.candles.intervals:
+                    raise ValueError(f"unsupported indicator interval: {config.interval}")
+
+            previous = set(self.config)
+            self.config = {symbol: list(configs) for symbol, configs in indicators.items() if configs}
+            grouped: Dict[Tuple[str, str], List[Tuple[str, int]]] = {}
+            for symbol, configs in self.config.items():
+                for config in configs:
+                    grouped.setdefault((config.type, config.interval), []).append((symbol, config.period))
+            self.banks = {
+                key: IndicatorBank(key[0], key[1], slots) for key, slots in grouped.items()
+            }
+            self._closed.clear()
+            self._live.clear()
+
+            current = set(self.config)
+            for symbol in current - previous:
+                await self.candles.acquire(symbol)
+            for symbol in previous - current:
+                await self.candles.release(symbol)
+            # 이미 집계 중인 심볼은 보유 이력으로 즉시 초기화
+            for symbol in current:
+                self._on_history(symbol)
+            self.logger.info(
+                f"지표 설정 적용: 심볼 {len(current)}개, 지표 {sum(len(b.slots) for b in self.banks.values())}개"
+            )
+
+    async def stop(self):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        for symbol in self.config:
+            await self.candles.release(symbol)
+        self.config = {}
+        self.banks = {}
+
+    def get_values(self, symbol: str) -> List[dict]:
+        """심볼 지표 값 (value: 마감 캔들 기준, live: 진행 중 캔들 포함)"""
+        values = []
+        for bank in self.banks.values():
+            for row in bank.rows_by_symbol.get(symbol, ()):
+                values.append({
+                    'type': bank.kind,
+                    'interval': bank.interval,
+                    'period': int(bank.period[row]),
+                    'value': _to_float(bank.value[row]),
+                    'live': _to_float(bank.live[row])
+                })
+        return values
+
+    def _on_candle(self, series: CandleSeries, candle: dict, closed: bool):
+        """캔들 갱신 수집 (다음 틱에 일괄 반영)"""
+        if series.symbol not in self.config:
+            return
+        key = (series.symbol, series.interval)
+        if closed:
+            self._closed.setdefault(key, []).append(candle)
+        else:
+            self._live[key] = candle
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.tick_interval, self.flush)
+
+    def _on_history(self, symbol: str):
+        """과거 이력 로드 시 해당 심볼 지표를 이력 전체로 재계산"""
+        if symbol not in self.config:
+            return
+        for (kind, interval), bank in self.banks.items():
+            rows = bank.rows_by_symbol.get(symbol)
+            series = self.candles.get_series(symbol, interval)
+            if rows is None or series is None:
+                continue
+            bank.reset(rows)
+            open_time, values = series.history()
+            # 마지막 슬롯은 진행 중 캔들
+            for i in range(len(open_time) - 1):
+                bank.step(rows, _columns(open_time[i], values[i], len(rows)), commit=True)
+            if len(open_time):
+                bank.step(rows, _columns(open_time[-1], values[-1], len(rows)), commit=False)
+            self._closed.pop((symbol, interval), None)
+
+    def flush(self):
+        """수집된 캔들을 지표 종류/주기별로 한 번의 벡터 연산으로 반영"""
+        self._timer = None
+        closed, self._closed = self._closed, {}
+        live, self._live = self._live, {}
+        updated = {symbol for symbol, _ in closed} | {symbol for symbol, _ in live}
+
+        for (kind, interval), bank in self.banks.items():
+            # 마감 캔들은 심볼별 순서를 지키도록 라운드 단위로 반영
+            pending = {
+                symbol: candles for (symbol, candle_interval), candles in closed.items()
+                if candle_interval == interval and symbol in bank.rows_by_symbol
+            }
+            round_index = 0
+            while pending:
+                self._apply(bank, {s: c[round_index] for s, c in pending.items()}, commit=True)
+                round_index += 1
+                pending = {s: c for s, c in pending.items() if len(c) > round_index}
+
+            latest = {
+                symbol: candle for (symbol, candle_interval), candle in live.items()
+                if candle_interval == interval and symbol in bank.rows_by_symbol
+            }
+            if latest:
+                self._apply(bank, latest, commit=False)
+
+        now = time.time()
+        for symbol in updated:
+            self.updated_at[symbol] = now
+            values = self.get_values(symbol)
+            for listener in self._listeners:
+                try:
+                    listener(symbol, values)
+                except Exception as e:
+                    self.logger.error(f"지표 리스너 실패 ({symbol}): {e}")
+
+    @staticmethod
+    def _apply(bank: IndicatorBank, candles: Dict[str, dict], commit: bool):
+        rows = [bank.rows_by_symbol[symbol] for symbol in candles]
+        sizes = [len(r) for r in rows]
+        columns = np.repeat(
+            np.array([
+                [c['openTime'], c['high'], c['low'], c['close'], c['volume']]
+                for c in candles.values()
+            ], dtype=np.float64),
+            sizes,
+            axis=0
+        ).T
+        bank.step(np.concatenate(rows), columns, commit)
+
+def _columns(open_time, values: np.ndarray, size: int) -> np.ndarray:
+    """이력 한 행을 step 입력 열로 변환"""
+    row = np.array([open_time, values[1], values[2], values[3], values[4]], dtype=np.float64)
+    return np.repeat(row[:, None], size, axis=1)
+
+def _to_float(value) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
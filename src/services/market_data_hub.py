@@ -0,0 +1,117 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+from src.config.env import EnvConfig
+from src.services.binance_stream import BinanceStreamClient
+from src.utils.logger import LoggerMixin
+
+ALL_MARK_PRICE_STREAM = "!markPrice@arr@1s"
+
+MarkPriceListener = Callable[[dict], Union[None, Awaitable[None]]]
+
+class MarketDataHub(LoggerMixin):
+    """심볼별 업스트림 마크 가격 구독을 참조 카운팅으로 공유하는 허브"""
+
+    def __init__(self, streams: BinanceStreamClient, all_market_threshold: int = None):
+        self.streams = streams
+        # 구독 심볼 수가 이 값 이상이면 전체 마크 가격 스트림 하나로 전환
+        self.all_market_threshold = (
+            all_market_threshold if all_market_threshold is not None
+            else EnvConfig.MARK_PRICE_ALL_MARKET_THRESHOLD
+        )
+        self.latest: Dict[str, dict] = {}
+        self._refcounts: Dict[str, int] = {}
+        self._listeners: List[MarkPriceListener] = []
+        self._all_market = False
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def _stream_name(symbol: str) -> str:
+        return f"{symbol.lower()}@markPrice@1s"
+
+    def add_listener(self, listener: MarkPriceListener):
+        """마크 가격 업데이트 리스너 등록"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: MarkPriceListener):
+        """마크 가격 업데이트 리스너 제거"""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def get_subscriber_count(self, symbol: str) -> int:
+        return self._refcounts.get(symbol, 0)
+
+    def get_mark_price(self, symbol: str) -> Optional[dict]:
+        """최근 마크 가격 (구독 중인 심볼만)"""
+        return self.latest.get(symbol)
+
+    async def acquire(self, symbol: str):
+        """심볼 구독 (첫 구독자일 때만 업스트림 구독)"""
+        async with self._lock:
+            count = self._refcounts.get(symbol, 0) + 1
+            self._refcounts[symbol] = count
+            if count > 1:
+                return
+            if self._all_market:
+                return
+            if len(self._refcounts) >= self.all_market_threshold:
+                await self._switch_to_all_market()
+            else:
+                await self.streams.subscribe(self._stream_name(symbol), self._on_mark_price)
+
+    async def release(self, symbol: str):
+        """심볼 구독 해제 (마지막 구독자일 때 업스트림 해제)"""
+        async with self._lock:
+            count = self._refcounts.get(symbol, 0) - 1
+            if count > 0:
+                self._refcounts[symbol] = count
+                return
+            self._refcounts.pop(symbol, None)
+            self.latest.pop(symbol, None)
+            if not self._all_market:
+                await self.streams.unsubscribe(self._stream_name(symbol))
+            elif len(self._refcounts) <= self.all_market_threshold // 2:
+                await self._switch_to_symbol_streams()
+
+    async def _switch_to_all_market(self):
+        """심볼별 스트림을 전체 마크 가격 스트림으로 교체"""
+        self._all_market = True
+        await self.streams.subscribe(ALL_MARK_PRICE_STREAM, self._on_mark_price)
+        for symbol in self._refcounts:
+            await self.streams.unsubscribe(self._stream_name(symbol))
+        self.logger.info(f"전체 마크 가격 스트림으로 전환 (구독 심볼: {len(self._refcounts)}개)")
+
+    async def _switch_to_symbol_streams(self):
+        """전체 마크 가격 스트림을 심볼별 스트림으로 교체"""
+        for symbol in self._refcounts:
+            await self.streams.subscribe(self._stream_name(symbol), self._on_mark_price)
+        await self.streams.unsubscribe(ALL_MARK_PRICE_STREAM)
+        self._all_market = False
+        self.logger.info(f"심볼별 마크 가격 스트림으로 전환 (구독 심볼: {len(self._refcounts)}개)")
+
+    async def _on_mark_price(self, data: Union[dict, list]):
+        """업스트림 마크 가격 이벤트 처리"""
+        events = data if isinstance(data, list) else [data]
+        for event in events:
+            symbol = event.get("s")
+            if symbol not in self._refcounts:
+                continue
+            update = {
+                "symbol": symbol,
+                "price": event["p"],
+                "index_price": event.get("i"),
+                "funding_rate": event.get("r"),
+                "next_funding_time": event.get("T"),
+                "timestamp": event.get("E")
+            }
+            self.latest[symbol] = update
+            await self._notify(update)
+
+    async def _notify(self, update: dict):
+        """구독자에게 팬아웃"""
+        for listener in self._listeners:
+            try:
+                result = listener(update)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.logger.error(f"마크 가격 리스너 실패 ({update['symbol']}): {e}")
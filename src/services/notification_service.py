@@ -1,6 +1,17 @@
+import asyncio
+from typing import Optional
 from telegram import Bot
 from src.config.env import EnvConfig
 from src.utils.logger import logger, LoggerMixin
+from src.utils.metrics import metrics_manager
+
+# 알림 레벨별 접두어
+ALERT_PREFIXES = {
+    "INFO": "ℹ️",
+    "SUCCESS": "✅",
+    "WARNING": "⚠️",
+    "ERROR": "🚨"
+}
 
 class NotificationService(LoggerMixin):
     def __init__(self):
@@ -8,6 +19,9 @@ class NotificationService(LoggerMixin):
         self._initialized = False
         self.enabled = bool(getattr(EnvConfig, 'TELEGRAM_BOT_TOKEN', None) and 
                           getattr(EnvConfig, 'TELEGRAM_CHAT_ID', None))
+        # 주문 경로에서 넣고 백그라운드 디스패처가 전송하는 알림 아웃박스
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=EnvConfig.NOTIFICATION_OUTBOX_SIZE)
+        self._dispatcher: Optional[asyncio.Task] = None
 
     async def initialize(self):
         """텔레그램 봇 초기화"""
@@ -40,8 +54,65 @@ class NotificationService(LoggerMixin):
         if not self._initialized and self.enabled:
             await self.initialize()
 
-    async def send_message(self, message: str):
+    async def start(self):
+        """아웃박스 디스패처 시작"""
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    def notify(self, message: str, alert_level: str = "INFO") -> bool:
+        """알림을 아웃박스에 넣고 즉시 반환 (가득 차면 버림)"""
+        if not self.enabled:
+            self.logger.debug(f"텔레그램 알림 비활성화 상태에서 메시지 시도: {message}")
+            return False
+        try:
+            self._outbox.put_nowait((message, alert_level))
+        except asyncio.QueueFull:
+            metrics_manager.notifications_dropped.inc()
+            self.logger.warning(f"알림 아웃박스 초과로 메시지 버림: {message}")
+            return False
+        metrics_manager.notification_outbox_depth.set(self._outbox.qsize())
+        return True
+
+    def send_trade_notification(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: float,
+        pnl: Optional[float] = None
+    ) -> bool:
+        """체결 알림"""
+        message = f"📈 {symbol} {side} {quantity} @ {price}"
+        if pnl is not None:
+            message += f"\nPnL: {pnl:+.2f} USDT"
+        return self.notify(message, alert_level="SUCCESS")
+
+    def send_position_update(self, symbol: str, side: str, unrealized_pnl: float) -> bool:
+        """포지션 변동 알림"""
+        return self.notify(f"📊 {symbol} {side} 미실현 손익: {unrealized_pnl:+.2f} USDT")
+
+    def send_error_notification(self, error: Exception) -> bool:
+        """오류 알림"""
+        return self.notify(f"{type(error).__name__}: {error}", alert_level="ERROR")
+
+    async def _dispatch(self):
+        """아웃박스를 비우며 텔레그램 전송 (실패는 메트릭으로 집계하고 계속 진행)"""
+        while True:
+            message, alert_level = await self._outbox.get()
+            metrics_manager.notification_outbox_depth.set(self._outbox.qsize())
+            try:
+                await self.send_message(message, alert_level=alert_level)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                metrics_manager.notifications_failed.inc()
+            finally:
+                self._outbox.task_done()
+
+    async def send_message(self, message: str, alert_level: Optional[str] = None):
         """메시지 전송"""
+        if alert_level in ALERT_PREFIXES:
+            message = f"{ALERT_PREFIXES[alert_level]} {message}"
         if not self.enabled:
             self.logger.debug(f"텔레그램 알림 비활성화 상태에서 메시지 시도: {message}")
             return
@@ -58,8 +129,16 @@ class NotificationService(LoggerMixin):
             self.logger.error(f"텔레그램 메시지 전송 실패: {e}")
             raise
 
-    async def cleanup(self):
-        """리소스 정리"""
+    async def cleanup(self, timeout: float = 5.0):
+        """리소스 정리 (아웃박스에 남은 알림은 timeout까지 전송)"""
+        if self._dispatcher:
+            try:
+                await asyncio.wait_for(self._outbox.join(), timeout)
+            except asyncio.TimeoutError:
+                self.logger.warning(f"전송하지 못한 알림 {self._outbox.qsize()}개 폐기")
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, return_exceptions=True)
+            self._dispatcher = None
         if self.bot and self._initialized:
             self._initialized = False
             self.bot = None
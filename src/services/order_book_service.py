@@ -0,0 +1,258 @@
+import asyncio
+from array import array
+from bisect import bisect_left
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+from src.config.env import EnvConfig
+from src.services.binance_stream import BinanceStreamClient
+from src.utils.logger import LoggerMixin
+from src.utils.metrics import metrics_manager
+
+# 스냅샷 대기 중 버퍼링하는 최대 diff 이벤트 수 (100ms 기준 약 100초)
+MAX_BUFFERED_EVENTS = 1000
+
+OrderBookListener = Callable[['OrderBook'], Union[None, Awaitable[None]]]
+
+class SideBook:
+    """가격 오름차순으로 정렬된 배열 기반 호가 단계 (bisect로 갱신)"""
+    __slots__ = ('prices', 'quantities')
+
+    def __init__(self):
+        self.prices = array('d')
+        self.quantities = array('d')
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def clear(self):
+        del self.prices[:]
+        del self.quantities[:]
+
+    def load(self, levels: List[List[str]]):
+        """스냅샷 호가 적재"""
+        self.clear()
+        for price, quantity in sorted((float(p), float(q)) for p, q in levels):
+            if quantity > 0:
+                self.prices.append(price)
+                self.quantities.append(quantity)
+
+    def update(self, price: float, quantity: float):
+        """호가 단계 갱신 (수량 0이면 삭제)"""
+        i = bisect_left(self.prices, price)
+        if i < len(self.prices) and self.prices[i] == price:
+            if quantity == 0:
+                del self.prices[i]
+                del self.quantities[i]
+            else:
+                self.quantities[i] = quantity
+        elif quantity > 0:
+            self.prices.insert(i, price)
+            self.quantities.insert(i, quantity)
+
+    def lowest(self, n: int) -> List[List[float]]:
+        return [[self.prices[i], self.quantities[i]] for i in range(min(n, len(self.prices)))]
+
+    def highest(self, n: int) -> List[List[float]]:
+        last = len(self.prices) - 1
+        return [[self.prices[last - i], self.quantities[last - i]] for i in range(min(n, len(self.prices)))]
+
+class OrderBook:
+    """REST 스냅샷 + diff depth 이벤트로 유지되는 로컬 L2 호가창"""
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.bids = SideBook()
+        self.asks = SideBook()
+        self.last_update_id = 0
+        self.event_time = 0
+        self.synced = False
+        # 스냅샷 적용 후 마지막으로 반영한 이벤트의 u (pu 연속성 검사용)
+        self._prev_final: Optional[int] = None
+
+    def load_snapshot(self, snapshot: dict):
+        """REST 스냅샷 적용"""
+        self.bids.load(snapshot.get('bids', []))
+        self.asks.load(snapshot.get('asks', []))
+        self.last_update_id = int(snapshot['lastUpdateId'])
+        self.event_time = int(snapshot.get('E', 0))
+        self._prev_final = None
+        self.synced = True
+
+    def reset(self):
+        """시퀀스 공백 발생 시 재동기화 대기 상태로 전환"""
+        self.synced = False
+        self._prev_final = None
+
+    def apply_diff(self, event: dict) -> bool:
+        """diff depth 이벤트 적용 (시퀀스 공백이면 False)"""
+        first, final = int(event['U']), int(event['u'])
+        if final < self.last_update_id:
+            # 스냅샷에 이미 반영된 이벤트
+            return True
+        if self._prev_final is None:
+            # 스냅샷 이후 첫 이벤트는 U <= lastUpdateId <= u 이어야 함
+            if first > self.last_update_id:
+                return False
+        elif int(event.get('pu', -1)) != self._prev_final:
+            return False
+
+        for price, quantity in event.get('b', []):
+            self.bids.update(float(price), float(quantity))
+        for price, quantity in event.get('a', []):
+            self.asks.update(float(price), float(quantity))
+        self._prev_final = final
+        self.last_update_id = final
+        self.event_time = int(event.get('E', self.event_time))
+        return True
+
+    def top(self, depth: int) -> dict:
+        """상위 N 단계 호가"""
+        return {
+            'symbol': self.symbol,
+            'lastUpdateId': self.last_update_id,
+            'timestamp': self.event_time,
+            'bids': self.bids.highest(depth),
+            'asks': self.asks.lowest(depth)
+        }
+
+class OrderBookService(LoggerMixin):
+    """심볼별 로컬 호가창을 참조 카운팅으로 공유하는 서비스 (업스트림 구독 1개/심볼)"""
+
+    def __init__(self, binance_service, streams: BinanceStreamClient, snapshot_limit: int = None):
+        self.binance = binance_service
+        self.streams = streams
+        self.snapshot_limit = snapshot_limit or EnvConfig.ORDER_BOOK_SNAPSHOT_LIMIT
+        self.books: Dict[str, OrderBook] = {}
+        self._refcounts: Dict[str, int] = {}
+        # 스냅샷 수신 전 도착한 diff 이벤트
+        self._buffers: Dict[str, List[dict]] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._listeners: List[OrderBookListener] = []
+        self._lock = asyncio.Lock()
+        self.streams.add_reconnect_listener(self._on_reconnect)
+
+    @staticmethod
+    def _stream_name(symbol: str) -> str:
+        return f"{symbol.lower()}@depth@100ms"
+
+    def add_listener(self, listener: OrderBookListener):
+        """호가창 갱신 리스너 등록"""
+        self._listeners.append(listener)
+
+    def get_book(self, symbol: str) -> Optional[OrderBook]:
+        """동기화된 호가창 (구독 중이 아니거나 재동기화 중이면 None)"""
+        book = self.books.get(symbol)
+        return book if book and book.synced else None
+
+    async def acquire(self, symbol: str):
+        """심볼 호가창 구독 (첫 구독자일 때만 업스트림 구독 및 스냅샷)"""
+        async with self._lock:
+            count = self._refcounts.get(symbol, 0) + 1
+            self._refcounts[symbol] = count
+            if count > 1:
+                return
+            self.books[symbol] = OrderBook(symbol)
+            self._buffers[symbol] = []
+            await self.streams.subscribe(self._stream_name(symbol), partial(self._on_depth, symbol))
+            self._schedule_resync(symbol)
+
+    async def release(self, symbol: str):
+        """심볼 호가창 구독 해제 (마지막 구독자일 때 업스트림 해제)"""
+        async with self._lock:
+            count = self._refcounts.get(symbol, 0) - 1
+            if count > 0:
+                self._refcounts[symbol] = count
+                return
+            self._refcounts.pop(symbol, None)
+            self.books.pop(symbol, None)
+            self._buffers.pop(symbol, None)
+            task = self._resync_tasks.pop(symbol, None)
+            if task:
+                task.cancel()
+            await self.streams.unsubscribe(self._stream_name(symbol))
+
+    async def stop(self):
+        """재동기화 태스크 정리"""
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
+        self.books.clear()
+        self._buffers.clear()
+        self._refcounts.clear()
+
+    def _schedule_resync(self, symbol: str):
+        task = self._resync_tasks.get(symbol)
+        if task is None or task.done():
+            self._resync_tasks[symbol] = asyncio.create_task(self._resync(symbol))
+
+    async def _on_reconnect(self):
+        """업스트림 재연결 시 모든 호가창 재동기화"""
+        for symbol, book in self.books.items():
+            book.reset()
+            self._buffers[symbol] = []
+            self._schedule_resync(symbol)
+
+    async def _on_depth(self, symbol: str, event: dict):
+        """diff depth 이벤트 처리"""
+        book = self.books.get(symbol)
+        if book is None:
+            return
+        if not book.synced:
+            buffer = self._buffers[symbol]
+            buffer.append(event)
+            if len(buffer) > MAX_BUFFERED_EVENTS:
+                # 재동기화가 길어지면 오래된 이벤트 버림 (다음 스냅샷이 대체)
+                del buffer[0]
+            return
+        if not book.apply_diff(event):
+            self.logger.warning(
+                f"호가창 시퀀스 공백 감지, 재동기화: {symbol} "
+                f"(pu: {event.get('pu')}, last: {book.last_update_id})"
+            )
+            metrics_manager.order_book_resyncs.labels(symbol=symbol).inc()
+            book.reset()
+            self._buffers[symbol] = [event]
+            self._schedule_resync(symbol)
+            return
+        await self._notify(book)
+
+    async def _resync(self, symbol: str):
+        """REST 스냅샷을 받아 버퍼링된 이벤트를 이어서 적용 (성공하거나 구독 해제될 때까지 재시도)"""
+        attempt = 0
+        while True:
+            book = self.books.get(symbol)
+            if book is None:
+                return
+            try:
+                await self.binance._ensure_initialized()
+                snapshot = await self.binance._request(
+                    "futures_order_book", symbol=symbol, limit=self.snapshot_limit
+                )
+            except Exception as e:
+                self.logger.error(f"호가창 스냅샷 조회 실패 ({symbol}): {e}")
+                attempt += 1
+                await asyncio.sleep(min(2 ** attempt, 30))
+                continue
+
+            if self.books.get(symbol) is not book:
+                return
+            book.load_snapshot(snapshot)
+            buffered, self._buffers[symbol] = self._buffers[symbol], []
+            if all(book.apply_diff(event) for event in buffered):
+                self.logger.info(f"호가창 동기화 완료: {symbol} (lastUpdateId: {book.last_update_id})")
+                await self._notify(book)
+                return
+
+            # 스냅샷이 버퍼 시작보다 오래됨: 이후 이벤트를 다시 모아 재시도
+            book.reset()
+            attempt += 1
+            await asyncio.sleep(min(0.5 * attempt, 30))
+
+    async def _notify(self, book: OrderBook):
+        for listener in self._listeners:
+            try:
+                result = listener(book)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.logger.error(f"호가창 리스너 실패 ({book.symbol}): {e}")
@@ -0,0 +1,78 @@
+from decimal import Decimal, ROUND_DOWN, ROUND_UP
+from typing import Optional
+from src.models.exchange import SymbolFilters
+from src.models.trading import OrderRequest
+from src.services.exchange_info_service import ExchangeInfoService
+from src.utils.exceptions import ValidationError
+from src.utils.metrics import metrics_manager
+
+# 거래소 정보에 없는 심볼 거부 시 메트릭 심볼 라벨
+UNKNOWN_SYMBOL_LABEL = 'UNKNOWN'
+
+def quantize_to_step(value: Decimal, step: Decimal, rounding: str = ROUND_DOWN) -> Decimal:
+    """값을 step의 정수배로 정확히 맞춤 (step이 0이면 그대로)"""
+    if not step:
+        return value
+    return ((value / step).to_integral_value(rounding=rounding) * step).quantize(step)
+
+class OrderValidator:
+    """캐시된 심볼 필터로 주문 수량/가격을 정규화하고 규칙 위반 주문을 로컬에서 거부"""
+
+    def __init__(self, exchange_info: ExchangeInfoService):
+        self.exchange_info = exchange_info
+
+    @staticmethod
+    def _reject(symbol: str, reason: str, message: str):
+        metrics_manager.orders_rejected_locally.labels(symbol=symbol, reason=reason).inc()
+        raise ValidationError(f"{reason}: {message}")
+
+    def normalize(self, order: OrderRequest, mark_price: Optional[Decimal] = None) -> OrderRequest:
+        """stepSize/tickSize에 맞춘 주문 사본 반환 (LOT_SIZE, MARKET_LOT_SIZE, PRICE_FILTER, MIN_NOTIONAL 위반 시 ValidationError)"""
+        symbol = order.symbol
+        filters = self.exchange_info.get_symbol(symbol)
+        if filters is None:
+            # 임의 입력 심볼이 메트릭 라벨을 늘리지 않도록 고정 라벨 사용
+            self._reject(UNKNOWN_SYMBOL_LABEL, "SYMBOL", f"알 수 없는 심볼 {symbol}")
+        if not filters.is_trading:
+            self._reject(symbol, "SYMBOL", f"거래 중이 아닌 심볼 {symbol} ({filters.status})")
+
+        quantity = self._normalize_quantity(order, filters)
+        price = None
+        if order.type == 'LIMIT':
+            if not order.price:
+                self._reject(symbol, "PRICE_FILTER", "지정가 주문에는 price가 필요합니다")
+            price = self._normalize_price(order, filters)
+
+        # 최소 주문 금액 (시장가는 마크 가격을 알 때만 검사)
+        reference = price if price is not None else mark_price
+        if filters.min_notional and reference is not None and quantity * reference < filters.min_notional:
+            self._reject(
+                symbol, "MIN_NOTIONAL",
+                f"주문 금액 {quantity * reference} < 최소 {filters.min_notional}"
+            )
+
+        return order.copy(update={"quantity": quantity, "price": price if price is not None else order.price})
+
+    def _normalize_quantity(self, order: OrderRequest, filters: SymbolFilters) -> Decimal:
+        """수량을 stepSize 배수로 내림 (시장가는 MARKET_LOT_SIZE 우선)"""
+        step, min_qty, max_qty, rule = filters.step_size, filters.min_qty, filters.max_qty, "LOT_SIZE"
+        if order.type == 'MARKET' and filters.market_step_size:
+            step, min_qty, max_qty, rule = (
+                filters.market_step_size, filters.market_min_qty, filters.market_max_qty, "MARKET_LOT_SIZE"
+            )
+        quantity = quantize_to_step(order.quantity, step, ROUND_DOWN)
+        if quantity <= 0 or quantity < min_qty:
+            self._reject(order.symbol, rule, f"수량 {order.quantity} → {quantity} < 최소 {min_qty}")
+        if max_qty and quantity > max_qty:
+            self._reject(order.symbol, rule, f"수량 {quantity} > 최대 {max_qty}")
+        return quantity
+
+    def _normalize_price(self, order: OrderRequest, filters: SymbolFilters) -> Decimal:
+        """가격을 tickSize 배수로 맞춤 (매수는 내림, 매도는 올림: 지정가보다 불리하지 않게)"""
+        rounding = ROUND_DOWN if order.side == 'BUY' else ROUND_UP
+        price = quantize_to_step(order.price, filters.tick_size, rounding)
+        if price <= 0 or (filters.min_price and price < filters.min_price):
+            self._reject(order.symbol, "PRICE_FILTER", f"가격 {price} < 최소 {filters.min_price}")
+        if filters.max_price and price > filters.max_price:
+            self._reject(order.symbol, "PRICE_FILTER", f"가격 {price} > 최대 {filters.max_price}")
+        return price
@@ -0,0 +1,245 @@
+import asyncio
+import time
+from enum import IntEnum
+from typing import Dict, List, Optional
+from src.config.env import EnvConfig
+from src.utils.exceptions import RateLimitError
+from src.utils.logger import LoggerMixin
+from src.utils.metrics import metrics_manager
+
+class RequestPriority(IntEnum):
+    ORDER = 0
+    READ = 1
+
+# 엔드포인트별 IP 요청 가중치 (X-MBX-USED-WEIGHT-1M 기준)
+ENDPOINT_WEIGHTS: Dict[str, int] = {
+    "futures_account": 5,
+    "futures_position_information": 5,
+    "futures_exchange_info": 1,
+    "futures_leverage_bracket": 1,
+    "futures_mark_price": 1,
+    "futures_get_open_orders": 1,
+    "futures_stream_get_listen_key": 1,
+    "futures_stream_keepalive": 1,
+    "futures_stream_close": 1,
+    "futures_change_leverage": 1,
+    "futures_cancel_order": 1,
+    "futures_cancel_all_open_orders": 1,
+    "futures_create_order": 0,
+    "futures_place_batch_order": 5,
+}
+
+# 주문 카운트(X-MBX-ORDER-COUNT-*)에 반영되는 엔드포인트
+ORDER_COUNT_ENDPOINTS = {"futures_create_order", "futures_place_batch_order"}
+
+# 읽기 요청보다 우선 처리되는 주문 관련 엔드포인트
+ORDER_ENDPOINTS = ORDER_COUNT_ENDPOINTS | {
+    "futures_cancel_order",
+    "futures_cancel_all_open_orders",
+    "futures_change_leverage",
+}
+
+def get_request_weight(method: str, params: dict) -> int:
+    """요청 가중치 계산"""
+    if method == "futures_order_book":
+        limit = int(params.get("limit", 500))
+        if limit <= 50:
+            return 2
+        if limit <= 100:
+            return 5
+        if limit <= 500:
+            return 10
+        return 20
+    if method == "futures_klines":
+        limit = int(params.get("limit", 500))
+        if limit < 100:
+            return 1
+        if limit < 500:
+            return 2
+        if limit <= 1000:
+            return 5
+        return 10
+    if method == "futures_get_open_orders" and "symbol" not in params:
+        return 40
+    if method == "futures_position_information" and "symbol" in params:
+        return 1
+    return ENDPOINT_WEIGHTS.get(method, 1)
+
+def get_order_count(method: str, params: dict) -> int:
+    """주문 카운트 증가분 (일괄 주문은 포함된 주문 수만큼)"""
+    if method == "futures_place_batch_order":
+        return len(params.get("batchOrders") or []) or 1
+    return 1 if method in ORDER_COUNT_ENDPOINTS else 0
+
+class RateLimitScheduler(LoggerMixin):
+    """바이낸스 요청 가중치 예산 관리 (모든 REST 호출의 관문)"""
+
+    def __init__(
+        self,
+        weight_limit: int = 2400,
+        order_limit_1m: int = 1200,
+        order_limit_10s: int = 300,
+        read_threshold: float = None,
+        max_read_queue: int = None
+    ):
+        self.weight_limit = weight_limit
+        self.order_limit_1m = order_limit_1m
+        self.order_limit_10s = order_limit_10s
+        # 읽기 요청은 예산의 일부만 사용 (나머지는 주문용으로 예약)
+        self.read_threshold = (
+            read_threshold if read_threshold is not None
+            else EnvConfig.BINANCE_READ_WEIGHT_RATIO
+        )
+        self.max_read_queue = (
+            max_read_queue if max_read_queue is not None
+            else EnvConfig.BINANCE_MAX_READ_QUEUE
+        )
+
+        self.used_weight = 0
+        self.order_count_1m = 0
+        self.order_count_10s = 0
+        self.banned_until = 0.0
+        self._window_1m = self._current_window(60)
+        self._window_10s = self._current_window(10)
+        self._queued: Dict[RequestPriority, int] = {p: 0 for p in RequestPriority}
+
+        metrics_manager.binance_weight_limit.set(self.weight_limit)
+
+    @staticmethod
+    def _current_window(seconds: int) -> int:
+        return int(time.time() // seconds)
+
+    def _roll_windows(self):
+        """윈도우 경과 시 사용량 초기화"""
+        window_1m = self._current_window(60)
+        if window_1m != self._window_1m:
+            self._window_1m = window_1m
+            self.used_weight = 0
+            self.order_count_1m = 0
+        window_10s = self._current_window(10)
+        if window_10s != self._window_10s:
+            self._window_10s = window_10s
+            self.order_count_10s = 0
+
+    def configure(self, rate_limits: List[dict]):
+        """exchangeInfo의 rateLimits로 한도 설정"""
+        for limit in rate_limits:
+            limit_type = limit.get("rateLimitType")
+            interval = limit.get("interval")
+            interval_num = int(limit.get("intervalNum", 1))
+            value = int(limit.get("limit", 0))
+            if limit_type == "REQUEST_WEIGHT" and interval == "MINUTE" and interval_num == 1:
+                self.weight_limit = value
+            elif limit_type == "ORDERS" and interval == "MINUTE" and interval_num == 1:
+                self.order_limit_1m = value
+            elif limit_type == "ORDERS" and interval == "SECOND" and interval_num == 10:
+                self.order_limit_10s = value
+        metrics_manager.binance_weight_limit.set(self.weight_limit)
+
+    def _has_budget(self, weight: int, priority: RequestPriority, order_count: int) -> bool:
+        """현재 윈도우에 요청을 보낼 예산이 있는지 확인"""
+        limit = self.weight_limit
+        if priority != RequestPriority.ORDER:
+            limit = int(self.weight_limit * self.read_threshold)
+        if self.used_weight + weight > limit:
+            return False
+        if order_count and (
+            self.order_count_1m + order_count > self.order_limit_1m or
+            self.order_count_10s + order_count > self.order_limit_10s
+        ):
+            return False
+        return True
+
+    def _wait_time(self, order_count: int) -> float:
+        """다음 예산 회복까지 대기 시간"""
+        now = time.time()
+        if order_count and self.order_count_10s + order_count > self.order_limit_10s:
+            return 10 - (now % 10)
+        return 60 - (now % 60)
+
+    async def acquire(self, method: str, params: Optional[dict] = None):
+        """요청 예산 확보 (주문 우선, 예산 부족 시 읽기 요청 대기/차단)"""
+        params = params or {}
+        weight = get_request_weight(method, params)
+        priority = RequestPriority.ORDER if method in ORDER_ENDPOINTS else RequestPriority.READ
+        order_count = get_order_count(method, params)
+
+        self._queued[priority] += 1
+        self._update_queue_metrics()
+        try:
+            while True:
+                # 418/429 차단 중에는 대기하지 않고 즉시 실패 (주문/취소가 멈춰 있지 않도록)
+                remaining = self.banned_until - time.time()
+                if remaining > 0:
+                    metrics_manager.binance_requests_shed.labels(endpoint=method).inc()
+                    raise RateLimitError(f"요청 한도 초과로 차단 중 ({remaining:.0f}초 남음): {method}")
+
+                self._roll_windows()
+                if self._has_budget(weight, priority, order_count):
+                    self.used_weight += weight
+                    self.order_count_1m += order_count
+                    self.order_count_10s += order_count
+                    self._update_usage_metrics()
+                    return
+
+                if priority == RequestPriority.READ and \
+                        self._queued[RequestPriority.READ] > self.max_read_queue:
+                    metrics_manager.binance_requests_shed.labels(endpoint=method).inc()
+                    raise RateLimitError(f"요청 가중치 한도 임박으로 읽기 요청 차단: {method}")
+
+                await asyncio.sleep(min(self._wait_time(order_count), 1.0))
+        finally:
+            self._queued[priority] -= 1
+            self._update_queue_metrics()
+
+    def update_from_headers(self, headers):
+        """응답 헤더의 실제 사용량 반영"""
+        if not headers:
+            return
+        self._roll_windows()
+        used_weight = headers.get("X-MBX-USED-WEIGHT-1M")
+        if used_weight is not None:
+            self.used_weight = max(self.used_weight, int(used_weight))
+        order_count_1m = headers.get("X-MBX-ORDER-COUNT-1M")
+        if order_count_1m is not None:
+            self.order_count_1m = max(self.order_count_1m, int(order_count_1m))
+        order_count_10s = headers.get("X-MBX-ORDER-COUNT-10S")
+        if order_count_10s is not None:
+            self.order_count_10s = max(self.order_count_10s, int(order_count_10s))
+        self._update_usage_metrics()
+
+    def handle_rate_limit_error(self, status_code: int, headers=None):
+        """429/418 응답 시 Retry-After 동안 요청 중단"""
+        if status_code not in (418, 429):
+            return
+        retry_after = None
+        if headers:
+            retry_after = headers.get("Retry-After")
+        delay = float(retry_after) if retry_after else 60.0
+        self.banned_until = max(self.banned_until, time.time() + delay)
+        metrics_manager.binance_rate_limit_hits.labels(status=str(status_code)).inc()
+        self.logger.error(f"바이낸스 요청 한도 초과 ({status_code}): {delay}초 동안 요청 중단")
+
+    def get_status(self) -> dict:
+        """현재 예산 상태"""
+        self._roll_windows()
+        return {
+            "used_weight": self.used_weight,
+            "weight_limit": self.weight_limit,
+            "order_count_1m": self.order_count_1m,
+            "order_limit_1m": self.order_limit_1m,
+            "order_count_10s": self.order_count_10s,
+            "order_limit_10s": self.order_limit_10s,
+            "banned_until": self.banned_until,
+            "queued": {p.name.lower(): count for p, count in self._queued.items()}
+        }
+
+    def _update_usage_metrics(self):
+        metrics_manager.binance_weight_used.set(self.used_weight)
+        metrics_manager.binance_weight_remaining.set(max(self.weight_limit - self.used_weight, 0))
+        metrics_manager.binance_order_count.labels(window="1m").set(self.order_count_1m)
+        metrics_manager.binance_order_count.labels(window="10s").set(self.order_count_10s)
+
+    def _update_queue_metrics(self):
+        for priority, count in self._queued.items():
+            metrics_manager.binance_scheduler_queue_depth.labels(priority=priority.name.lower()).set(count)
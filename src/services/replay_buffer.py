@@ -0,0 +1,39 @@
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Optional
+from src.config.env import EnvConfig
+
+class ChannelBuffer:
+    """채널별 시퀀스 번호 부여와 재연결 재전송용 고정 크기 링 버퍼"""
+
+    def __init__(self, size: int = None, seq: int = 0):
+        self.seq = seq
+        # 구독자가 없어진 것이 처음 확인된 시각 (유휴 버퍼 정리용)
+        self.idle_since: Optional[float] = None
+        self._messages: Deque[dict] = deque(maxlen=size or EnvConfig.WS_REPLAY_BUFFER_SIZE)
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    @property
+    def first_seq(self) -> Optional[int]:
+        """버퍼에 남아 있는 가장 오래된 시퀀스"""
+        return self._messages[0]['seq'] if self._messages else None
+
+    def append(self, message: dict) -> dict:
+        """다음 시퀀스를 부여하고 버퍼에 저장"""
+        self.seq += 1
+        message['seq'] = self.seq
+        self._messages.append(message)
+        return message
+
+    def since(self, seq: int) -> Optional[List[dict]]:
+        """seq 이후 메시지 (공백이 이미 버퍼에서 밀려났거나 seq가 유효하지 않으면 None)"""
+        if seq < 0 or seq > self.seq:
+            return None
+        if seq == self.seq:
+            return []
+        first = self.first_seq
+        if first is None or first > seq + 1:
+            return None
+        return list(islice(self._messages, seq + 1 - first, None))
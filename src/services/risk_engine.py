@@ -0,0 +1,146 @@
+import time
+from collections import deque
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Deque, Dict, FrozenSet, Mapping, NamedTuple, Optional
+from src.config.env import EnvConfig
+from src.models.settings import TradingSettings
+from src.models.trading import OrderRequest, Position
+from src.utils.exceptions import PositionError, ValidationError
+from src.utils.logger import LoggerMixin
+from src.utils.metrics import metrics_manager
+
+# 주문 빈도 제한 창 (초)
+ORDER_RATE_WINDOW = 60.0
+
+class RiskRules(NamedTuple):
+    """설정에서 컴파일된 불변 리스크 규칙 (조회는 모두 O(1))"""
+    version: int
+    allowed_symbols: FrozenSet[str]
+    max_leverage: int
+    max_positions: int
+    default_notional_cap: Decimal
+    notional_caps: Mapping[str, Decimal]
+    risk_limit: Decimal
+    max_stop_loss_percent: Decimal
+    max_orders_per_minute: int
+
+    @classmethod
+    def compile(cls, settings: TradingSettings, version: int) -> 'RiskRules':
+        return cls(
+            version=version,
+            allowed_symbols=frozenset(settings.allowed_symbols),
+            max_leverage=settings.max_leverage,
+            max_positions=settings.max_positions,
+            default_notional_cap=Decimal(str(EnvConfig.MAX_POSITION_SIZE)),
+            notional_caps=MappingProxyType({
+                symbol: Decimal(str(cap)) for symbol, cap in settings.max_position_notional.items()
+            }),
+            risk_limit=Decimal(str(settings.risk_limit)),
+            max_stop_loss_percent=Decimal(str(EnvConfig.STOP_LOSS_PERCENT)),
+            max_orders_per_minute=settings.max_orders_per_minute
+        )
+
+class RiskEngine(LoggerMixin):
+    """컴파일된 규칙으로 메모리 상태만 보고 주문을 사전 검사하는 리스크 엔진"""
+
+    def __init__(self):
+        self.rules: Optional[RiskRules] = None
+        # 최근 ORDER_RATE_WINDOW 동안 검사를 통과한 주문 시각 (전송 실패 시 반환)
+        self._order_times: Deque[float] = deque()
+
+    def compile(self, settings: TradingSettings, version: int) -> RiskRules:
+        """설정 버전이 바뀐 경우에만 규칙 재컴파일"""
+        if self.rules is None or self.rules.version != version:
+            self.rules = RiskRules.compile(settings, version)
+            self.logger.info(f"리스크 규칙 컴파일 완료 (설정 버전 {version})")
+        return self.rules
+
+    def _reject(self, rule: str, error: Exception):
+        metrics_manager.risk_rejections.labels(rule=rule).inc()
+        raise error
+
+    def check(
+        self,
+        request: OrderRequest,
+        positions: Dict[str, Position],
+        price: Optional[Decimal],
+        equity: Optional[Decimal] = None
+    ) -> float:
+        """주문 사전 리스크 검사 (가격 없는 규칙 먼저, 위반 시 ValidationError/PositionError, 통과 시 빈도 슬롯 예약)"""
+        rules = self.rules
+        symbol = request.symbol
+
+        if symbol not in rules.allowed_symbols:
+            self._reject("symbol", ValidationError(f"허용되지 않은 심볼: {symbol}"))
+        if request.leverage > rules.max_leverage:
+            self._reject("leverage", ValidationError(
+                f"최대 레버리지 초과: {request.leverage}x (최대 {rules.max_leverage}x)"
+            ))
+        if request.quantity <= 0:
+            self._reject("quantity", ValidationError(f"유효하지 않은 수량: {request.quantity}"))
+
+        # 주문 빈도 한도 (접수됐거나 전송 중인 주문 기준)
+        now = time.monotonic()
+        while self._order_times and now - self._order_times[0] > ORDER_RATE_WINDOW:
+            self._order_times.popleft()
+        if len(self._order_times) >= rules.max_orders_per_minute:
+            self._reject("order_rate", ValidationError(
+                f"주문 빈도 초과 (분당 최대 {rules.max_orders_per_minute}건)"
+            ))
+
+        current = positions.get(symbol)
+        if current is None and len(positions) >= rules.max_positions:
+            self._reject("max_positions", PositionError(
+                f"최대 포지션 한도 초과 (최대: {rules.max_positions})"
+            ))
+
+        # 명목가 기준 가격을 모르면 한도를 검사할 수 없으므로 거부
+        if price is None:
+            self._reject("price", ValidationError(f"마크 가격 미수신: {symbol} (지정가 주문은 price 사용)"))
+
+        # 심볼 명목가 한도 (같은 방향이면 기존 포지션에 더해짐)
+        notional = request.quantity * price
+        signed = notional if request.side == 'BUY' else -notional
+        if current is not None:
+            current_notional = current.quantity * price
+            signed += current_notional if current.side == 'LONG' else -current_notional
+        cap = rules.notional_caps.get(symbol, rules.default_notional_cap)
+        if abs(signed) > cap:
+            self._reject("notional", PositionError(
+                f"심볼 명목가 한도 초과: {symbol} {abs(signed):.2f} > {cap} USDT"
+            ))
+
+        # 계정 증거금 사용 한도
+        if equity:
+            used = sum(
+                (p.quantity * p.entry_price / p.leverage for s, p in positions.items() if s != symbol),
+                Decimal('0')
+            ) + abs(signed) / request.leverage
+            if used > equity * rules.risk_limit:
+                self._reject("exposure", PositionError(
+                    f"계정 증거금 사용 한도 초과: {used:.2f} > {equity * rules.risk_limit:.2f} USDT"
+                ))
+
+        # 손절 폭 한도 (STOP_LOSS_PERCENT)
+        if request.stop_loss is not None:
+            distance = (
+                request.stop_loss if request.trigger_mode == 'percent'
+                else abs(price - request.stop_loss) / price * 100
+            )
+            if distance > rules.max_stop_loss_percent:
+                self._reject("stop_loss", ValidationError(
+                    f"손절 폭 초과: {distance:.2f}% (최대 {rules.max_stop_loss_percent}%)"
+                ))
+
+        # 검사와 집계 사이에 다른 주문이 끼어들지 않도록 통과 즉시 슬롯 예약
+        self._order_times.append(now)
+        return now
+
+    def release(self, reservation: float):
+        """전송에 실패한 주문의 빈도 슬롯 반환"""
+        try:
+            self._order_times.remove(reservation)
+        except ValueError:
+            # 이미 시간 창을 벗어나 정리된 슬롯
+            pass
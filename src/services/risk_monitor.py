@@ -0,0 +1,283 @@
+import asyncio
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
+from src.config.env import EnvConfig
+from src.services.account_store import CHANGE_ACCOUNT, CHANGE_POSITIONS
+from src.utils.logger import LoggerMixin
+from src.utils.metrics import metrics_manager
+
+# 브래킷 정보가 없을 때 가정하는 유지 증거금률
+DEFAULT_MAINT_MARGIN_RATIO = 0.005
+
+# 경보 해제 여유 (임계값 대비 비율만큼 되돌아와야 다시 경보)
+ALERT_HYSTERESIS = 0.2
+
+PositionKey = Tuple[str, str]
+
+class PortfolioRiskMonitor(LoggerMixin):
+    """전체 포지션을 열 벡터로 보관하고 마크 가격 틱마다 리스크 지표를 한 번에 재계산하는 모니터"""
+
+    def __init__(
+        self,
+        binance_service,
+        notification_service=None,
+        liquidation_alert_percent: float = None,
+        margin_ratio_alert: float = None
+    ):
+        self.binance = binance_service
+        self.store = binance_service.account_store
+        self.market_data = binance_service.market_data
+        self.notification = notification_service
+        self.liquidation_alert_percent = (
+            liquidation_alert_percent if liquidation_alert_percent is not None
+            else EnvConfig.RISK_LIQUIDATION_ALERT_PERCENT
+        )
+        self.margin_ratio_alert = (
+            margin_ratio_alert if margin_ratio_alert is not None
+            else EnvConfig.RISK_MARGIN_RATIO_ALERT
+        )
+        self.keys: List[PositionKey] = []
+        self.rows_by_symbol: Dict[str, np.ndarray] = {}
+        self._allocate(0)
+        # 경보 중인 포지션 (임계값 재진입 시 중복 경보 방지)
+        self._liquidation_alerted: Set[PositionKey] = set()
+        self._margin_alerted: Set[PositionKey] = set()
+        self._subscribed: Set[str] = set()
+        self._subscription_lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._running = False
+        self.store.add_listener(self._on_account_change)
+        self.market_data.add_listener(self._on_mark_price)
+
+    def _allocate(self, size: int):
+        # 입력 열 (포지션 변경 시 재구성)
+        self.amount = np.zeros(size)
+        self.entry = np.zeros(size)
+        self.mark = np.zeros(size)
+        self.isolated_wallet = np.zeros(size)
+        self.isolated = np.zeros(size, dtype=bool)
+        self.mmr = np.zeros(size)
+        self.cum = np.zeros(size)
+        # 계산 열 (마크 가격 틱마다 갱신)
+        self.notional = np.zeros(size)
+        self.unrealized = np.zeros(size)
+        self.margin_ratio = np.zeros(size)
+        self.liquidation_price = np.zeros(size)
+        self.liquidation_distance = np.full(size, np.inf)
+        self.account_margin_ratio = 0.0
+
+    async def start(self):
+        """현재 포지션으로 배열을 구성하고 포지션 심볼의 마크 가격 구독 시작"""
+        self._running = True
+        self.rebuild()
+        await self._sync_subscriptions()
+        self.logger.info(f"포트폴리오 리스크 모니터 시작 (포지션 {len(self.keys)}개)")
+
+    async def stop(self):
+        self._running = False
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._sync_subscriptions()
+
+    def _maintenance(self, symbol: str, notional: float) -> Tuple[float, float]:
+        """명목가에 해당하는 레버리지 브래킷의 (유지 증거금률, 누적 공제액)"""
+        for bracket in self.binance.get_leverage_brackets(symbol):
+            if float(bracket.get("notionalFloor", 0)) <= notional < float(bracket.get("notionalCap", np.inf)):
+                return float(bracket["maintMarginRatio"]), float(bracket.get("cum", 0))
+        return DEFAULT_MAINT_MARGIN_RATIO, 0.0
+
+    def rebuild(self):
+        """계정 저장소 포지션으로 열 벡터 재구성"""
+        positions = list(self.store.positions.items())
+        self.keys = [key for key, _ in positions]
+        self._allocate(len(positions))
+        rows: Dict[str, List[int]] = {}
+        for row, ((symbol, _), pos) in enumerate(positions):
+            rows.setdefault(symbol, []).append(row)
+            cached = self.market_data.get_mark_price(symbol)
+            amount = float(pos["positionAmt"])
+            entry = float(pos["entryPrice"])
+            mark = float(cached["price"]) if cached else float(pos.get("markPrice") or entry)
+            wallet = float(pos.get("isolatedWallet", pos.get("isolatedMargin", 0)) or 0)
+            self.amount[row] = amount
+            self.entry[row] = entry
+            self.mark[row] = mark
+            self.isolated_wallet[row] = wallet
+            self.isolated[row] = pos.get("marginType", "isolated" if wallet > 0 else "cross") == "isolated"
+            self.mmr[row], self.cum[row] = self._maintenance(symbol, abs(amount) * entry)
+        self.rows_by_symbol = {
+            symbol: np.array(symbol_rows, dtype=np.int64)
+            for symbol, symbol_rows in rows.items()
+        }
+
+        # 종료된 포지션 경보/게이지 정리
+        open_keys = set(self.keys)
+        for key in (self._liquidation_alerted | self._margin_alerted) - open_keys:
+            self._liquidation_alerted.discard(key)
+            self._margin_alerted.discard(key)
+        for gauge in (metrics_manager.position_liquidation_distance, metrics_manager.position_margin_ratio):
+            for sample in gauge.collect()[0].samples:
+                key = (sample.labels["symbol"], sample.labels["side"])
+                if key not in open_keys:
+                    gauge.remove(*key)
+
+        self.recompute()
+        if self._running:
+            self._spawn(self._sync_subscriptions())
+
+    def recompute(self):
+        """전체 포지션의 명목가/미실현 손익/증거금률/청산 거리를 한 번에 계산"""
+        amount = self.amount
+        mark = self.mark
+        isolated = self.isolated
+        cross = ~isolated
+
+        self.notional = np.abs(amount) * mark
+        self.unrealized = amount * (mark - self.entry)
+        maint = np.maximum(self.notional * self.mmr - self.cum, 0.0)
+
+        # 교차 포지션은 교차 지갑 잔고와 미실현 손익/유지 증거금을 공유
+        usdt = self.store.balances.get("USDT", {})
+        cross_wallet = usdt.get("crossWalletBalance") or self.store.account.get("totalWalletBalance", 0.0)
+        cross_unrealized = self.unrealized[cross].sum()
+        cross_maint = maint[cross].sum()
+        cross_balance = cross_wallet + cross_unrealized
+        self.account_margin_ratio = cross_maint / cross_balance if cross_balance > 0 else (np.inf if cross_maint else 0.0)
+
+        balance = np.where(isolated, self.isolated_wallet + self.unrealized, cross_balance)
+        required = np.where(isolated, maint, cross_maint)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.margin_ratio = np.where(balance > 0, required / balance, np.inf)
+
+            # 청산가: wallet + amt * (p - entry) = |amt| * p * mmr - cum
+            # (교차 포지션의 wallet은 다른 교차 포지션의 손익/유지 증거금을 고정으로 둔 가용 잔고)
+            wallet = np.where(
+                isolated,
+                self.isolated_wallet,
+                cross_balance - self.unrealized - (cross_maint - maint)
+            )
+            liquidation = (wallet - amount * self.entry + self.cum) / (np.abs(amount) * self.mmr - amount)
+            self.liquidation_price = np.where(liquidation > 0, liquidation, 0.0)
+            # 청산가까지 남은 거리 (%, 불리한 방향 기준, 청산가가 없으면 inf)
+            self.liquidation_distance = np.where(
+                liquidation > 0,
+                np.sign(amount) * (mark - liquidation) / mark * 100,
+                np.inf
+            )
+
+        self._update_gauges()
+        self._check_alerts()
+
+    def _update_gauges(self):
+        metrics_manager.portfolio_notional.set(float(self.notional.sum()))
+        metrics_manager.portfolio_unrealized_pnl.set(float(self.unrealized.sum()))
+        metrics_manager.account_margin_ratio.set(float(self.account_margin_ratio))
+        for row, (symbol, side) in enumerate(self.keys):
+            metrics_manager.position_liquidation_distance.labels(symbol=symbol, side=side).set(self.liquidation_distance[row])
+            metrics_manager.position_margin_ratio.labels(symbol=symbol, side=side).set(self.margin_ratio[row])
+
+    def _check_alerts(self):
+        """임계값을 새로 넘은 포지션만 경보 (해제 여유만큼 돌아오면 재무장)"""
+        self._crossed(
+            "liquidation",
+            self._liquidation_alerted,
+            self.liquidation_distance <= self.liquidation_alert_percent,
+            self.liquidation_distance > self.liquidation_alert_percent * (1 + ALERT_HYSTERESIS),
+            lambda row: f"청산가 근접: 거리 {self.liquidation_distance[row]:.2f}% (청산가 {self.liquidation_price[row]:.4f})"
+        )
+        self._crossed(
+            "margin_ratio",
+            self._margin_alerted,
+            self.margin_ratio >= self.margin_ratio_alert,
+            self.margin_ratio < self.margin_ratio_alert * (1 - ALERT_HYSTERESIS),
+            lambda row: f"증거금률 경고: {self.margin_ratio[row] * 100:.1f}%"
+        )
+
+    def _crossed(self, kind: str, alerted: Set[PositionKey], breached: np.ndarray, cleared: np.ndarray, describe):
+        for row in np.flatnonzero(breached):
+            key = self.keys[row]
+            if key in alerted:
+                continue
+            alerted.add(key)
+            metrics_manager.risk_alerts.labels(kind=kind).inc()
+            message = (
+                f"{describe(row)}\n"
+                f"{key[0]} {key[1]} 수량 {self.amount[row]} / 마크 {self.mark[row]} / "
+                f"미실현 손익 {self.unrealized[row]:.2f} USDT"
+            )
+            self.logger.warning(message.replace("\n", " - "))
+            if self.notification:
+                self.notification.notify(message, alert_level="WARNING")
+        for row in np.flatnonzero(cleared):
+            alerted.discard(self.keys[row])
+
+    def _on_account_change(self, change: str):
+        if change == CHANGE_POSITIONS:
+            self.rebuild()
+        elif change == CHANGE_ACCOUNT:
+            self._schedule()
+
+    def _on_mark_price(self, update: dict):
+        rows = self.rows_by_symbol.get(update["symbol"])
+        if rows is None:
+            return
+        self.mark[rows] = float(update["price"])
+        self._schedule()
+
+    def _schedule(self):
+        """같은 루프 반복에서 들어온 틱(!markPrice@arr 배치 등)을 한 번의 재계산으로 병합"""
+        if self._flush_handle is not None:
+            return
+        try:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self._flush)
+        except RuntimeError:
+            # 이벤트 루프 밖(동기 스냅샷 로드 등)에서는 즉시 계산
+            self.recompute()
+
+    def _flush(self):
+        self._flush_handle = None
+        try:
+            self.recompute()
+        except Exception as e:
+            self.logger.error(f"포트폴리오 리스크 계산 실패: {e}")
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _sync_subscriptions(self):
+        """포지션 심볼만 마크 가격 허브에 구독 (중지 시 전부 해제)"""
+        async with self._subscription_lock:
+            wanted = set(self.rows_by_symbol) if self._running else set()
+            for symbol in wanted - self._subscribed:
+                await self.market_data.acquire(symbol)
+                self._subscribed.add(symbol)
+            for symbol in self._subscribed - wanted:
+                await self.market_data.release(symbol)
+                self._subscribed.discard(symbol)
+
+    def get_summary(self) -> dict:
+        """현재 포트폴리오 리스크 요약"""
+        return {
+            "notional": float(self.notional.sum()),
+            "unrealized_pnl": float(self.unrealized.sum()),
+            "account_margin_ratio": float(self.account_margin_ratio),
+            "positions": [
+                {
+                    "symbol": symbol,
+                    "side": side,
+                    "notional": float(self.notional[row]),
+                    "unrealized_pnl": float(self.unrealized[row]),
+                    "margin_ratio": float(self.margin_ratio[row]),
+                    "liquidation_price": float(self.liquidation_price[row]),
+                    "liquidation_distance": float(self.liquidation_distance[row])
+                }
+                for row, (symbol, side) in enumerate(self.keys)
+            ]
+        }
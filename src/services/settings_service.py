@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Union
 from src.models.settings import Settings, TradingSettings, APISettings
 from src.utils.logger import logger, LoggerMixin
 from src.utils.exceptions import ValidationError
@@ -11,6 +12,19 @@ class SettingsService(LoggerMixin):
         self.settings_file = self.settings_dir / "settings.json"
         self.settings: Optional[Settings] = None
         self._initialized = False
+        # 설정이 바뀔 때마다 증가 (리스크 규칙 재컴파일 판단용)
+        self.version = 0
+        self._listeners: List[Callable[[TradingSettings], Union[None, Awaitable[None]]]] = []
+
+    def add_listener(self, listener: Callable[[TradingSettings], Union[None, Awaitable[None]]]):
+        """거래 설정 변경 리스너 등록"""
+        self._listeners.append(listener)
+
+    async def _notify(self):
+        for listener in self._listeners:
+            result = listener(self.settings.trading)
+            if asyncio.iscoroutine(result):
+                await result
 
     async def initialize(self):
         """설정 서비스 초기화"""
@@ -40,6 +54,7 @@ class SettingsService(LoggerMixin):
                 self.settings = Settings()
                 await self._save_settings()
                 
+            self.version += 1
             self.logger.info("설정 로드 완료")
             
         except Exception as e:
@@ -75,8 +90,17 @@ class SettingsService(LoggerMixin):
     async def update_trading_settings(self, settings: Dict[str, Any]):
         """거래 설정 업데이트"""
         await self._ensure_initialized()
+        previous = self.settings.trading
         try:
             self.settings.trading = TradingSettings(**settings)
+            # 리스너(지표 재구성 등)가 거부한 설정은 저장하지 않고 이전 설정으로 복구
+            try:
+                await self._notify()
+            except Exception:
+                self.settings.trading = previous
+                await self._notify()
+                raise
+            self.version += 1
             await self._save_settings()
             self.logger.info("거래 설정 업데이트 완료")
             
@@ -84,6 +108,13 @@ class SettingsService(LoggerMixin):
             self.logger.error(f"거래 설정 업데이트 실패: {e}")
             raise ValidationError(f"거래 설정 업데이트 실패: {str(e)}")
 
+    async def update_settings(self, settings: Dict[str, Any]):
+        """전체 설정 업데이트 (trading/api 중 포함된 항목만)"""
+        if 'trading' in settings:
+            await self.update_trading_settings(settings['trading'])
+        if 'api' in settings:
+            await self.update_api_settings(settings['api'])
+
     async def update_api_settings(self, settings: Dict[str, Any]):
         """API 설정 업데이트"""
         await self._ensure_initialized()
@@ -1,22 +1,33 @@
 from decimal import Decimal
 from typing import Optional, List
-from models.trading import Order, Position, OrderRequest
-from services.binance_service import BinanceService
-from services.settings_service import SettingsService
-from services.notification_service import NotificationService
-from utils.exceptions import ValidationError, PositionError
-from utils.logger import logger
+from src.models.trading import Order, Position, OrderRequest
+from src.services.binance_service import BinanceService
+from src.services.execution_pipeline import ExecutionPipeline
+from src.services.settings_service import SettingsService
+from src.services.notification_service import NotificationService
+from src.services.risk_engine import RiskEngine
+from src.services.risk_monitor import PortfolioRiskMonitor
+from src.utils.exceptions import PositionError, ValidationError
+from src.utils.logger import logger
 
 class TradingService:
     def __init__(
         self,
         binance_service: BinanceService,
-        settings_service: SettingsService
+        settings_service: SettingsService,
+        notification_service: Optional[NotificationService] = None,
+        risk_engine: Optional[RiskEngine] = None
     ):
         self.binance = binance_service
         self.settings = settings_service
-        self.notification = NotificationService()
+        self.notification = notification_service or NotificationService()
         self.positions: dict[str, Position] = {}
+        # 심볼별 주문 실행 액터 (같은 심볼 주문은 순서대로 실행)
+        self.pipeline = ExecutionPipeline()
+        # 설정에서 컴파일된 사전 리스크 규칙 (HTTP 주문 경로와 공유하면 주문 빈도도 함께 집계)
+        self.risk = risk_engine or RiskEngine()
+        # 마크 가격 틱마다 전체 포지션 청산 거리/증거금률 감시
+        self.risk_monitor = PortfolioRiskMonitor(binance_service, self.notification)
 
     async def initialize(self):
         """서비스 초기화"""
@@ -32,20 +43,23 @@ class TradingService:
             
         except Exception as e:
             logger.error(f"거래 서비스 초기화 실패: {e}")
-            await self.notification.send_error_notification(e)
+            self.notification.send_error_notification(e)
             raise
 
     async def _load_positions(self):
         """기존 포지션 로드"""
         try:
-            positions = await self.binance.get_all_positions()
+            positions = [
+                Position.from_binance(pos)
+                for pos in await self.binance.get_all_positions()
+            ]
             self.positions = {pos.symbol: pos for pos in positions}
             logger.info(f"포지션 로드 완료: {len(positions)}개")
             
             if positions:
                 # 기존 포지션 정보 알림
                 for pos in positions:
-                    await self.notification.send_position_update(
+                    self.notification.send_position_update(
                         symbol=pos.symbol,
                         side=pos.side,
                         unrealized_pnl=float(pos.unrealized_pnl)
@@ -53,42 +67,56 @@ class TradingService:
             
         except Exception as e:
             logger.error(f"포지션 로드 실패: {e}")
-            await self.notification.send_error_notification(e)
+            self.notification.send_error_notification(e)
             raise
 
-    def _validate_order_request(self, request: OrderRequest):
-        """주문 요청 유효성 검사"""
-        # 심볼 검사
-        if not self.settings.validate_symbol(request.symbol):
-            raise ValidationError(f"유효하지 않은 심볼: {request.symbol}")
-            
-        # 레버리지 검사
-        if not self.settings.validate_leverage(request.leverage):
-            raise ValidationError(f"유효하지 않은 레버리지: {request.leverage}")
-            
-        # 수량 검사
-        if not self.settings.validate_quantity(float(request.quantity)):
-            raise ValidationError(f"유효하지 않은 수량: {request.quantity}")
-            
-        # 포지션 한도 검사
-        trading_settings = self.settings.get_trading_settings()
-        if (len(self.positions) >= trading_settings.max_positions and 
-            request.symbol not in self.positions):
-            raise PositionError(
-                f"최대 포지션 한도 초과 (최대: {trading_settings.max_positions})"
-            )
+    async def _validate_order_request(self, request: OrderRequest) -> float:
+        """주문 사전 리스크 검사 (설정이 바뀐 경우에만 규칙 재컴파일, 주문 빈도 슬롯 예약 반환)"""
+        trading_settings = await self.settings.get_trading_settings()
+        self.risk.compile(trading_settings, self.settings.version)
+
+        # 명목가 기준 가격 (지정가 또는 스트림 캐시 마크 가격, REST 조회 없음)
+        price = request.price or self.binance._cached_mark_price(request.symbol)
+        store = self.binance.account_store
+        equity = (
+            Decimal(str(store.account["totalMarginBalance"]))
+            if store.is_synced and store.account else None
+        )
+        return self.risk.check(request, self.positions, price, equity)
+
+    async def stop(self):
+        """실행 대기 중인 주문 작업 및 리스크 모니터 정리"""
+        await self.pipeline.stop()
+        await self.risk_monitor.stop()
+
+    async def _check_symbol(self, symbol: str):
+        """거래소 정보에 없는 심볼은 실행 액터를 만들기 전에 거부"""
+        await self.binance.exchange_info.ensure_loaded()
+        if self.binance.exchange_info.get_symbol(symbol) is None:
+            raise ValidationError(f"알 수 없는 심볼: {symbol}")
 
     async def place_order(self, request: OrderRequest) -> Order:
+        """주문 실행 (심볼 확인 후 심볼 실행 액터에서 순서대로 처리)"""
+        await self._check_symbol(request.symbol)
+        return await self.pipeline.run(
+            request.symbol, "place_order", lambda: self._execute_order(request)
+        )
+
+    async def _execute_order(self, request: OrderRequest) -> Order:
         """주문 실행"""
         try:
             # 주문 유효성 검사
-            self._validate_order_request(request)
+            reservation = await self._validate_order_request(request)
             
-            # 주문 실행
-            order = await self.binance.place_order(request)
+            # 주문 실행 (실패하면 예약한 빈도 슬롯 반환)
+            try:
+                order = await self.binance.place_order(request)
+            except Exception:
+                self.risk.release(reservation)
+                raise
             
             # 주문 실행 알림
-            await self.notification.send_trade_notification(
+            self.notification.send_trade_notification(
                 symbol=order.symbol,
                 side=order.side,
                 quantity=float(order.quantity),
@@ -101,7 +129,7 @@ class TradingService:
                 if position:
                     self.positions[request.symbol] = position
                     # 포지션 업데이트 알림
-                    await self.notification.send_position_update(
+                    self.notification.send_position_update(
                         symbol=position.symbol,
                         side=position.side,
                         unrealized_pnl=float(position.unrealized_pnl)
@@ -112,10 +140,17 @@ class TradingService:
             
         except Exception as e:
             logger.error(f"주문 실행 실패: {e}")
-            await self.notification.send_error_notification(e)
+            self.notification.send_error_notification(e)
             raise
 
     async def close_position(self, symbol: str) -> Optional[Order]:
+        """포지션 청산 (심볼 확인 후 심볼 실행 액터에서 순서대로 처리)"""
+        await self._check_symbol(symbol)
+        return await self.pipeline.run(
+            symbol, "close_position", lambda: self._execute_close(symbol)
+        )
+
+    async def _execute_close(self, symbol: str) -> Optional[Order]:
         """포지션 청산"""
         try:
             if symbol not in self.positions:
@@ -128,7 +163,7 @@ class TradingService:
             
             if order and order.status == 'FILLED':
                 # 청산 알림
-                await self.notification.send_trade_notification(
+                self.notification.send_trade_notification(
                     symbol=symbol,
                     side="CLOSE",
                     quantity=float(position.quantity),
@@ -147,7 +182,7 @@ class TradingService:
             
         except Exception as e:
             logger.error(f"포지션 청산 실패: {e}")
-            await self.notification.send_error_notification(e)
+            self.notification.send_error_notification(e)
             raise
 
     async def get_position(self, symbol: str) -> Optional[Position]:
@@ -161,7 +196,7 @@ class TradingService:
                     self.positions[symbol] = position
                     # 중요한 PnL 변동시 알림
                     if abs(float(position.unrealized_pnl)) > 100:  # $100 이상 변동
-                        await self.notification.send_position_update(
+                        self.notification.send_position_update(
                             symbol=position.symbol,
                             side=position.side,
                             unrealized_pnl=float(position.unrealized_pnl)
@@ -171,43 +206,55 @@ class TradingService:
             
         except Exception as e:
             logger.error(f"포지션 조회 실패: {e}")
-            await self.notification.send_error_notification(e)
+            self.notification.send_error_notification(e)
             raise
 
     async def get_all_positions(self) -> List[Position]:
         """모든 포지션 조회"""
         try:
-            # 모든 포지션 최신화
-            positions = await self.binance.get_all_positions()
+            # 모든 포지션 최신화 (유저 스트림 상태 저장소 기준)
+            positions = [
+                Position.from_binance(pos)
+                for pos in await self.binance.get_all_positions()
+            ]
             self.positions = {pos.symbol: pos for pos in positions}
             return list(self.positions.values())
             
         except Exception as e:
             logger.error(f"포지션 조회 실패: {e}")
-            await self.notification.send_error_notification(e)
+            self.notification.send_error_notification(e)
             raise
 
     async def update_position(self, symbol: str):
         """포지션 정보 업데이트"""
         try:
             position = await self.binance.get_position(symbol)
+        except Exception as e:
+            logger.error(f"포지션 업데이트 실패: {e}")
+            self.notification.send_error_notification(e)
+            raise
+        await self.apply_position(symbol, position)
+
+    async def apply_position(self, symbol: str, position: Optional[Position]):
+        """이미 알고 있는 포지션 상태 반영 (REST 조회 없음)"""
+        try:
             if position:
                 self.positions[symbol] = position
                 # 중요한 PnL 변동시 알림
                 if abs(float(position.unrealized_pnl)) > 100:  # $100 이상 변동
-                    await self.notification.send_position_update(
+                    self.notification.send_position_update(
                         symbol=position.symbol,
                         side=position.side,
                         unrealized_pnl=float(position.unrealized_pnl)
                     )
             elif symbol in self.positions:
                 del self.positions[symbol]
-                await self.notification.send_message(
+                self.notification.notify(
                     f"포지션 종료: {symbol}",
                     alert_level="INFO"
                 )
                 
         except Exception as e:
             logger.error(f"포지션 업데이트 실패: {e}")
-            await self.notification.send_error_notification(e)
+            self.notification.send_error_notification(e)
             raise
\ No newline at end of file
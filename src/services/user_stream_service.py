@@ -0,0 +1,169 @@
+import asyncio
+import json
+import time
+from typing import Awaitable, Callable, List, Optional, Set
+import websockets
+from src.config.env import EnvConfig
+from src.models.trading import Position
+from src.services.account_store import AccountStore
+from src.utils.logger import LoggerMixin
+
+# REST 대조가 끝난 심볼 포지션을 받는 리스너 (심볼, 대조 결과)
+ReconcileListener = Callable[[str, Optional[Position]], Awaitable[None]]
+
+FSTREAM_URL = "wss://fstream.binance.com/ws/"
+FSTREAM_TESTNET_URL = "wss://stream.binancefuture.com/ws/"
+
+class UserStreamService(LoggerMixin):
+    """listenKey 기반 유저 데이터 스트림 소비자 (keepalive/재연결 포함)"""
+
+    def __init__(self, binance_service, store: AccountStore):
+        self.binance = binance_service
+        self.store = store
+        self.listen_key: Optional[str] = None
+        self.keepalive_interval = EnvConfig.USER_STREAM_KEEPALIVE_INTERVAL
+        self.resync_interval = EnvConfig.USER_STREAM_RESYNC_INTERVAL
+        self._stream_task: Optional[asyncio.Task] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._running = False
+        # 체결 누락 심볼 REST 대조 작업 (심볼당 하나)
+        self._reconciling: Set[str] = set()
+        self._reconcile_tasks: Set[asyncio.Task] = set()
+        self._reconcile_listeners: List[ReconcileListener] = []
+
+    def add_reconcile_listener(self, listener: ReconcileListener):
+        """체결 누락 대조 결과 리스너 등록"""
+        self._reconcile_listeners.append(listener)
+
+    @property
+    def stream_url(self) -> str:
+        base = FSTREAM_TESTNET_URL if self.binance.testnet else FSTREAM_URL
+        return f"{base}{self.listen_key}"
+
+    async def start(self):
+        """스트림 시작"""
+        if self._running:
+            return
+        self._running = True
+        self._stream_task = asyncio.create_task(self._run())
+        self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+        self.logger.info("유저 데이터 스트림 시작")
+
+    async def stop(self):
+        """스트림 종료"""
+        self._running = False
+        for task in (self._stream_task, self._keepalive_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._stream_task = None
+        self._keepalive_task = None
+        for task in list(self._reconcile_tasks):
+            task.cancel()
+
+        if self.listen_key:
+            try:
+                await self.binance._request("futures_stream_close", listenKey=self.listen_key)
+            except Exception as e:
+                self.logger.error(f"listenKey 종료 실패: {e}")
+            self.listen_key = None
+        self.store.invalidate()
+        self.logger.info("유저 데이터 스트림 종료")
+
+    async def resync(self):
+        """REST 스냅샷으로 계정 상태 재동기화"""
+        account = await self.binance._request("futures_account")
+        positions = await self.binance._request("futures_position_information")
+        open_orders = await self.binance._request("futures_get_open_orders")
+        self.store.load_snapshot(
+            account,
+            [
+                self.binance._format_position(pos)
+                for pos in positions
+                if float(pos["positionAmt"]) != 0
+            ],
+            open_orders
+        )
+
+    async def _run(self):
+        """연결/수신 루프 (끊기면 지수 백오프로 재연결)"""
+        backoff = 1
+        while self._running:
+            try:
+                self.listen_key = await self.binance._request("futures_stream_get_listen_key")
+                async with websockets.connect(self.stream_url, ping_interval=None) as ws:
+                    # 연결 후 스냅샷을 받아 단절 구간의 누락을 보정
+                    await self.resync()
+                    backoff = 1
+                    await self._consume(ws)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"유저 데이터 스트림 오류: {e}")
+
+            self.store.invalidate()
+            if self._running:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+
+    async def _consume(self, ws):
+        """스트림 메시지 처리"""
+        synced_at = time.time()
+        while self._running:
+            timeout = max(self.resync_interval - (time.time() - synced_at), 1)
+            try:
+                message = await asyncio.wait_for(ws.recv(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # 스트림에 없는 필드(청산가/가용 잔고) 보정을 위한 주기적 재동기화
+                await self.resync()
+                synced_at = time.time()
+                continue
+
+            event = json.loads(message)
+            event_type = event.get('e')
+
+            if event_type == 'listenKeyExpired':
+                self.logger.warning("listenKey 만료, 재연결")
+                return
+
+            for symbol in self.store.apply_event(event, leverage_lookup=self.binance.get_leverage):
+                self._schedule_reconcile(symbol)
+            if event_type == 'ACCOUNT_CONFIG_UPDATE':
+                config = event.get('ac', {})
+                if config.get('s') and config.get('l') is not None:
+                    self.binance.apply_leverage_update(config['s'], config['l'])
+
+    def _schedule_reconcile(self, symbol: str):
+        """체결 누락 심볼 REST 대조 예약 (스트림 수신은 막지 않음)"""
+        if symbol in self._reconciling:
+            return
+        self._reconciling.add(symbol)
+        task = asyncio.create_task(self._reconcile(symbol))
+        self._reconcile_tasks.add(task)
+        task.add_done_callback(self._reconcile_tasks.discard)
+
+    async def _reconcile(self, symbol: str):
+        # 실패하면 계정 상태에 대조 대기로 남아 다음 이벤트에서 다시 시도
+        try:
+            position = await self.binance.reconcile_position(symbol)
+            for listener in self._reconcile_listeners:
+                await listener(symbol, position)
+        except Exception as e:
+            self.logger.error(f"포지션 대조 실패 ({symbol}): {e}")
+        finally:
+            self._reconciling.discard(symbol)
+
+    async def _keepalive_loop(self):
+        """listenKey 유효기간(60분) 연장"""
+        while self._running:
+            await asyncio.sleep(self.keepalive_interval)
+            if not self.listen_key:
+                continue
+            try:
+                await self.binance._request("futures_stream_keepalive", listenKey=self.listen_key)
+                self.logger.debug("listenKey keepalive 완료")
+            except Exception as e:
+                self.logger.error(f"listenKey keepalive 실패: {e}")
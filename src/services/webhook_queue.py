@@ -0,0 +1,122 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+from src.config.env import EnvConfig
+from src.utils.logger import LoggerMixin
+from src.utils.metrics import metrics_manager
+
+WebhookHandler = Callable[[str, List[dict]], Awaitable[None]]
+
+# 재시도를 모두 실패한 배치 보관 수
+DEAD_LETTER_SIZE = 100
+
+class WebhookQueue(LoggerMixin):
+    """검증된 웹훅 이벤트를 키(심볼)별로 모아 제한된 워커 풀로 처리하는 큐"""
+
+    def __init__(self, max_size: int = None, workers: int = None, max_retries: int = None, retry_delay: float = 0.5):
+        self.max_size = max_size or EnvConfig.WEBHOOK_QUEUE_SIZE
+        self.workers = workers or EnvConfig.WEBHOOK_WORKERS
+        self.max_retries = max_retries if max_retries is not None else EnvConfig.WEBHOOK_MAX_RETRIES
+        self.retry_delay = retry_delay
+        # 키별 대기 이벤트와 가장 오래된 이벤트의 수신 시각
+        self._pending: Dict[str, List[dict]] = {}
+        self._received_at: Dict[str, float] = {}
+        # 처리 대기 중인 키 (키당 한 번만 들어감)
+        self._ready: asyncio.Queue = asyncio.Queue()
+        # 처리 중인 키 (같은 키는 한 워커만 처리해 순서 보장)
+        self._inflight: Set[str] = set()
+        self._handler: Optional[WebhookHandler] = None
+        self._tasks: List[asyncio.Task] = []
+        # 키별 연속 처리 실패 횟수와 재시도를 모두 실패한 배치 (키, 이벤트, 오류)
+        self._attempts: Dict[str, int] = {}
+        self.dead_letters: Deque[Tuple[str, List[dict], str]] = deque(maxlen=DEAD_LETTER_SIZE)
+        self.depth = 0
+
+    def submit(self, key: str, event: dict) -> bool:
+        """이벤트 등록 (큐가 가득 차면 False, 같은 키의 대기 이벤트와 합쳐 처리)"""
+        return self.submit_many([(key, event)])
+
+    def submit_many(self, items: List[Tuple[str, dict]]) -> bool:
+        """여러 이벤트를 한 번에 등록 (모두 들어갈 자리가 없으면 하나도 등록하지 않음)"""
+        if self.depth + len(items) > self.max_size:
+            metrics_manager.webhook_events_rejected.inc(len(items))
+            return False
+        for key, event in items:
+            self._add(key, event)
+        metrics_manager.webhook_queue_depth.set(self.depth)
+        return True
+
+    def _add(self, key: str, event: dict):
+        events = self._pending.get(key)
+        if events is None:
+            self._pending[key] = [event]
+            self._received_at[key] = time.monotonic()
+            if key not in self._inflight:
+                self._ready.put_nowait(key)
+        else:
+            events.append(event)
+            metrics_manager.webhook_events_coalesced.inc()
+        self.depth += 1
+
+    async def start(self, handler: WebhookHandler):
+        """워커 풀 시작"""
+        self._handler = handler
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self.logger.info(f"웹훅 워커 {self.workers}개 시작 (큐 크기: {self.max_size})")
+
+    async def stop(self, timeout: float = 5.0):
+        """대기 이벤트를 timeout까지 처리한 뒤 워커 종료"""
+        deadline = time.monotonic() + timeout
+        while (self.depth or self._inflight) and self._tasks and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        if self.depth:
+            self.logger.warning(f"처리하지 못한 웹훅 이벤트 {self.depth}개 폐기")
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self):
+        while True:
+            key = await self._ready.get()
+            events = self._pending.pop(key, None)
+            received_at = self._received_at.pop(key, None)
+            if not events:
+                continue
+            self.depth -= len(events)
+            metrics_manager.webhook_queue_depth.set(self.depth)
+            self._inflight.add(key)
+            retry = False
+            try:
+                await self._handler(key, events)
+                self._attempts.pop(key, None)
+            except Exception as e:
+                retry = self._on_failure(key, events, received_at, e)
+            finally:
+                self._inflight.discard(key)
+                metrics_manager.webhook_processing_lag.observe(time.monotonic() - received_at)
+                # 처리 중 도착한 같은 키 이벤트는 다시 대기열로 (재시도는 지연 후)
+                if key in self._pending:
+                    if retry:
+                        delay = self.retry_delay * 2 ** (self._attempts[key] - 1)
+                        asyncio.get_running_loop().call_later(delay, self._ready.put_nowait, key)
+                    else:
+                        self._ready.put_nowait(key)
+
+    def _on_failure(self, key: str, events: List[dict], received_at: float, error: Exception) -> bool:
+        """실패한 배치를 순서를 유지해 대기 이벤트 앞에 다시 넣음 (재시도 소진 시 dead letter)"""
+        attempts = self._attempts.get(key, 0) + 1
+        if attempts > self.max_retries:
+            self._attempts.pop(key, None)
+            self.dead_letters.append((key, events, str(error)))
+            metrics_manager.webhook_events_failed.inc(len(events))
+            self.logger.error(f"웹훅 이벤트 처리 최종 실패 ({key}, {len(events)}건, {attempts - 1}회 재시도): {error}")
+            return False
+        self._attempts[key] = attempts
+        self._pending[key] = events + self._pending.get(key, [])
+        self._received_at[key] = received_at
+        self.depth += len(events)
+        metrics_manager.webhook_queue_depth.set(self.depth)
+        self.logger.warning(f"웹훅 이벤트 처리 실패, 재시도 {attempts}/{self.max_retries} ({key}, {len(events)}건): {error}")
+        return True
@@ -1,21 +1,105 @@
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import Dict, Set
+from typing import Awaitable, Callable, Dict, List, Optional, Set
 import asyncio
 import json
-from utils.logger import logger
+import time
+from src.services.client_connection import ClientConnection
+from src.config.env import EnvConfig
+from src.services.replay_buffer import ChannelBuffer
+from src.utils.logger import logger
+from src.utils.serialization import dumps
+from src.utils.wire_format import Frame, WireFormat, encode
+
+# 유휴 채널 버퍼 정리 검사 주기 (초)
+REPLAY_SWEEP_INTERVAL = 30.0
 
 class WebSocketManager:
     def __init__(self):
         # 심볼별 활성 연결 관리
         self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # 연결별 송신 큐/writer
+        self.clients: Dict[WebSocket, ClientConnection] = {}
+        # 채널별 시퀀스/재전송 버퍼 (가격 채널은 심볼 이름 사용)
+        self.channels: Dict[str, ChannelBuffer] = {}
+        # 정리된 채널의 마지막 시퀀스 (다시 만들 때 이어서 부여)
+        self._evicted_seq: Dict[str, int] = {}
+        self._swept_at = time.monotonic()
+        # 서버 재시작 시 시퀀스가 초기화되므로 클라이언트가 비교할 수 있도록 epoch 제공
+        self.epoch = format(int(time.time() * 1000), 'x')
         self._lock = asyncio.Lock()
         logger.info("WebSocket 매니저 초기화 완료")
 
+    def register(self, websocket: WebSocket, wire_format: WireFormat = WireFormat.JSON) -> ClientConnection:
+        """수락된 연결의 송신 큐와 writer 태스크 생성"""
+        client = self.clients.get(websocket)
+        if client is None:
+            client = ClientConnection(
+                websocket,
+                on_close=self._on_client_closed,
+                wire_format=wire_format
+            )
+            client.start()
+            self.clients[websocket] = client
+        return client
+
+    async def unregister(self, websocket: WebSocket):
+        """연결의 모든 구독과 송신 큐 정리"""
+        client = self.clients.pop(websocket, None)
+        if client is None:
+            return
+        async with self._lock:
+            # 역인덱스로 이 연결이 구독한 심볼만 정리
+            for symbol in client.subscriptions:
+                connections = self.active_connections.get(symbol)
+                if connections is None:
+                    continue
+                connections.discard(websocket)
+                if not connections:
+                    del self.active_connections[symbol]
+            client.subscriptions.clear()
+        await client.close()
+
+    def get_subscriptions(self, websocket: WebSocket) -> Set[str]:
+        """연결이 구독 중인 심볼"""
+        client = self.clients.get(websocket)
+        return set(client.subscriptions) if client else set()
+
+    def set_batch_interval(self, websocket: WebSocket, interval_ms: Optional[float]):
+        """클라이언트 배치 전송 주기 설정"""
+        client = self.register(websocket)
+        client.set_batch_interval(interval_ms)
+
+    async def _on_client_closed(self, client: ClientConnection):
+        """느린 클라이언트 강제 종료 등으로 연결이 닫힌 경우"""
+        if self.clients.get(client.websocket) is client:
+            await self.unregister(client.websocket)
+
+    def get_client(self, websocket: WebSocket) -> Optional[ClientConnection]:
+        return self.clients.get(websocket)
+
+    def get_active_connections(self) -> int:
+        """활성 연결 수"""
+        return len(self.clients)
+
+    def get_slow_consumers(self, min_lag: float = 1.0) -> List[dict]:
+        """송신 지연이 큰 연결 목록"""
+        return [
+            {
+                "client": client.client_id,
+                "lag": client.lag,
+                "queue_depth": client.queue_depth,
+                "dropped": client.dropped
+            }
+            for client in self.clients.values()
+            if client.lag >= min_lag
+        ]
+
     async def connect(self, websocket: WebSocket, symbol: str = "BTCUSDT"):
         """새로운 WebSocket 연결 처리"""
         try:
             # WebSocket 연결 수락
             await websocket.accept()
+            client = self.register(websocket)
             
             async with self._lock:
                 # 심볼에 대한 연결 세트가 없으면 생성
@@ -24,6 +108,7 @@ class WebSocketManager:
                     
                 # 연결 추가
                 self.active_connections[symbol].add(websocket)
+                client.subscriptions.add(symbol)
                 
             logger.info(f"새로운 WebSocket 연결 수락됨 (symbol: {symbol}, 총 연결: {len(self.active_connections[symbol])})")
             
@@ -44,6 +129,21 @@ class WebSocketManager:
                 await self.disconnect(websocket, symbol)
             raise
 
+    async def subscribe(self, websocket: WebSocket, symbol: str):
+        """이미 수락된 연결을 심볼 구독자로 등록"""
+        client = self.register(websocket)
+        async with self._lock:
+            if symbol not in self.active_connections:
+                self.active_connections[symbol] = set()
+            self.active_connections[symbol].add(websocket)
+            client.subscriptions.add(symbol)
+        logger.info(f"심볼 구독 등록 (symbol: {symbol}, 총 연결: {len(self.active_connections[symbol])})")
+
+    def set_rate(self, websocket: WebSocket, symbol: str, max_hz: Optional[float]):
+        """클라이언트의 심볼별 최대 전송 빈도 설정"""
+        client = self.register(websocket)
+        client.set_rate(symbol, max_hz)
+
     async def disconnect(self, websocket: WebSocket, symbol: str):
         """WebSocket 연결 종료 처리"""
         try:
@@ -51,6 +151,10 @@ class WebSocketManager:
                 if symbol in self.active_connections:
                     # 연결 제거
                     self.active_connections[symbol].discard(websocket)
+                    client = self.clients.get(websocket)
+                    if client:
+                        client.subscriptions.discard(symbol)
+                        client.set_rate(symbol, None)
                     logger.info(f"WebSocket 연결 종료됨 (symbol: {symbol}, 남은 연결: {len(self.active_connections[symbol])})")
                     
                     # 해당 심볼의 마지막 연결이 종료되면 세트 제거
@@ -61,33 +165,106 @@ class WebSocketManager:
         except Exception as e:
             logger.error(f"WebSocket 연결 종료 중 오류 발생: {e}")
 
+    def get_channel(self, channel: str) -> ChannelBuffer:
+        buffer = self.channels.get(channel)
+        if buffer is None:
+            # 정리된 채널은 이전 시퀀스부터 이어서 부여 (오래된 resume_from은 스냅샷으로 처리됨)
+            buffer = self.channels[channel] = ChannelBuffer(seq=self._evicted_seq.pop(channel, 0))
+        return buffer
+
+    def sweep_idle_channels(self, now: Optional[float] = None):
+        """구독자 없이 WS_REPLAY_IDLE_TTL 이상 지난 채널의 재전송 버퍼 정리"""
+        now = time.monotonic() if now is None else now
+        if now - self._swept_at < REPLAY_SWEEP_INTERVAL:
+            return
+        self._swept_at = now
+        for channel, buffer in list(self.channels.items()):
+            if self.active_connections.get(channel):
+                buffer.idle_since = None
+            elif buffer.idle_since is None:
+                buffer.idle_since = now
+            elif now - buffer.idle_since >= EnvConfig.WS_REPLAY_IDLE_TTL:
+                del self.channels[channel]
+                self._evicted_seq[channel] = buffer.seq
+
+    def publish(self, channel: str, message: dict, conflate: bool = True) -> int:
+        """채널 시퀀스를 부여해 버퍼에 저장하고 구독자에 전송 (conflate=False면 병합/스로틀 제외)"""
+        self.sweep_idle_channels()
+        message = self.get_channel(channel).append(message)
+        self._fanout(message, channel, conflate)
+        return message['seq']
+
+    async def resume(
+        self,
+        websocket: WebSocket,
+        channel: str,
+        resume_from: Optional[int],
+        epoch: Optional[str],
+        snapshot: Callable[[], Awaitable[Optional[dict]]]
+    ) -> str:
+        """재연결 클라이언트에 누락 구간 재전송 (버퍼에서 밀려났으면 스냅샷)"""
+        client = self.clients.get(websocket)
+        if client is None:
+            return 'none'
+        buffer = self.get_channel(channel)
+        if resume_from is not None and (epoch is None or epoch == self.epoch):
+            missed = buffer.since(int(resume_from))
+            if missed is not None:
+                # 재전송은 병합 대상이 아니므로 키 없이 순서대로 추가
+                for message in missed:
+                    client.enqueue(encode(message, client.format))
+                return 'replay'
+
+        message = await snapshot()
+        if message is None:
+            return 'none'
+        # 스냅샷은 생성 시점의 채널 시퀀스 기준 상태
+        message['seq'] = buffer.seq
+        message['snapshot'] = True
+        client.enqueue(encode(message, client.format))
+        return 'snapshot'
+
     async def broadcast(self, message: dict, symbol: str):
         """특정 심볼을 구독 중인 모든 클라이언트에 메시지 전송"""
         if symbol not in self.active_connections:
             return
+        self._fanout(message, symbol)
 
-        disconnected = set()
-        
-        for connection in self.active_connections[symbol].copy():  # 복사본으로 순회
-            try:
-                await connection.send_json(message)
-            except WebSocketDisconnect:
-                disconnected.add(connection)
-                logger.warning(f"브로드캐스트 중 연결 끊김 감지 (symbol: {symbol})")
-            except Exception as e:
-                logger.error(f"브로드캐스트 중 오류 발생: {e}")
-                disconnected.add(connection)
-
-        # 끊어진 연결 제거
-        if disconnected:
-            async with self._lock:
-                self.active_connections[symbol] -= disconnected
-                logger.info(f"끊어진 연결 제거됨 (symbol: {symbol}, 제거된 연결: {len(disconnected)})")
+    def _fanout(self, message: dict, symbol: str, conflate: bool = True):
+        # 메시지는 포맷별로 한 번만 직렬화하고 같은 프레임을 모든 연결에 전송
+        frames: Dict[WireFormat, Frame] = {}
+        key = symbol if conflate else None
+        for connection in self.active_connections.get(symbol, ()):
+            client = self.clients.get(connection)
+            if client is None:
+                continue
+            frame = frames.get(client.format)
+            if frame is None:
+                frame = frames[client.format] = encode(message, client.format)
+            # 느린 연결은 자신의 큐에서만 지연/드롭되고 다른 구독자에 영향 없음
+            client.enqueue(frame, key=key)
+
+    async def broadcast_text(self, payload: Frame, symbol: str):
+        """미리 직렬화된 프레임을 구독 클라이언트 송신 큐에 추가 (블로킹 없음, 포맷 무관)"""
+        connections = self.active_connections.get(symbol)
+        if not connections:
+            return
+
+        for connection in connections:
+            client = self.clients.get(connection)
+            if client:
+                # 느린 연결은 자신의 큐에서만 지연/드롭되고 다른 구독자에 영향 없음
+                client.enqueue(payload, key=symbol)
 
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """특정 클라이언트에 메시지 전송"""
         try:
-            await websocket.send_json(message)
+            client = self.clients.get(websocket)
+            if client:
+                # 브로드캐스트와 같은 writer를 통해 순서 보장
+                client.enqueue(encode(message, client.format))
+            else:
+                await websocket.send_text(dumps(message))
         except Exception as e:
             logger.error(f"개별 메시지 전송 중 오류 발생: {e}")
             raise
@@ -95,17 +272,20 @@ class WebSocketManager:
     async def change_symbol(self, websocket: WebSocket, old_symbol: str, new_symbol: str):
         """클라이언트의 구독 심볼 변경"""
         try:
+            client = self.register(websocket)
             async with self._lock:
                 # 이전 심볼에서 연결 제거
                 if old_symbol in self.active_connections:
                     self.active_connections[old_symbol].discard(websocket)
                     if not self.active_connections[old_symbol]:
                         del self.active_connections[old_symbol]
+                client.subscriptions.discard(old_symbol)
                 
                 # 새 심볼에 연결 추가
                 if new_symbol not in self.active_connections:
                     self.active_connections[new_symbol] = set()
                 self.active_connections[new_symbol].add(websocket)
+                client.subscriptions.add(new_symbol)
             
             logger.info(f"심볼 변경됨: {old_symbol} -> {new_symbol}")
             
@@ -18,4 +18,14 @@ class PositionError(TradingException):
 
 class OrderError(TradingException):
     def __init__(self, detail: str):
-        super().__init__(detail=f"Order Error: {detail}")
\ No newline at end of file
+        super().__init__(detail=f"Order Error: {detail}")
+
+class BracketProtectionError(OrderError):
+    def __init__(self, detail: str, entry: dict):
+        super().__init__(detail)
+        # 이미 접수된 진입 주문 응답
+        self.entry = entry
+
+class RateLimitError(TradingException):
+    def __init__(self, detail: str):
+        super().__init__(detail=f"Rate Limit Error: {detail}", status_code=429)
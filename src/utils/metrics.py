@@ -23,6 +23,81 @@ class MetricsManager:
             ['symbol']
         )
 
+        self.risk_rejections = Counter(
+            'trading_risk_rejections_total',
+            'Orders rejected by the pre-trade risk engine',
+            ['rule']
+        )
+
+        self.orders_rejected_locally = Counter(
+            'trading_orders_rejected_locally_total',
+            'Orders rejected by local pre-trade filter validation',
+            ['symbol', 'reason']
+        )
+
+        # 포트폴리오 리스크 모니터 메트릭
+        self.portfolio_notional = Gauge(
+            'portfolio_notional_usdt',
+            'Total notional of open positions at mark price'
+        )
+
+        self.portfolio_unrealized_pnl = Gauge(
+            'portfolio_unrealized_pnl_usdt',
+            'Total unrealized PnL of open positions at mark price'
+        )
+
+        self.account_margin_ratio = Gauge(
+            'account_margin_ratio',
+            'Cross margin ratio (maintenance margin / cross margin balance)'
+        )
+
+        self.position_margin_ratio = Gauge(
+            'position_margin_ratio',
+            'Margin ratio of a position (cross positions report the account ratio)',
+            ['symbol', 'side']
+        )
+
+        self.position_liquidation_distance = Gauge(
+            'position_liquidation_distance_percent',
+            'Adverse mark price move left before liquidation, in percent',
+            ['symbol', 'side']
+        )
+
+        self.risk_alerts = Counter(
+            'portfolio_risk_alerts_total',
+            'Portfolio risk threshold alerts raised',
+            ['kind']
+        )
+
+        # 심볼별 주문 실행 파이프라인 메트릭
+        self.order_queue_wait = Histogram(
+            'trading_order_queue_wait_seconds',
+            'Time an order waited in its symbol execution queue',
+            ['symbol']
+        )
+
+        self.order_execution_time = Histogram(
+            'trading_order_execution_seconds',
+            'Time spent executing an order job',
+            ['symbol', 'action']
+        )
+
+        # 알림 아웃박스 메트릭
+        self.notification_outbox_depth = Gauge(
+            'notification_outbox_depth',
+            'Notifications waiting in the outbox'
+        )
+
+        self.notifications_dropped = Counter(
+            'notifications_dropped_total',
+            'Notifications dropped because the outbox was full'
+        )
+
+        self.notifications_failed = Counter(
+            'notifications_failed_total',
+            'Notifications that failed to send'
+        )
+
         # API 성능 메트릭
         self.api_latency = Histogram(
             'api_request_latency_seconds',
@@ -37,12 +112,128 @@ class MetricsManager:
             ['endpoint', 'status']
         )
 
+        # 바이낸스 요청 가중치 예산 메트릭
+        self.binance_weight_used = Gauge(
+            'binance_weight_used',
+            'Request weight used in the current 1m window'
+        )
+
+        self.binance_weight_limit = Gauge(
+            'binance_weight_limit',
+            'Request weight limit per 1m window'
+        )
+
+        self.binance_weight_remaining = Gauge(
+            'binance_weight_remaining',
+            'Request weight remaining in the current 1m window'
+        )
+
+        self.binance_order_count = Gauge(
+            'binance_order_count',
+            'Order count in the current rate-limit window',
+            ['window']
+        )
+
+        self.binance_scheduler_queue_depth = Gauge(
+            'binance_scheduler_queue_depth',
+            'Binance requests waiting for rate-limit budget',
+            ['priority']
+        )
+
+        self.binance_requests_shed = Counter(
+            'binance_requests_shed_total',
+            'Low-priority Binance requests rejected due to rate-limit budget',
+            ['endpoint']
+        )
+
+        self.binance_rate_limit_hits = Counter(
+            'binance_rate_limit_hits_total',
+            'Binance 429/418 responses',
+            ['status']
+        )
+
         # 시스템 메트릭
         self.active_connections = Gauge(
             'websocket_active_connections',
             'Number of active WebSocket connections'
         )
 
+        # WebSocket 송신 큐 메트릭
+        self.ws_send_queue_lag = Gauge(
+            'websocket_send_queue_lag_seconds',
+            'Age of the oldest frame waiting in the connection send queue',
+            ['client']
+        )
+
+        self.ws_send_queue_depth = Gauge(
+            'websocket_send_queue_depth',
+            'Frames waiting in the connection send queue',
+            ['client']
+        )
+
+        self.ws_messages_dropped = Counter(
+            'websocket_messages_dropped_total',
+            'Frames dropped or conflated by the send queue overflow policy',
+            ['policy']
+        )
+
+        self.ws_slow_consumer_disconnects = Counter(
+            'websocket_slow_consumer_disconnects_total',
+            'Connections closed because their send queue overflowed'
+        )
+
+        # 마켓 데이터 메트릭
+        self.order_book_resyncs = Counter(
+            'order_book_resyncs_total',
+            'Local order book resyncs caused by diff-depth sequence gaps',
+            ['symbol']
+        )
+
+        # 계정 상태 메트릭
+        self.account_events_stale = Counter(
+            'account_events_stale_total',
+            'Account events dropped because a newer update was already applied',
+            ['event']
+        )
+
+        self.position_reconciliations = Counter(
+            'position_reconciliations_total',
+            'REST position reconciliations triggered by detected event gaps',
+            ['symbol']
+        )
+
+        # 웹훅 큐 메트릭
+        self.webhook_queue_depth = Gauge(
+            'webhook_queue_depth',
+            'Webhook events waiting to be processed'
+        )
+
+        self.webhook_processing_lag = Histogram(
+            'webhook_processing_lag_seconds',
+            'Time from webhook receipt to processing completion'
+        )
+
+        self.webhook_events_coalesced = Counter(
+            'webhook_events_coalesced_total',
+            'Webhook events merged into a pending batch for the same symbol'
+        )
+
+        self.webhook_requests_rejected = Counter(
+            'webhook_requests_rejected_total',
+            'Webhook requests rejected during verification',
+            ['reason']
+        )
+
+        self.webhook_events_failed = Counter(
+            'webhook_events_failed_total',
+            'Webhook events dropped after exhausting processing retries'
+        )
+
+        self.webhook_events_rejected = Counter(
+            'webhook_events_rejected_total',
+            'Webhook events rejected because the queue was full'
+        )
+
         self.memory_usage = Gauge(
             'app_memory_usage_bytes',
             'Memory usage in bytes'
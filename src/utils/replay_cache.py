@@ -0,0 +1,41 @@
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+class ReplayCacheFull(Exception):
+    """만료되지 않은 키로 캐시가 가득 참 (재전송 판별 불가)"""
+
+class ReplayCache:
+    """최근 본 키(서명)를 TTL 동안 기억하는 크기 제한 캐시 (조회/등록 O(1))"""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        # 키 -> 만료 시각 (등록 순서 = 만료 순서)
+        self._entries: 'OrderedDict[Hashable, float]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, now: float):
+        # 만료된 항목만 제거 (유효한 키를 밀어내면 재전송을 통과시키게 됨)
+        while self._entries:
+            key, expires_at = next(iter(self._entries.items()))
+            if expires_at > now:
+                break
+            self._entries.popitem(last=False)
+
+    def check_and_add(self, key: Hashable) -> bool:
+        """처음 본 키면 등록 후 True, 이미 본 키(재전송)면 False (가득 차면 ReplayCacheFull)"""
+        now = time.monotonic()
+        self._evict(now)
+        if key in self._entries:
+            return False
+        if len(self._entries) >= self.max_size:
+            raise ReplayCacheFull(f"replay cache full ({self.max_size})")
+        self._entries[key] = now + self.ttl
+        return True
+
+    def discard(self, key: Hashable):
+        """등록 취소 (처리하지 못한 요청의 재시도 허용)"""
+        self._entries.pop(key, None)
@@ -0,0 +1,34 @@
+import json
+from decimal import Decimal
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+def _default(obj: Any):
+    """JSON 기본 인코더가 처리하지 못하는 타입 변환"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_bytes(obj: Any) -> bytes:
+    """객체를 UTF-8 JSON 바이트로 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default)
+    return json.dumps(obj, default=_default, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def dumps(obj: Any) -> str:
+    """객체를 JSON 문자열로 직렬화 (텍스트 프레임용)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default).decode('utf-8')
+    return json.dumps(obj, default=_default, separators=(',', ':'), ensure_ascii=False)
+
+def loads(data: Union[str, bytes]) -> Any:
+    """JSON 역직렬화"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,116 @@
+import struct
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Union
+from src.utils.serialization import dumps
+
+try:
+    import msgpack
+except ImportError:  # msgpack 미설치 시 JSON/바이너리 틱만 지원
+    msgpack = None
+
+Frame = Union[str, bytes]
+
+# 바이너리 틱 레이아웃: 메시지 타입(uint8), 심볼 ID(uint16), 가격(float64), 타임스탬프 ms(int64), 시퀀스(uint32)
+TICK_STRUCT = struct.Struct('<BHdqI')
+TICK_TYPE_PRICE = 1
+
+# WebSocket 서브프로토콜 이름
+SUBPROTOCOL_PREFIX = 'wuya.'
+
+class WireFormat(str, Enum):
+    JSON = 'json'         # 텍스트 JSON (기본값, 협상하지 않은 클라이언트)
+    MSGPACK = 'msgpack'   # MessagePack 바이너리 프레임
+    BINARY = 'binary'     # 고정 길이 바이너리 틱 (가격 외 메시지는 JSON 텍스트)
+
+    @property
+    def subprotocol(self) -> str:
+        return f"{SUBPROTOCOL_PREFIX}{self.value}"
+
+class SymbolRegistry:
+    """바이너리 틱용 심볼 ID 할당 (프로세스 단위, subscribed 응답으로 전달)"""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._symbols: List[str] = []
+
+    def get_id(self, symbol: str) -> int:
+        symbol_id = self._ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self._symbols)
+            self._ids[symbol] = symbol_id
+            self._symbols.append(symbol)
+        return symbol_id
+
+    def get_symbol(self, symbol_id: int) -> Optional[str]:
+        return self._symbols[symbol_id] if symbol_id < len(self._symbols) else None
+
+symbol_registry = SymbolRegistry()
+
+def available_formats() -> List[WireFormat]:
+    """현재 환경에서 사용 가능한 포맷"""
+    formats = [WireFormat.JSON, WireFormat.BINARY]
+    if msgpack is not None:
+        formats.append(WireFormat.MSGPACK)
+    return formats
+
+def negotiate(subprotocols: List[str], requested: Optional[str] = None) -> Tuple[WireFormat, Optional[str]]:
+    """서브프로토콜 또는 format 쿼리로 포맷 결정 (선택한 서브프로토콜 함께 반환)"""
+    formats = available_formats()
+    for subprotocol in subprotocols:
+        if subprotocol.startswith(SUBPROTOCOL_PREFIX):
+            try:
+                fmt = WireFormat(subprotocol[len(SUBPROTOCOL_PREFIX):])
+            except ValueError:
+                continue
+            if fmt in formats:
+                return fmt, subprotocol
+    if requested:
+        fmt = WireFormat(requested.lower())
+        if fmt not in formats:
+            raise ValueError(f"unsupported wire format: {requested}")
+        return fmt, None
+    return WireFormat.JSON, None
+
+def _msgpack_default(obj: Any):
+    """MessagePack 기본 인코더가 처리하지 못하는 타입 변환"""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+def encode(message: dict, fmt: WireFormat) -> Frame:
+    """메시지를 포맷별 프레임으로 직렬화"""
+    if fmt == WireFormat.MSGPACK:
+        return msgpack.packb(message, default=_msgpack_default)
+    if fmt == WireFormat.BINARY and message.get('type') == 'price':
+        data = message['data']
+        return TICK_STRUCT.pack(
+            TICK_TYPE_PRICE,
+            symbol_registry.get_id(data['symbol']),
+            float(data['price']),
+            int(data['timestamp'] or 0),
+            message.get('seq', 0)
+        )
+    return dumps(message)
+
+def decode_tick(frame: bytes) -> dict:
+    """바이너리 틱 디코딩 (테스트/디버깅용)"""
+    _, symbol_id, price, timestamp, seq = TICK_STRUCT.unpack(frame)
+    return {
+        'symbol': symbol_registry.get_symbol(symbol_id),
+        'price': price,
+        'timestamp': timestamp,
+        'seq': seq
+    }
+
+def join_frames(frames: List[Frame], fmt: WireFormat) -> Frame:
+    """미리 직렬화된 같은 포맷의 프레임들을 하나의 배치 프레임으로 결합 (재직렬화 없음)"""
+    if fmt == WireFormat.JSON:
+        return '{"type":"batch","data":[' + ','.join(frames) + ']}'
+    if fmt == WireFormat.BINARY:
+        # 고정 길이 틱은 이어 붙이기만 하면 됨
+        return b''.join(frames)
+    packer = msgpack.Packer()
+    return (
+        packer.pack_map_header(2) + packer.pack('type') + packer.pack('batch')
+        + packer.pack('data') + packer.pack_array_header(len(frames)) + b''.join(frames)
+    )
@@ -0,0 +1,75 @@
+import pytest
+import asyncio
+import json
+import time
+from src.services.websocket_manager import WebSocketManager
+
+class FakeWebSocket:
+    """전송 비용 없이 직렬화 비용만 측정하기 위한 WebSocket"""
+    def __init__(self):
+        self.frames = 0
+
+    async def send_text(self, data: str):
+        self.frames += 1
+
+def make_message(tick: int) -> dict:
+    return {
+        'type': 'price',
+        'data': {
+            'symbol': 'BTCUSDT',
+            'price': f"{50000 + tick * 0.1:.1f}",
+            'index_price': f"{49990 + tick * 0.1:.1f}",
+            'funding_rate': "0.00010000",
+            'timestamp': str(1700000000000 + tick * 1000)
+        }
+    }
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+class TestBroadcastPerformance:
+    TICKS = 50
+
+    async def _setup(self, subscribers: int) -> WebSocketManager:
+        manager = WebSocketManager()
+        for _ in range(subscribers):
+            await manager.subscribe(FakeWebSocket(), "BTCUSDT")
+        return manager
+
+    async def _cpu_per_tick_encode_once(self, manager: WebSocketManager) -> float:
+        start = time.process_time()
+        for tick in range(self.TICKS):
+            await manager.broadcast(make_message(tick), "BTCUSDT")
+            # 연결별 writer 태스크가 큐를 비우도록 양보
+            await asyncio.sleep(0)
+        return (time.process_time() - start) / self.TICKS
+
+    async def _cpu_per_tick_per_connection(self, manager: WebSocketManager) -> float:
+        start = time.process_time()
+        for tick in range(self.TICKS):
+            message = make_message(tick)
+            # 같은 송신 경로(연결별 큐)에서 직렬화만 연결마다 수행
+            for connection in manager.active_connections["BTCUSDT"]:
+                manager.clients[connection].enqueue(
+                    json.dumps(message, separators=(",", ":")), key="BTCUSDT"
+                )
+            await asyncio.sleep(0)
+        return (time.process_time() - start) / self.TICKS
+
+    @pytest.mark.parametrize("subscribers", [100, 1000, 5000])
+    async def test_broadcast_cpu_per_tick(self, subscribers: int):
+        """구독자 수별 틱당 CPU 시간 (1회 직렬화 vs 연결별 직렬화)"""
+        manager = await self._setup(subscribers)
+
+        encode_once = await self._cpu_per_tick_encode_once(manager)
+        per_connection = await self._cpu_per_tick_per_connection(manager)
+
+        for client in list(manager.clients.values()):
+            await client.close()
+
+        print(
+            f"\nsubscribers={subscribers} "
+            f"encode_once={encode_once * 1000:.3f}ms/tick "
+            f"per_connection={per_connection * 1000:.3f}ms/tick "
+            f"speedup={per_connection / encode_once:.1f}x"
+        )
+        assert encode_once < per_connection
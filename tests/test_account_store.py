@@ -0,0 +1,119 @@
+import pytest
+from src.services.account_store import AccountStore
+
+ACCOUNT = {
+    "totalWalletBalance": "1000",
+    "totalUnrealizedProfit": "0",
+    "totalMarginBalance": "1000",
+    "availableBalance": "900",
+    "maxWithdrawAmount": "900",
+    "assets": [{"asset": "USDT", "walletBalance": "1000", "crossWalletBalance": "1000"}]
+}
+
+def make_store() -> AccountStore:
+    store = AccountStore()
+    store.load_snapshot(ACCOUNT, [], [])
+    return store
+
+class TestAccountStore:
+    def test_account_update(self):
+        """ACCOUNT_UPDATE 반영 테스트"""
+        store = make_store()
+        store.apply_event({
+            "e": "ACCOUNT_UPDATE",
+            "E": 1,
+            "a": {
+                "B": [{"a": "USDT", "wb": "990", "cw": "990"}],
+                "P": [{"s": "BTCUSDT", "pa": "0.01", "ep": "50000", "up": "5", "iw": "0", "ps": "BOTH"}]
+            }
+        }, leverage_lookup=lambda symbol: 20)
+
+        position = store.get_position("BTCUSDT")
+        assert position["positionAmt"] == 0.01
+        assert position["leverage"] == 20
+        account = store.get_account()
+        assert account["totalWalletBalance"] == 990
+        assert account["availableBalance"] == 890
+        assert account["totalMarginBalance"] == 995
+
+        # 포지션 종료
+        store.apply_event({
+            "e": "ACCOUNT_UPDATE",
+            "E": 2,
+            "a": {"B": [], "P": [{"s": "BTCUSDT", "pa": "0", "ep": "0", "up": "0", "ps": "BOTH"}]}
+        })
+        assert store.get_position("BTCUSDT") is None
+
+    def test_mark_price_revalues_positions(self):
+        """마크 가격 틱으로 미실현 손익/계정 합계 재계산 테스트"""
+        store = make_store()
+        store.apply_event({
+            "e": "ACCOUNT_UPDATE",
+            "E": 1,
+            "a": {"B": [], "P": [{"s": "BTCUSDT", "pa": "-0.01", "ep": "50000", "up": "0", "ps": "BOTH"}]}
+        })
+        assert store.apply_mark_price("BTCUSDT", 49000.0)
+        assert not store.apply_mark_price("ETHUSDT", 3000.0)
+
+        position = store.get_position("BTCUSDT")
+        assert position["markPrice"] == 49000.0
+        assert position["unrealizedProfit"] == pytest.approx(10.0)
+        assert position["notional"] == pytest.approx(490.0)
+        assert store.get_account()["totalMarginBalance"] == pytest.approx(1010.0)
+        assert store.get_position_symbols() == {"BTCUSDT"}
+
+    def test_order_update(self):
+        """ORDER_TRADE_UPDATE 반영 테스트"""
+        store = make_store()
+        order = {"s": "BTCUSDT", "i": 1, "c": "abc", "S": "BUY", "o": "LIMIT", "q": "0.01", "p": "50000", "X": "NEW"}
+        store.apply_event({"e": "ORDER_TRADE_UPDATE", "E": 1, "o": order})
+        assert len(store.get_open_orders("BTCUSDT")) == 1
+
+        store.apply_event({"e": "ORDER_TRADE_UPDATE", "E": 2, "o": {**order, "X": "FILLED"}})
+        assert store.get_open_orders() == []
+
+    def test_stale_position_dropped(self):
+        """오래된 ACCOUNT_UPDATE 포지션 무시 테스트"""
+        store = make_store()
+        position = {"s": "BTCUSDT", "pa": "0.02", "ep": "50000", "up": "1", "ps": "BOTH"}
+        store.apply_event({"e": "ACCOUNT_UPDATE", "E": 10, "a": {"B": [], "P": [position]}})
+        store.apply_event({
+            "e": "ACCOUNT_UPDATE",
+            "E": 5,
+            "a": {"B": [], "P": [{**position, "pa": "0"}]}
+        })
+        assert store.get_position("BTCUSDT")["positionAmt"] == 0.02
+
+    def test_fill_gap_detected(self):
+        """누적 체결 수량 공백 감지 테스트"""
+        store = make_store()
+        order = {"s": "BTCUSDT", "i": 1, "S": "BUY", "o": "LIMIT", "q": "0.03", "p": "50000"}
+        assert store.apply_event({"e": "ORDER_TRADE_UPDATE", "E": 1, "o": {**order, "X": "NEW", "z": "0", "l": "0"}}) == []
+        assert store.apply_event({
+            "e": "ORDER_TRADE_UPDATE", "E": 2, "o": {**order, "X": "PARTIALLY_FILLED", "z": "0.01", "l": "0.01"}
+        }) == []
+        # 같은 이벤트 중복 수신은 공백이 아님
+        assert store.apply_event({
+            "e": "ORDER_TRADE_UPDATE", "E": 2, "o": {**order, "X": "PARTIALLY_FILLED", "z": "0.01", "l": "0.01"}
+        }) == []
+        # 0.01 체결 이벤트 누락
+        assert store.apply_event({
+            "e": "ORDER_TRADE_UPDATE", "E": 4, "o": {**order, "X": "FILLED", "z": "0.03", "l": "0.01"}
+        }) == ["BTCUSDT"]
+        assert store.get_open_orders() == []
+
+    def test_duplicate_terminal_event_ignored(self):
+        """종료 이벤트 중복 수신 시 재조정/리스너 재호출이 없는지 테스트"""
+        store = make_store()
+        received = []
+        store.add_order_listener(lambda order: received.append(order["X"]))
+        order = {"s": "BTCUSDT", "i": 1, "S": "BUY", "o": "LIMIT", "q": "0.03", "p": "50000"}
+        store.apply_event({"e": "ORDER_TRADE_UPDATE", "E": 1, "o": {**order, "X": "NEW", "z": "0", "l": "0"}})
+        store.apply_event({
+            "e": "ORDER_TRADE_UPDATE", "E": 2, "o": {**order, "X": "PARTIALLY_FILLED", "z": "0.01", "l": "0.01"}
+        })
+        filled = {"e": "ORDER_TRADE_UPDATE", "E": 3, "o": {**order, "X": "FILLED", "z": "0.03", "l": "0.02"}}
+        assert store.apply_event(filled) == []
+        assert store.apply_event(filled) == []
+        assert received == ["NEW", "PARTIALLY_FILLED", "FILLED"]
+        assert store.get_open_orders() == []
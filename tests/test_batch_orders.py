@@ -0,0 +1,149 @@
+import pytest
+import asyncio
+from fastapi import HTTPException
+from decimal import Decimal
+from src.config.env import EnvConfig
+from src.models.exchange import SymbolFilters
+from src.models.trading import OrderRequest
+from src.services.binance_service import BinanceService
+from src.services.order_validator import OrderValidator
+
+class FakeExchangeInfo:
+    def __init__(self, symbols):
+        self.symbols = symbols
+
+    async def ensure_loaded(self):
+        pass
+
+    def get_symbol(self, symbol):
+        return self.symbols.get(symbol)
+
+def make_service(fail_chunk: bool = False) -> BinanceService:
+    service = BinanceService()
+    service._initialized = True
+    service.exchange_info = FakeExchangeInfo({
+        symbol: SymbolFilters(
+            symbol=symbol, status="TRADING", tick_size=Decimal("0.1"), step_size=Decimal("0.001"),
+            min_qty=Decimal("0.001"), max_qty=Decimal("1000")
+        )
+        for symbol in ("BTCUSDT", "ETHUSDT")
+    })
+    service.validator = OrderValidator(service.exchange_info)
+    service.calls = []
+
+    async def request(method, **params):
+        service.calls.append((method, params))
+        orders = params["batchOrders"]
+        return [
+            {"code": -2019, "msg": "Margin is insufficient."} if fail_chunk and i == 0
+            else {"orderId": len(service.calls) * 10 + i, "symbol": o["symbol"]}
+            for i, o in enumerate(orders)
+        ]
+
+    service._request = request
+    return service
+
+@pytest.mark.asyncio
+class TestBatchOrders:
+    async def test_chunked_into_batches(self):
+        """5개 단위 batchOrders 분할 및 주문별 결과 테스트"""
+        service = make_service()
+        orders = [
+            OrderRequest(symbol="BTCUSDT", side="BUY", quantity=Decimal("0.01"), leverage=10)
+            for _ in range(12)
+        ]
+        results = await service.create_orders(orders)
+        assert [len(params["batchOrders"]) for _, params in service.calls] == [5, 5, 2]
+        assert [r["index"] for r in results] == list(range(12))
+        assert all(r["status"] == "accepted" for r in results)
+
+    async def test_local_rejection_and_exchange_error(self):
+        """로컬 검증 거부와 거래소 오류가 주문별로 반환되는지 테스트"""
+        service = make_service(fail_chunk=True)
+        orders = [
+            OrderRequest(symbol="BTCUSDT", side="BUY", quantity=Decimal("0.01"), leverage=10),
+            OrderRequest(symbol="FOOUSDT", side="BUY", quantity=Decimal("1"), leverage=10),
+            OrderRequest(symbol="ETHUSDT", side="SELL", quantity=Decimal("0.1"), leverage=10, type="LIMIT"),
+            OrderRequest(symbol="ETHUSDT", side="SELL", quantity=Decimal("0.1"), leverage=10),
+        ]
+        results = await service.create_orders(orders)
+        assert [r["status"] for r in results] == ["failed", "rejected", "rejected", "accepted"]
+        assert len(service.calls) == 1
+
+    async def test_short_batch_response(self):
+        """batchOrders 응답이 요청보다 적으면 남은 주문을 실패로 반환하는지 테스트"""
+        service = make_service()
+
+        async def request(method, **params):
+            service.calls.append((method, params))
+            return [{"orderId": 1, "symbol": params["batchOrders"][0]["symbol"]}]
+
+        service._request = request
+        orders = [
+            OrderRequest(symbol="BTCUSDT", side="BUY", quantity=Decimal("0.01"), leverage=10)
+            for _ in range(3)
+        ]
+        results = await service.create_orders(orders)
+        assert [r["status"] for r in results] == ["accepted", "failed", "failed"]
+        assert results[2] == {"index": 2, "status": "failed", "error": "no response"}
+
+@pytest.mark.asyncio
+class TestPlaceOrder:
+    async def test_limit_order_params(self):
+        """지정가 주문이 가격/유효기간과 함께 전송되는지 테스트"""
+        service = make_service()
+
+        async def request(method, **params):
+            service.calls.append((method, params))
+            return {
+                "orderId": 1, "symbol": params["symbol"], "side": params["side"], "origQty": params["quantity"],
+                "avgPrice": "0", "price": params["price"], "status": "NEW", "updateTime": 0
+            }
+
+        service._request = request
+        order = await service.place_order(OrderRequest(
+            symbol="BTCUSDT", side="BUY", quantity=Decimal("0.01"), leverage=EnvConfig.DEFAULT_LEVERAGE,
+            type="LIMIT", price=Decimal("50000")
+        ))
+        method, params = service.calls[0]
+        assert method == "futures_create_order"
+        assert params["type"] == "LIMIT"
+        assert params["price"] == "50000.0"
+        assert params["timeInForce"] == "GTC"
+        assert order.price == Decimal("50000.0")
+
+    async def test_protective_orders_use_bracket(self):
+        """손절/익절이 있는 주문은 브래킷으로 전송되는지 테스트"""
+        service = make_service()
+
+        async def request(method, **params):
+            service.calls.append((method, params))
+            entry, *legs = params["batchOrders"]
+            return [{
+                "orderId": 1, "symbol": entry["symbol"], "side": entry["side"], "origQty": entry["quantity"],
+                "avgPrice": "0", "price": entry["price"], "status": "NEW", "updateTime": 0
+            }] + [{"orderId": 2 + i, "stopPrice": leg["stopPrice"]} for i, leg in enumerate(legs)]
+
+        service._request = request
+        order = await service.place_order(OrderRequest(
+            symbol="BTCUSDT", side="BUY", quantity=Decimal("0.01"), leverage=EnvConfig.DEFAULT_LEVERAGE,
+            type="LIMIT", price=Decimal("50000"), stop_loss=Decimal("49000"), take_profit=Decimal("52000")
+        ))
+        assert [method for method, _ in service.calls] == ["futures_place_batch_order"]
+        assert order.stop_loss == Decimal("49000.0")
+        assert order.take_profit == Decimal("52000.0")
+
+
+    async def test_network_error_wrapped(self):
+        """네트워크 오류가 HTTPException(500)으로 변환되는지 테스트"""
+        service = make_service()
+
+        async def request(method, **params):
+            raise asyncio.TimeoutError()
+
+        service._request = request
+        with pytest.raises(HTTPException) as e:
+            await service.place_order(OrderRequest(
+                symbol="BTCUSDT", side="BUY", quantity=Decimal("0.01"), leverage=EnvConfig.DEFAULT_LEVERAGE
+            ))
+        assert e.value.status_code == 500
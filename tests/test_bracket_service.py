@@ -0,0 +1,144 @@
+import pytest
+import asyncio
+from decimal import Decimal
+from src.models.trading import OrderRequest
+from src.services.account_store import AccountStore
+from src.services.bracket_service import (
+    BracketService, compute_triggers, leg_client_id, parse_client_id, LEG_ENTRY, LEG_STOP, LEG_TAKE
+)
+from src.utils.exceptions import BracketProtectionError, OrderError, ValidationError
+
+class FakeBinance:
+    def __init__(self, batch_response=None):
+        self.requests = []
+        self.batch_response = batch_response
+
+    async def get_mark_price(self, symbol):
+        return Decimal("50000")
+
+    async def get_symbol_filters(self, symbol):
+        return None
+
+    async def _request(self, method, **params):
+        self.requests.append((method, params))
+        if method == "futures_place_batch_order":
+            if self.batch_response is not None:
+                return self.batch_response
+            return [{"orderId": i, "clientOrderId": leg["newClientOrderId"]} for i, leg in enumerate(params["batchOrders"])]
+        return {}
+
+class TestBracketTriggers:
+    def test_percent_triggers(self):
+        """진입가 대비 % 트리거 계산 테스트"""
+        stop, take = compute_triggers("BUY", Decimal("50000"), Decimal("2"), Decimal("4"), "percent", Decimal("0.1"))
+        assert stop == Decimal("49000")
+        assert take == Decimal("52000")
+        stop, take = compute_triggers("SELL", Decimal("100"), Decimal("1.5"), None, "percent", Decimal("0.01"))
+        assert stop == Decimal("101.5")
+        assert take is None
+
+    def test_wrong_direction(self):
+        """보호 방향이 잘못된 가격 거부 테스트"""
+        with pytest.raises(ValidationError):
+            compute_triggers("BUY", Decimal("50000"), Decimal("51000"), None, "price")
+
+    def test_client_id_roundtrip(self):
+        """clientOrderId 파싱 테스트"""
+        client_id = leg_client_id("abc123", LEG_STOP)
+        assert len(client_id) <= 36
+        assert parse_client_id(client_id) == ("abc123", LEG_STOP)
+        assert parse_client_id("web_123") is None
+
+@pytest.mark.asyncio
+class TestBracketService:
+    async def test_single_batch_call(self):
+        """진입/손절/익절이 batchOrders 한 번으로 전송되는지 테스트"""
+        binance = FakeBinance()
+        service = BracketService(binance, AccountStore())
+        request = OrderRequest(
+            symbol="BTCUSDT", side="BUY", quantity=Decimal("0.01"), leverage=10,
+            stop_loss=Decimal("1"), take_profit=Decimal("2"), trigger_mode="percent"
+        )
+        result = await service.place(request)
+
+        assert len(binance.requests) == 1
+        method, params = binance.requests[0]
+        assert method == "futures_place_batch_order"
+        entry, stop, take = params["batchOrders"]
+        assert entry["type"] == "MARKET"
+        assert stop["type"] == "STOP_MARKET" and stop["stopPrice"] == "49500.00"
+        assert take["type"] == "TAKE_PROFIT_MARKET" and take["side"] == "SELL"
+        assert all(isinstance(v, str) for leg in params["batchOrders"] for v in leg.values())
+        assert result["stopLoss"]["clientOrderId"] == stop["newClientOrderId"]
+
+    async def test_entry_failure_cancels_legs(self):
+        """진입 실패 시 보호 주문 취소 테스트"""
+        binance = FakeBinance(batch_response=[
+            {"code": -2019, "msg": "Margin is insufficient."},
+            {"orderId": 2},
+            {"orderId": 3}
+        ])
+        service = BracketService(binance, AccountStore())
+        request = OrderRequest(
+            symbol="BTCUSDT", side="BUY", quantity=Decimal("0.01"), leverage=10,
+            stop_loss=Decimal("49000"), take_profit=Decimal("52000")
+        )
+        with pytest.raises(OrderError):
+            await service.place(request)
+        cancels = [params["origClientOrderId"] for method, params in binance.requests if method == "futures_cancel_order"]
+        assert [parse_client_id(c)[1] for c in cancels] == [LEG_STOP, LEG_TAKE]
+
+    async def test_oco_cancel_on_fill(self):
+        """익절 체결 시 손절 주문 취소 테스트"""
+        binance = FakeBinance()
+        store = AccountStore()
+        BracketService(binance, store)
+        store.apply_event({"e": "ORDER_TRADE_UPDATE", "E": 1, "o": {
+            "s": "BTCUSDT", "i": 7, "c": leg_client_id("abc", LEG_TAKE), "X": "FILLED", "z": "0.01", "l": "0.01"
+        }})
+        await asyncio.sleep(0)
+        assert binance.requests == [
+            ("futures_cancel_order", {"symbol": "BTCUSDT", "origClientOrderId": leg_client_id("abc", LEG_STOP)})
+        ]
+
+    async def test_protection_failure_unwinds_entry(self):
+        """보호 주문 재시도까지 실패하면 진입을 청산하고 오류를 반환하는지 테스트"""
+        binance = FakeBinance(batch_response=[
+            {"orderId": 1, "executedQty": "0.01"},
+            {"code": -4045, "msg": "Reach max stop order limit."},
+            {"orderId": 3}
+        ])
+
+        async def request(method, **params):
+            binance.requests.append((method, params))
+            if method == "futures_place_batch_order":
+                return binance.batch_response
+            if method == "futures_create_order" and params.get("type") == "STOP_MARKET":
+                raise asyncio.TimeoutError()
+            return {}
+
+        binance._request = request
+        service = BracketService(binance, AccountStore())
+        order = OrderRequest(
+            symbol="BTCUSDT", side="BUY", quantity=Decimal("0.01"), leverage=10,
+            stop_loss=Decimal("49000"), take_profit=Decimal("52000")
+        )
+        with pytest.raises(BracketProtectionError) as e:
+            await service.place(order)
+        assert e.value.entry["orderId"] == 1
+        cancels = [parse_client_id(p["origClientOrderId"])[1] for m, p in binance.requests if m == "futures_cancel_order"]
+        assert cancels == [LEG_TAKE, LEG_ENTRY]
+        close = binance.requests[-1][1]
+        assert close["reduceOnly"] == "true" and close["side"] == "SELL" and close["quantity"] == "0.01"
+
+    async def test_short_batch_response(self):
+        """batchOrders 응답이 모자라면 KeyError 없이 진입 실패로 처리하는지 테스트"""
+        binance = FakeBinance(batch_response=[])
+        service = BracketService(binance, AccountStore())
+        order = OrderRequest(
+            symbol="BTCUSDT", side="BUY", quantity=Decimal("0.01"), leverage=10, stop_loss=Decimal("49000")
+        )
+        with pytest.raises(OrderError):
+            await service.place(order)
+        cancels = [parse_client_id(p["origClientOrderId"])[1] for m, p in binance.requests if m == "futures_cancel_order"]
+        assert cancels == [LEG_ENTRY, LEG_STOP]
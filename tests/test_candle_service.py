@@ -0,0 +1,119 @@
+import pytest
+import asyncio
+from src.services.candle_service import CandleSeries, CandleService
+
+class FakeStreamClient:
+    def __init__(self):
+        self.handlers = {}
+
+    async def subscribe(self, stream, handler):
+        self.handlers[stream] = handler
+
+    async def unsubscribe(self, stream):
+        self.handlers.pop(stream, None)
+
+class FakeBinanceService:
+    async def _ensure_initialized(self):
+        pass
+
+    async def _request(self, method, **params):
+        # 마지막 항목은 진행 중 캔들
+        return [
+            [0, '10', '12', '9', '11', '5', 59_999, '55', 3],
+            [60_000, '11', '13', '10', '12', '2', 119_999, '24', 1],
+            [120_000, '12', '12', '12', '12', '1', 179_999, '12', 1]
+        ]
+
+def trade(time, price, quantity=1.0):
+    return {'T': time, 'p': str(price), 'q': str(quantity)}
+
+class TestCandleSeries:
+    def test_aggregate(self):
+        """체결 집계 및 마감 테스트"""
+        series = CandleSeries('BTCUSDT', '1m', capacity=10)
+        assert series.update(1_000, 100.0, 1.0) == 0
+        assert series.update(2_000, 105.0, 2.0) == 0
+        assert series.update(3_000, 95.0, 1.0) == 0
+        candle = series.candle()
+        assert (candle['open'], candle['high'], candle['low'], candle['close']) == (100.0, 105.0, 95.0, 95.0)
+        assert candle['volume'] == 4.0
+        assert candle['trades'] == 3
+
+        # 다음 주기 체결로 이전 캔들 마감
+        assert series.update(61_000, 96.0, 1.0) == 1
+        assert series.candle(1)['close'] == 95.0
+        assert series.candle()['open'] == 96.0
+        # 늦게 도착한 이전 주기 체결은 무시
+        assert series.update(59_000, 1.0, 1.0) == 0
+        assert series.candle(1)['low'] == 95.0
+
+    def test_gap_and_ring_buffer(self):
+        """공백 구간 채우기 및 링 버퍼 순환 테스트"""
+        series = CandleSeries('BTCUSDT', '1s', capacity=4)
+        series.update(0, 10.0, 1.0)
+        assert series.update(3_000, 11.0, 1.0) == 3
+        klines = series.to_klines()
+        assert [k[0] for k in klines] == [0, 1_000, 2_000, 3_000]
+        # 거래 없는 구간은 직전 종가, 거래량 0
+        assert klines[1][1:6] == [10.0, 10.0, 10.0, 10.0, 0.0]
+
+        series.update(5_000, 12.0, 1.0)
+        assert [k[0] for k in series.to_klines()] == [2_000, 3_000, 4_000, 5_000]
+        assert [k[0] for k in series.to_klines(limit=2)] == [4_000, 5_000]
+
+    def test_load_klines_keeps_live_candles(self):
+        """과거 이력 로드 시 스트림 캔들 유지 테스트"""
+        series = CandleSeries('BTCUSDT', '1m', capacity=10)
+        series.update(125_000, 20.0, 1.0)
+        series.load_klines([
+            [0, '10', '12', '9', '11', '5', 59_999, '55', 3],
+            [60_000, '11', '13', '10', '12', '2', 119_999, '24', 1]
+        ])
+        klines = series.to_klines()
+        assert [k[0] for k in klines] == [0, 60_000, 120_000]
+        assert klines[0][2] == 12.0
+        assert series.candle()['close'] == 20.0
+
+@pytest.mark.asyncio
+class TestCandleService:
+    async def test_stream_and_backfill(self):
+        """aggTrade 스트림 집계 및 리스너 통지 테스트"""
+        streams = FakeStreamClient()
+        service = CandleService(FakeBinanceService(), streams, intervals=['1s', '1m'], capacity=100)
+        events = []
+        service.add_listener(lambda series, candle, closed: events.append((series.interval, candle['openTime'], closed)))
+
+        await service.acquire('BTCUSDT')
+        handler = streams.handlers['btcusdt@aggTrade']
+        await handler(trade(120_500, 12.5))
+        await handler(trade(121_200, 12.7))
+        assert ('1s', 120_000, True) in events
+        assert events[-1] == ('1m', 120_000, False)
+
+        await service._backfill('BTCUSDT')
+        minutes = service.get_series('BTCUSDT', '1m').to_klines()
+        assert [k[0] for k in minutes] == [0, 60_000, 120_000]
+        assert minutes[-1][4] == 12.7
+
+        await service.release('BTCUSDT')
+        assert streams.handlers == {}
+        assert service.get_series('BTCUSDT', '1m') is None
+
+    async def test_reacquire_keeps_new_backfill(self):
+        """해제 직후 재구독 시 취소된 이전 로드 태스크가 새 태스크 등록을 지우지 않는지 테스트"""
+        class SlowBinanceService(FakeBinanceService):
+            async def _request(self, method, **params):
+                await asyncio.sleep(1)
+                return []
+
+        service = CandleService(SlowBinanceService(), FakeStreamClient(), intervals=['1m'], capacity=100)
+        await service.acquire('BTCUSDT')
+        await asyncio.sleep(0)
+        await service.release('BTCUSDT')
+        await service.acquire('BTCUSDT')
+        task = service._backfill_tasks['BTCUSDT']
+        await asyncio.sleep(0.01)
+        assert service._backfill_tasks.get('BTCUSDT') is task
+        await service.release('BTCUSDT')
+        await asyncio.sleep(0)
+        assert task.cancelled()
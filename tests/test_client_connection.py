@@ -0,0 +1,120 @@
+import pytest
+import asyncio
+import json
+from src.services.client_connection import ClientConnection, OverflowPolicy
+
+class SlowWebSocket:
+    def __init__(self):
+        self.sent = []
+        self.closed_code = None
+        self.release = asyncio.Event()
+
+    async def send_text(self, data: str):
+        await self.release.wait()
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000):
+        self.closed_code = code
+
+@pytest.mark.asyncio
+class TestClientConnection:
+    async def test_drop_oldest(self):
+        """큐 초과 시 오래된 메시지 드롭 테스트"""
+        ws = SlowWebSocket()
+        client = ClientConnection(ws, max_queue=2, policy=OverflowPolicy.DROP_OLDEST)
+        for i in range(4):
+            client.enqueue(f"m{i}", key="BTCUSDT")
+        assert client.queue_depth == 2
+        assert client.dropped == 2
+
+        client.start()
+        ws.release.set()
+        await asyncio.sleep(0.01)
+        assert ws.sent == ["m2", "m3"]
+        await client.close()
+
+    async def test_conflate(self):
+        """같은 심볼 최신 값 유지 테스트"""
+        ws = SlowWebSocket()
+        client = ClientConnection(ws, max_queue=10, policy=OverflowPolicy.CONFLATE)
+        client.enqueue("btc1", key="BTCUSDT")
+        client.enqueue("eth1", key="ETHUSDT")
+        client.enqueue("btc2", key="BTCUSDT")
+        client.enqueue("control")
+
+        client.start()
+        ws.release.set()
+        await asyncio.sleep(0.01)
+        assert ws.sent == ["btc2", "eth1", "control"]
+        await client.close()
+
+    async def test_disconnect_slow_consumer(self):
+        """느린 클라이언트 연결 종료 테스트"""
+        ws = SlowWebSocket()
+        closed = []
+
+        async def on_close(client):
+            closed.append(client)
+
+        client = ClientConnection(ws, max_queue=1, policy=OverflowPolicy.DISCONNECT, on_close=on_close)
+        client.enqueue("m1", key="BTCUSDT")
+        assert not client.enqueue("m2", key="BTCUSDT")
+        await asyncio.sleep(0.01)
+        assert client.closed
+        assert ws.closed_code == 1013
+        assert closed == [client]
+        assert client._closer is not None
+
+    async def test_stalled_writer_reports_lag(self):
+        """writer가 멈춘 상태에서도 적체 게이지가 기록되는지 테스트"""
+        ws = SlowWebSocket()
+        client = ClientConnection(ws, max_queue=10)
+        client.start()
+        client.enqueue("m1", key="BTCUSDT")
+        await asyncio.sleep(0.01)
+        client._metrics_at = 0.0
+        client.enqueue("m2", key="ETHUSDT")
+        assert client._depth_gauge._value.get() == 1
+        assert client._lag_gauge._value.get() > 0
+        await client.close()
+
+    async def test_throttle_conflates_to_latest(self):
+        """max_hz 전송 빈도 제한 및 최신 값 병합 테스트"""
+        ws = SlowWebSocket()
+        ws.release.set()
+        client = ClientConnection(ws, max_queue=10, policy=OverflowPolicy.CONFLATE)
+        client.set_rate("BTCUSDT", 20)
+        client.start()
+
+        for i in range(5):
+            client.enqueue(f"btc{i}", key="BTCUSDT")
+        client.enqueue("eth0", key="ETHUSDT")
+        await asyncio.sleep(0.01)
+        assert ws.sent == ["btc0", "eth0"]
+
+        # 다음 슬롯(50ms)에 마지막 값만 전송
+        await asyncio.sleep(0.06)
+        assert ws.sent == ["btc0", "eth0", "btc4"]
+        await client.close()
+
+    async def test_batch_frames(self):
+        """배치 주기 내 여러 심볼 업데이트를 한 프레임으로 결합 테스트"""
+        ws = SlowWebSocket()
+        ws.release.set()
+        client = ClientConnection(ws, max_queue=10, policy=OverflowPolicy.CONFLATE)
+        client.set_batch_interval(20)
+        client.start()
+
+        client.enqueue('{"s":"BTCUSDT","p":1}', key="BTCUSDT")
+        client.enqueue('{"s":"ETHUSDT","p":2}', key="ETHUSDT")
+        client.enqueue('{"s":"BTCUSDT","p":3}', key="BTCUSDT")
+        client.enqueue('{"type":"subscribed"}')
+        await asyncio.sleep(0.01)
+        assert ws.sent == ['{"type":"subscribed"}']
+
+        await asyncio.sleep(0.03)
+        assert json.loads(ws.sent[1]) == {
+            "type": "batch",
+            "data": [{"s": "BTCUSDT", "p": 3}, {"s": "ETHUSDT", "p": 2}]
+        }
+        await client.close()
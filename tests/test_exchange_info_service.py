@@ -0,0 +1,73 @@
+import pytest
+import asyncio
+from decimal import Decimal
+from src.services.exchange_info_service import ExchangeInfoService
+
+EXCHANGE_INFO = {
+    "timezone": "UTC",
+    "serverTime": 1700000000000,
+    "rateLimits": [],
+    "symbols": [
+        {
+            "symbol": "BTCUSDT",
+            "status": "TRADING",
+            "pricePrecision": 2,
+            "quantityPrecision": 3,
+            "filters": [
+                {"filterType": "PRICE_FILTER", "minPrice": "556.80", "maxPrice": "4529764", "tickSize": "0.10"},
+                {"filterType": "LOT_SIZE", "minQty": "0.001", "maxQty": "1000", "stepSize": "0.001"},
+                {"filterType": "MIN_NOTIONAL", "notional": "100"}
+            ]
+        }
+    ]
+}
+
+class FakeBinance:
+    def __init__(self):
+        self.calls = 0
+
+    async def _request(self, method: str, **params):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return {**EXCHANGE_INFO, "serverTime": EXCHANGE_INFO["serverTime"] + self.calls}
+
+@pytest.mark.asyncio
+class TestExchangeInfoService:
+    async def test_symbol_index(self):
+        """심볼 필터 인덱스 테스트"""
+        service = ExchangeInfoService(FakeBinance(), ttl=60)
+        await service.refresh()
+
+        filters = service.get_symbol("BTCUSDT")
+        assert filters.is_trading
+        assert filters.tick_size == Decimal("0.10")
+        assert filters.step_size == Decimal("0.001")
+        assert filters.max_qty == Decimal("1000")
+        assert filters.min_notional == Decimal("100")
+        assert service.get_symbol("INVALID") is None
+
+    async def test_cached_until_refresh(self):
+        """캐시 재사용 테스트"""
+        binance = FakeBinance()
+        service = ExchangeInfoService(binance, ttl=60)
+        await service.ensure_loaded()
+        await service.ensure_loaded()
+        assert binance.calls == 1
+
+    async def test_concurrent_ensure_loaded(self):
+        """동시 로드 요청 시 다운로드 1회 테스트"""
+        binance = FakeBinance()
+        service = ExchangeInfoService(binance, ttl=60)
+        await asyncio.gather(*(service.ensure_loaded() for _ in range(5)))
+        assert binance.calls == 1
+
+    async def test_etag_stable_across_refresh(self):
+        """serverTime 변화와 무관한 ETag 테스트"""
+        service = ExchangeInfoService(FakeBinance(), ttl=60)
+        await service.refresh()
+        etag = service.etag
+        await service.refresh()
+        assert service.etag == etag
+        assert service.matches_etag(etag)
+        assert service.matches_etag(f"W/{etag}")
+        assert not service.matches_etag('"other"')
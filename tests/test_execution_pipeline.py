@@ -0,0 +1,77 @@
+import pytest
+import asyncio
+from src.services.execution_pipeline import ExecutionPipeline
+
+@pytest.mark.asyncio
+class TestExecutionPipeline:
+    async def test_same_symbol_serialized(self):
+        """같은 심볼 작업 순차 실행 테스트"""
+        pipeline = ExecutionPipeline()
+        events = []
+
+        def job(name):
+            async def run():
+                events.append(f"{name}:start")
+                await asyncio.sleep(0.01)
+                events.append(f"{name}:end")
+                return name
+            return run
+
+        results = await asyncio.gather(
+            pipeline.run("BTCUSDT", "place_order", job("a")),
+            pipeline.run("BTCUSDT", "place_order", job("b"))
+        )
+        assert results == ["a", "b"]
+        assert events == ["a:start", "a:end", "b:start", "b:end"]
+        await pipeline.stop()
+
+    async def test_different_symbols_parallel(self):
+        """다른 심볼 작업 병렬 실행 테스트"""
+        pipeline = ExecutionPipeline()
+        running = []
+        overlap = asyncio.Event()
+
+        def job(symbol):
+            async def run():
+                running.append(symbol)
+                if len(running) == 2:
+                    overlap.set()
+                await asyncio.wait_for(overlap.wait(), 1)
+                return symbol
+            return run
+
+        results = await asyncio.gather(
+            pipeline.run("BTCUSDT", "place_order", job("BTCUSDT")),
+            pipeline.run("ETHUSDT", "place_order", job("ETHUSDT"))
+        )
+        assert results == ["BTCUSDT", "ETHUSDT"]
+        await pipeline.stop()
+
+    async def test_error_propagates(self):
+        """작업 예외 전달 후 다음 작업 계속 실행 테스트"""
+        pipeline = ExecutionPipeline()
+
+        async def fail():
+            raise ValueError("rejected")
+
+        async def ok():
+            return "ok"
+
+        with pytest.raises(ValueError):
+            await pipeline.run("BTCUSDT", "place_order", fail)
+        assert await pipeline.run("BTCUSDT", "place_order", ok) == "ok"
+        await pipeline.stop()
+
+    async def test_idle_executor_retired(self):
+        """대기 작업이 없는 심볼 액터가 정리되는지 테스트"""
+        pipeline = ExecutionPipeline()
+
+        async def ok():
+            return "ok"
+
+        assert await pipeline.run("BTCUSDT", "place_order", ok) == "ok"
+        await asyncio.sleep(0)
+        assert pipeline.executors == {}
+        # 정리 후에도 같은 심볼 작업은 새 액터에서 실행
+        assert await pipeline.run("BTCUSDT", "place_order", ok) == "ok"
+        await pipeline.stop()
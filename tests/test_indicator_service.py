@@ -0,0 +1,140 @@
+import pytest
+import asyncio
+import math
+import numpy as np
+from src.models.settings import IndicatorConfig
+from src.services.candle_service import CandleSeries
+from src.services.indicator_service import IndicatorBank, IndicatorService
+from src.services.settings_service import SettingsService
+from src.utils.exceptions import ValidationError
+
+CLOSES = [44.0, 44.3, 44.1, 44.6, 45.2, 45.0, 45.8, 46.1, 45.7, 46.3, 46.0, 46.5]
+
+def candles(closes):
+    """openTime, high, low, close, volume 행 목록"""
+    return [(i * 60_000, c + 0.5, c - 0.5, c, 1.0 + i) for i, c in enumerate(closes)]
+
+def run(kind, period, rows):
+    bank = IndicatorBank(kind, '1m', [('BTCUSDT', period)])
+    for row in rows:
+        bank.step(np.array([0]), np.array(row, dtype=np.float64)[:, None], commit=True)
+    return bank.value[0]
+
+def reference_ema(closes, n):
+    alpha = 2 / (n + 1)
+    ema = closes[0]
+    for c in closes[1:]:
+        ema += alpha * (c - ema)
+    return ema
+
+def reference_rsi(closes, n):
+    deltas = [b - a for a, b in zip(closes, closes[1:])]
+    gain = sum(max(d, 0) for d in deltas[:n]) / n
+    loss = sum(max(-d, 0) for d in deltas[:n]) / n
+    for d in deltas[n:]:
+        gain = (gain * (n - 1) + max(d, 0)) / n
+        loss = (loss * (n - 1) + max(-d, 0)) / n
+    return 100 - 100 / (1 + gain / loss)
+
+def reference_atr(rows, n):
+    ranges = [rows[0][1] - rows[0][2]] + [
+        max(h - l, abs(h - prev[3]), abs(l - prev[3])) for prev, (_, h, l, _, _) in zip(rows, rows[1:])
+    ]
+    atr = sum(ranges[:n]) / n
+    for tr in ranges[n:]:
+        atr = (atr * (n - 1) + tr) / n
+    return atr
+
+class TestIndicatorBank:
+    def test_matches_reference(self):
+        """증분 계산과 전체 구간 계산 결과 일치 테스트"""
+        rows = candles(CLOSES)
+        assert math.isclose(run('ema', 5, rows), reference_ema(CLOSES, 5))
+        assert math.isclose(run('rsi', 5, rows), reference_rsi(CLOSES, 5))
+        assert math.isclose(run('atr', 5, rows), reference_atr(rows, 5))
+        vwap = sum(c * v for _, _, _, c, v in rows) / sum(v for *_, v in rows)
+        assert math.isclose(run('vwap', 1, rows), vwap)
+
+    def test_warm_up(self):
+        """기간 미만에서는 값 없음 테스트"""
+        rows = candles(CLOSES[:3])
+        assert np.isnan(run('ema', 5, rows))
+        assert np.isnan(run('rsi', 5, rows))
+
+class FakeCandleService:
+    intervals = ['1m']
+
+    def __init__(self):
+        self.series = {}
+        self.acquired = []
+
+    def add_listener(self, listener):
+        self.listener = listener
+
+    def add_history_listener(self, listener):
+        pass
+
+    def get_series(self, symbol, interval):
+        return self.series.get((symbol, interval))
+
+    async def acquire(self, symbol):
+        self.acquired.append(symbol)
+        self.series[(symbol, '1m')] = CandleSeries(symbol, '1m', 100)
+
+    async def release(self, symbol):
+        self.acquired.remove(symbol)
+
+@pytest.mark.asyncio
+class TestIndicatorService:
+    async def test_batched_updates(self):
+        """여러 심볼 캔들을 한 틱에 일괄 반영 테스트"""
+        candles_service = FakeCandleService()
+        service = IndicatorService(candles_service, tick_interval=0.01)
+        published = {}
+        service.add_listener(lambda symbol, values: published.__setitem__(symbol, values))
+        await service.configure({
+            'BTCUSDT': [IndicatorConfig(type='ema', period=2), IndicatorConfig(type='rsi', period=2)],
+            'ETHUSDT': [IndicatorConfig(type='ema', period=2)]
+        })
+        assert sorted(candles_service.acquired) == ['BTCUSDT', 'ETHUSDT']
+        assert len(service.banks) == 2
+
+        for symbol in ('BTCUSDT', 'ETHUSDT'):
+            series = candles_service.get_series(symbol, '1m')
+            for t, price in ((0, 10.0), (60_000, 12.0), (120_000, 11.0), (130_000, 14.0)):
+                closed = series.update(t, price, 1.0)
+                for offset in range(closed, 0, -1):
+                    service._on_candle(series, series.candle(offset), True)
+                service._on_candle(series, series.candle(), False)
+
+        await asyncio.sleep(0.03)
+        btc = {v['type']: v for v in published['BTCUSDT']}
+        # 마감 캔들 10, 12 기준 EMA(2)와 진행 중 캔들(14) 포함 값
+        assert btc['ema']['value'] == pytest.approx(10 + 2 / 3 * 2)
+        assert btc['ema']['live'] == pytest.approx(btc['ema']['value'] + 2 / 3 * (14 - btc['ema']['value']))
+        assert btc['rsi']['value'] is None
+        assert btc['rsi']['live'] == 100.0
+        assert published['ETHUSDT'][0]['value'] == btc['ema']['value']
+
+        await service.configure({'BTCUSDT': [IndicatorConfig(type='vwap')]})
+        assert candles_service.acquired == ['BTCUSDT']
+
+    async def test_rejected_settings_not_saved(self, tmp_path):
+        """지원하지 않는 주기의 지표 설정은 저장하지 않고 이전 설정 유지 테스트"""
+        candles_service = FakeCandleService()
+        service = IndicatorService(candles_service, tick_interval=0.01)
+        settings_service = SettingsService()
+        settings_service.settings_dir = tmp_path
+        settings_service.settings_file = tmp_path / "settings.json"
+        await settings_service.initialize()
+        settings_service.add_listener(lambda settings: service.configure(settings.indicators))
+        await settings_service.update_trading_settings({'indicators': {'BTCUSDT': [{'type': 'ema'}]}})
+        saved = settings_service.settings_file.read_text()
+
+        with pytest.raises(ValidationError):
+            await settings_service.update_trading_settings({
+                'indicators': {'BTCUSDT': [{'type': 'ema', 'interval': '3m'}]}
+            })
+        assert settings_service.settings_file.read_text() == saved
+        assert settings_service.settings.trading.indicators['BTCUSDT'][0].interval == '1m'
+        assert [c.interval for c in service.config['BTCUSDT']] == ['1m']
@@ -0,0 +1,60 @@
+import pytest
+from src.services.market_data_hub import MarketDataHub, ALL_MARK_PRICE_STREAM
+
+class FakeStreamClient:
+    def __init__(self):
+        self.handlers = {}
+
+    async def subscribe(self, stream, handler):
+        self.handlers[stream] = handler
+
+    async def unsubscribe(self, stream):
+        self.handlers.pop(stream, None)
+
+@pytest.mark.asyncio
+class TestMarketDataHub:
+    async def test_reference_counting(self):
+        """업스트림 구독 참조 카운팅 테스트"""
+        streams = FakeStreamClient()
+        hub = MarketDataHub(streams, all_market_threshold=10)
+
+        await hub.acquire("BTCUSDT")
+        await hub.acquire("BTCUSDT")
+        assert list(streams.handlers) == ["btcusdt@markPrice@1s"]
+
+        await hub.release("BTCUSDT")
+        assert "btcusdt@markPrice@1s" in streams.handlers
+        await hub.release("BTCUSDT")
+        assert streams.handlers == {}
+
+    async def test_fan_out(self):
+        """구독자 팬아웃 테스트"""
+        streams = FakeStreamClient()
+        hub = MarketDataHub(streams, all_market_threshold=10)
+        received = []
+        hub.add_listener(received.append)
+
+        await hub.acquire("BTCUSDT")
+        await streams.handlers["btcusdt@markPrice@1s"]({"s": "BTCUSDT", "p": "50000.0", "E": 1})
+        assert received[0]["price"] == "50000.0"
+        assert hub.get_mark_price("BTCUSDT")["timestamp"] == 1
+
+    async def test_all_market_stream(self):
+        """전체 마크 가격 스트림 전환 테스트"""
+        streams = FakeStreamClient()
+        hub = MarketDataHub(streams, all_market_threshold=2)
+        received = []
+        hub.add_listener(received.append)
+
+        await hub.acquire("BTCUSDT")
+        await hub.acquire("ETHUSDT")
+        assert list(streams.handlers) == [ALL_MARK_PRICE_STREAM]
+
+        await streams.handlers[ALL_MARK_PRICE_STREAM]([
+            {"s": "BTCUSDT", "p": "1", "E": 1},
+            {"s": "XRPUSDT", "p": "2", "E": 1}
+        ])
+        assert [u["symbol"] for u in received] == ["BTCUSDT"]
+
+        await hub.release("ETHUSDT")
+        assert list(streams.handlers) == ["btcusdt@markPrice@1s"]
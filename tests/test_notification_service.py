@@ -0,0 +1,50 @@
+import pytest
+import asyncio
+from src.services.notification_service import NotificationService
+from src.utils.metrics import metrics_manager
+
+def make_service(sent: list, fail: bool = False) -> NotificationService:
+    service = NotificationService()
+    service.enabled = True
+
+    async def send_message(message, alert_level=None):
+        if fail:
+            raise RuntimeError("telegram down")
+        sent.append((message, alert_level))
+
+    service.send_message = send_message
+    return service
+
+@pytest.mark.asyncio
+class TestNotificationOutbox:
+    async def test_dispatch_in_background(self):
+        """알림이 호출 경로를 막지 않고 백그라운드로 전송되는지 테스트"""
+        sent = []
+        service = make_service(sent)
+        assert service.send_trade_notification("BTCUSDT", "BUY", 0.01, 50000.0)
+        assert sent == []
+
+        await service.start()
+        await service.cleanup()
+        assert len(sent) == 1
+        assert sent[0][1] == "SUCCESS"
+
+    async def test_outbox_bounded(self):
+        """아웃박스 초과 시 버림 테스트"""
+        service = make_service([])
+        service._outbox = asyncio.Queue(maxsize=2)
+        dropped = metrics_manager.notifications_dropped._value.get()
+        assert service.notify("a")
+        assert service.notify("b")
+        assert not service.notify("c")
+        assert metrics_manager.notifications_dropped._value.get() == dropped + 1
+
+    async def test_failure_counted(self):
+        """전송 실패 집계 후 디스패처 유지 테스트"""
+        service = make_service([], fail=True)
+        failed = metrics_manager.notifications_failed._value.get()
+        await service.start()
+        service.notify("a")
+        service.notify("b")
+        await service.cleanup()
+        assert metrics_manager.notifications_failed._value.get() == failed + 2
@@ -0,0 +1,116 @@
+import pytest
+import asyncio
+from src.services.order_book_service import OrderBook, OrderBookService
+
+STREAM = "btcusdt@depth@100ms"
+
+class FakeStreamClient:
+    def __init__(self):
+        self.handlers = {}
+
+    def add_reconnect_listener(self, listener):
+        pass
+
+    async def subscribe(self, stream, handler):
+        self.handlers[stream] = handler
+
+    async def unsubscribe(self, stream):
+        self.handlers.pop(stream, None)
+
+class FakeBinanceService:
+    def __init__(self, snapshots):
+        self.snapshots = list(snapshots)
+        self.requests = 0
+        self.release = asyncio.Event()
+
+    async def _ensure_initialized(self):
+        pass
+
+    async def _request(self, method, **params):
+        await self.release.wait()
+        self.requests += 1
+        return self.snapshots.pop(0)
+
+def diff(first, final, prev, bids=(), asks=()):
+    return {'U': first, 'u': final, 'pu': prev, 'E': final, 'b': list(bids), 'a': list(asks)}
+
+SNAPSHOT = {
+    'lastUpdateId': 100,
+    'bids': [['99.0', '1'], ['98.0', '2']],
+    'asks': [['101.0', '1'], ['102.0', '2']]
+}
+
+class TestOrderBook:
+    def test_apply_diff(self):
+        """diff 적용 및 정렬 유지 테스트"""
+        book = OrderBook('BTCUSDT')
+        book.load_snapshot(SNAPSHOT)
+        # 스냅샷 이전 이벤트는 무시
+        assert book.apply_diff(diff(90, 95, 89, bids=[['99.0', '0']]))
+        assert book.apply_diff(diff(98, 105, 97, bids=[['99.5', '3'], ['98.0', '0']], asks=[['101.0', '0']]))
+        assert book.apply_diff(diff(106, 110, 105, asks=[['100.5', '4']]))
+
+        top = book.top(5)
+        assert top['bids'] == [[99.5, 3.0], [99.0, 1.0]]
+        assert top['asks'] == [[100.5, 4.0], [102.0, 2.0]]
+        assert top['lastUpdateId'] == 110
+
+    def test_sequence_gap(self):
+        """시퀀스 공백 감지 테스트"""
+        book = OrderBook('BTCUSDT')
+        book.load_snapshot(SNAPSHOT)
+        # 첫 이벤트가 스냅샷 이후에서 시작하면 공백
+        assert not book.apply_diff(diff(102, 105, 101))
+        assert book.apply_diff(diff(100, 105, 99))
+        # pu가 직전 u와 다르면 공백
+        assert not book.apply_diff(diff(107, 110, 106))
+
+@pytest.mark.asyncio
+class TestOrderBookService:
+    async def test_snapshot_with_buffered_diffs(self):
+        """스냅샷 수신 전 diff 버퍼링 후 이어서 적용 테스트"""
+        streams = FakeStreamClient()
+        binance = FakeBinanceService([SNAPSHOT])
+        service = OrderBookService(binance, streams, snapshot_limit=1000)
+        updates = []
+        service.add_listener(lambda book: updates.append(book.last_update_id))
+
+        await service.acquire('BTCUSDT')
+        await service.acquire('BTCUSDT')
+        await streams.handlers[STREAM](diff(95, 99, 94))
+        await streams.handlers[STREAM](diff(100, 103, 99, bids=[['99.0', '5']]))
+        assert service.get_book('BTCUSDT') is None
+
+        binance.release.set()
+        await asyncio.sleep(0.01)
+        book = service.get_book('BTCUSDT')
+        assert book.top(1)['bids'] == [[99.0, 5.0]]
+        assert updates == [103]
+
+        await streams.handlers[STREAM](diff(104, 106, 103))
+        assert updates == [103, 106]
+        assert binance.requests == 1
+
+        await service.release('BTCUSDT')
+        assert STREAM in streams.handlers
+        await service.release('BTCUSDT')
+        assert streams.handlers == {}
+
+    async def test_resync_on_gap(self):
+        """시퀀스 공백 시 재동기화 테스트"""
+        streams = FakeStreamClient()
+        binance = FakeBinanceService([SNAPSHOT, {**SNAPSHOT, 'lastUpdateId': 200}])
+        binance.release.set()
+        service = OrderBookService(binance, streams, snapshot_limit=1000)
+
+        await service.acquire('BTCUSDT')
+        await asyncio.sleep(0.01)
+        await streams.handlers[STREAM](diff(100, 105, 99))
+        await streams.handlers[STREAM](diff(150, 199, 149))
+        assert service.get_book('BTCUSDT') is None
+
+        await streams.handlers[STREAM](diff(199, 201, 199))
+        await asyncio.sleep(0.01)
+        assert service.get_book('BTCUSDT').last_update_id == 201
+        assert binance.requests == 2
+        await service.stop()
@@ -0,0 +1,70 @@
+import pytest
+from decimal import Decimal
+from src.models.exchange import SymbolFilters
+from src.models.trading import OrderRequest
+from src.services.order_validator import OrderValidator, quantize_to_step
+from src.utils.exceptions import ValidationError
+from src.utils.metrics import metrics_manager
+
+SYMBOL_INFO = {
+    "symbol": "BTCUSDT",
+    "status": "TRADING",
+    "filters": [
+        {"filterType": "PRICE_FILTER", "minPrice": "556.80", "maxPrice": "4529764", "tickSize": "0.10"},
+        {"filterType": "LOT_SIZE", "minQty": "0.001", "maxQty": "1000", "stepSize": "0.001"},
+        {"filterType": "MARKET_LOT_SIZE", "minQty": "0.001", "maxQty": "120", "stepSize": "0.001"},
+        {"filterType": "MIN_NOTIONAL", "notional": "100"}
+    ]
+}
+
+class FakeExchangeInfo:
+    def get_symbol(self, symbol):
+        return SymbolFilters.from_binance(SYMBOL_INFO) if symbol == "BTCUSDT" else None
+
+def order(**kwargs) -> OrderRequest:
+    return OrderRequest(**{"symbol": "BTCUSDT", "side": "BUY", "quantity": Decimal("0.01"), "leverage": 10, **kwargs})
+
+class TestOrderValidator:
+    def test_quantize(self):
+        """stepSize 배수 정확 계산 테스트"""
+        assert quantize_to_step(Decimal("0.0129"), Decimal("0.001")) == Decimal("0.012")
+        assert str(quantize_to_step(Decimal("50000.07"), Decimal("0.10"))) == "50000.00"
+        assert quantize_to_step(Decimal("1.23"), Decimal("0")) == Decimal("1.23")
+
+    def test_normalize_limit(self):
+        """지정가 주문 수량/가격 정규화 테스트"""
+        validator = OrderValidator(FakeExchangeInfo())
+        result = validator.normalize(order(type="LIMIT", price=Decimal("50000.07"), quantity=Decimal("0.0129")))
+        assert result.quantity == Decimal("0.012")
+        assert result.price == Decimal("50000.0")
+        # 매도는 가격 올림
+        result = validator.normalize(order(side="SELL", type="LIMIT", price=Decimal("50000.01")))
+        assert result.price == Decimal("50000.1")
+
+    def test_market_lot_size(self):
+        """시장가 MARKET_LOT_SIZE 적용 테스트"""
+        validator = OrderValidator(FakeExchangeInfo())
+        with pytest.raises(ValidationError) as e:
+            validator.normalize(order(quantity=Decimal("200")))
+        assert "MARKET_LOT_SIZE" in e.value.detail
+        # 지정가는 LOT_SIZE 최대 1000까지 허용
+        validator.normalize(order(type="LIMIT", price=Decimal("50000"), quantity=Decimal("200")))
+
+    def test_local_rejections(self):
+        """필터 위반 로컬 거부 및 메트릭 테스트"""
+        validator = OrderValidator(FakeExchangeInfo())
+        counter = metrics_manager.orders_rejected_locally.labels(symbol="BTCUSDT", reason="MIN_NOTIONAL")
+        before = counter._value.get()
+        with pytest.raises(ValidationError):
+            validator.normalize(order(quantity=Decimal("0.001")), mark_price=Decimal("50000"))
+        assert counter._value.get() == before + 1
+
+        with pytest.raises(ValidationError):
+            validator.normalize(order(quantity=Decimal("0.0004")))
+        with pytest.raises(ValidationError):
+            validator.normalize(order(type="LIMIT", price=Decimal("100")))
+        unknown = metrics_manager.orders_rejected_locally.labels(symbol="UNKNOWN", reason="SYMBOL")
+        before = unknown._value.get()
+        with pytest.raises(ValidationError):
+            validator.normalize(order(symbol="FOOUSDT"))
+        assert unknown._value.get() == before + 1
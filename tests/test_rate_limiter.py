@@ -0,0 +1,58 @@
+import pytest
+import asyncio
+from src.services.rate_limiter import RateLimitScheduler, get_order_count, get_request_weight
+from src.utils.exceptions import RateLimitError
+
+@pytest.mark.asyncio
+class TestRateLimitScheduler:
+    async def test_reads_limited_before_orders(self):
+        """읽기 요청 예산과 주문 예약분 테스트"""
+        scheduler = RateLimitScheduler(weight_limit=100, read_threshold=0.5, max_read_queue=0)
+        scheduler.used_weight = 48
+
+        # 읽기 예산(50) 초과 -> 대기열이 없으므로 즉시 차단
+        with pytest.raises(RateLimitError):
+            await scheduler.acquire("futures_account")
+
+        # 주문은 예약된 예산으로 통과 (일괄 주문은 포함된 주문 수만큼 집계)
+        await scheduler.acquire("futures_place_batch_order", {"batchOrders": [{}] * 5})
+        assert scheduler.used_weight == 53
+        assert scheduler.order_count_10s == 5
+
+    async def test_update_from_headers(self):
+        """응답 헤더 사용량 반영 테스트"""
+        scheduler = RateLimitScheduler(weight_limit=2400)
+        scheduler.update_from_headers({
+            "X-MBX-USED-WEIGHT-1M": "1200",
+            "X-MBX-ORDER-COUNT-10S": "7"
+        })
+        status = scheduler.get_status()
+        assert status["used_weight"] == 1200
+        assert status["order_count_10s"] == 7
+
+    async def test_rate_limit_ban(self):
+        """429 응답 시 요청 중단 테스트"""
+        scheduler = RateLimitScheduler(max_read_queue=0)
+        scheduler.handle_rate_limit_error(429, {"Retry-After": "30"})
+        with pytest.raises(RateLimitError):
+            await scheduler.acquire("futures_position_information")
+
+    async def test_orders_fail_fast_while_banned(self):
+        """차단 중 주문 요청이 대기 없이 즉시 실패하는지 테스트"""
+        scheduler = RateLimitScheduler()
+        scheduler.handle_rate_limit_error(418, {"Retry-After": "120"})
+        with pytest.raises(RateLimitError):
+            await asyncio.wait_for(scheduler.acquire("futures_cancel_order"), 0.1)
+        assert scheduler.order_count_10s == 0
+
+def test_request_weight():
+    """요청 가중치 계산 테스트"""
+    assert get_request_weight("futures_account", {}) == 5
+    assert get_request_weight("futures_order_book", {"limit": 1000}) == 20
+    assert get_request_weight("futures_get_open_orders", {}) == 40
+
+def test_order_count():
+    """주문 카운트 증가분 계산 테스트"""
+    assert get_order_count("futures_create_order", {}) == 1
+    assert get_order_count("futures_place_batch_order", {"batchOrders": [{}] * 3}) == 3
+    assert get_order_count("futures_account", {}) == 0
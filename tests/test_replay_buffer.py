@@ -0,0 +1,96 @@
+import pytest
+import asyncio
+import json
+from src.config.env import EnvConfig
+from src.services.replay_buffer import ChannelBuffer
+from src.services.websocket_manager import WebSocketManager
+
+class RecordingWebSocket:
+    client = None
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, data: str):
+        self.sent.append(json.loads(data))
+
+    async def close(self, code: int = 1000):
+        pass
+
+class TestChannelBuffer:
+    def test_since(self):
+        """시퀀스 이후 메시지 조회 테스트"""
+        buffer = ChannelBuffer(size=3)
+        for i in range(5):
+            buffer.append({'n': i})
+        assert buffer.seq == 5
+        assert buffer.first_seq == 3
+        assert [m['seq'] for m in buffer.since(2)] == [3, 4, 5]
+        assert [m['seq'] for m in buffer.since(4)] == [5]
+        assert buffer.since(5) == []
+        # 버퍼에서 밀려난 구간이나 미래 시퀀스는 None
+        assert buffer.since(1) is None
+        assert buffer.since(6) is None
+
+@pytest.mark.asyncio
+class TestResume:
+    async def _setup(self):
+        manager = WebSocketManager()
+        ws = RecordingWebSocket()
+        await manager.subscribe(ws, 'positions')
+        return manager, ws
+
+    async def test_replay_gap(self):
+        """누락 구간 재전송 테스트"""
+        manager, ws = await self._setup()
+        for i in range(3):
+            manager.publish('positions', {'type': 'positions', 'data': [i]})
+        await asyncio.sleep(0.01)
+        ws.sent.clear()
+
+        async def snapshot():
+            raise AssertionError("스냅샷이 호출되면 안 됨")
+
+        assert await manager.resume(ws, 'positions', 1, manager.epoch, snapshot) == 'replay'
+        await asyncio.sleep(0.01)
+        assert [m['seq'] for m in ws.sent] == [2, 3]
+        await manager.unregister(ws)
+
+    async def test_snapshot_fallback(self):
+        """버퍼에서 밀려났거나 epoch가 다르면 스냅샷 테스트"""
+        manager, ws = await self._setup()
+        manager.channels['positions'] = ChannelBuffer(size=2)
+        for i in range(5):
+            manager.publish('positions', {'type': 'positions', 'data': [i]})
+        await asyncio.sleep(0.01)
+        ws.sent.clear()
+
+        async def snapshot():
+            return {'type': 'positions', 'data': ['snap']}
+
+        assert await manager.resume(ws, 'positions', 1, None, snapshot) == 'snapshot'
+        assert await manager.resume(ws, 'positions', 4, 'other-epoch', snapshot) == 'snapshot'
+        await asyncio.sleep(0.01)
+        assert ws.sent == [
+            {'type': 'positions', 'data': ['snap'], 'seq': 5, 'snapshot': True},
+            {'type': 'positions', 'data': ['snap'], 'seq': 5, 'snapshot': True}
+        ]
+        await manager.unregister(ws)
+
+    async def test_idle_channel_evicted(self):
+        """구독자 없는 채널 버퍼 정리 후 시퀀스 이어서 부여 테스트"""
+        manager, ws = await self._setup()
+        manager.publish('positions', {'type': 'positions', 'data': [0]})
+        manager.publish('depth:BTCUSDT', {'type': 'depth', 'data': {}})
+        manager.publish('depth:BTCUSDT', {'type': 'depth', 'data': {}})
+
+        start = manager._swept_at
+        manager.sweep_idle_channels(start + 30)
+        manager.sweep_idle_channels(start + 30 + EnvConfig.WS_REPLAY_IDLE_TTL)
+        assert 'positions' in manager.channels
+        assert 'depth:BTCUSDT' not in manager.channels
+
+        # 다시 만들어진 채널은 이전 시퀀스에서 이어짐 (오래된 resume_from은 재전송 불가)
+        assert manager.publish('depth:BTCUSDT', {'type': 'depth', 'data': {}}) == 3
+        assert manager.get_channel('depth:BTCUSDT').since(1) is None
+        await manager.unregister(ws)
@@ -0,0 +1,128 @@
+import pytest
+from decimal import Decimal
+from src.models.settings import TradingSettings
+from src.models.trading import OrderRequest, Position
+from src.services.risk_engine import RiskEngine
+from src.utils.exceptions import PositionError, ValidationError
+
+def order(**kwargs) -> OrderRequest:
+    return OrderRequest(**{"symbol": "BTCUSDT", "side": "BUY", "quantity": Decimal("0.01"), "leverage": 10, **kwargs})
+
+def make_engine(**settings) -> RiskEngine:
+    engine = RiskEngine()
+    engine.compile(TradingSettings(**settings), version=1)
+    return engine
+
+PRICE = Decimal("50000")
+
+class TestRiskEngine:
+    def test_compile_only_on_version_change(self):
+        """설정 버전이 같으면 규칙 재사용 테스트"""
+        engine = RiskEngine()
+        rules = engine.compile(TradingSettings(), version=1)
+        assert engine.compile(TradingSettings(max_positions=1), version=1) is rules
+        assert engine.compile(TradingSettings(max_positions=1), version=2).max_positions == 1
+        with pytest.raises(TypeError):
+            rules.notional_caps["BTCUSDT"] = Decimal("1")
+
+    def test_symbol_and_leverage(self):
+        """허용 심볼/최대 레버리지 검사 테스트"""
+        engine = make_engine(max_leverage=20)
+        engine.check(order(), {}, PRICE)
+        with pytest.raises(ValidationError):
+            engine.check(order(symbol="DOGEUSDT"), {}, PRICE)
+        with pytest.raises(ValidationError):
+            engine.check(order(leverage=50), {}, PRICE)
+
+    def test_notional_cap(self):
+        """심볼 명목가 한도 (기존 포지션 합산) 테스트"""
+        engine = make_engine(max_position_notional={"BTCUSDT": 1000})
+        position = Position(
+            symbol="BTCUSDT", side="LONG", quantity=Decimal("0.015"), entry_price=PRICE,
+            leverage=10, margin=Decimal("75")
+        )
+        with pytest.raises(PositionError):
+            engine.check(order(), {"BTCUSDT": position}, PRICE)
+        # 반대 방향은 포지션 축소
+        engine.check(order(side="SELL"), {"BTCUSDT": position}, PRICE)
+
+    def test_exposure_and_rate(self):
+        """계정 증거금 한도와 주문 빈도 한도 테스트"""
+        engine = make_engine(risk_limit=0.1, max_orders_per_minute=2)
+        with pytest.raises(PositionError):
+            # 증거금 50 > 잔고 400의 10%
+            engine.check(order(), {}, PRICE, equity=Decimal("400"))
+        engine.check(order(), {}, PRICE, equity=Decimal("1000"))
+        # 통과한 검사는 전송 전에 슬롯을 예약하므로 동시 주문이 한도를 넘지 못함
+        reservation = engine.check(order(), {}, PRICE)
+        with pytest.raises(ValidationError):
+            engine.check(order(), {}, PRICE)
+        # 전송 실패로 반환된 슬롯은 다시 사용 가능
+        engine.release(reservation)
+        engine.check(order(), {}, PRICE)
+        with pytest.raises(ValidationError):
+            engine.check(order(), {}, PRICE)
+
+    def test_unknown_price_rejected_after_static_rules(self):
+        """가격 없는 규칙을 먼저 검사하고 마크 가격을 모르면 거부하는지 테스트"""
+        engine = make_engine(max_leverage=20)
+        with pytest.raises(ValidationError) as e:
+            engine.check(order(leverage=50), {}, None)
+        assert "레버리지" in e.value.detail
+        with pytest.raises(ValidationError) as e:
+            engine.check(order(), {}, None)
+        assert "마크 가격" in e.value.detail
+
+    def test_stop_loss_distance(self):
+        """손절 폭 한도 테스트"""
+        engine = make_engine()
+        engine.check(order(stop_loss=Decimal("1.5"), trigger_mode="percent"), {}, PRICE)
+        with pytest.raises(ValidationError):
+            engine.check(order(stop_loss=Decimal("45000")), {}, PRICE)
+
+@pytest.mark.asyncio
+class TestOrderRouteRisk:
+    async def test_batch_sends_only_passed_orders(self, monkeypatch):
+        """일괄 주문 경로가 리스크 검사 통과 주문만 전송하고 접수되지 않은 주문의 빈도 슬롯을 반환하는지 테스트"""
+        from src.api import routes
+        sent = []
+
+        async def get_trading_settings():
+            return TradingSettings(max_orders_per_minute=2)
+
+        async def get_all_positions():
+            raise AssertionError("REST position lookup")
+
+        async def create_orders(orders):
+            sent.extend(orders)
+            return [{"index": 0, "status": "accepted", "order": {}}, {"index": 1, "status": "failed", "error": "x"}]
+
+        monkeypatch.setattr(routes, "risk_engine", RiskEngine())
+        monkeypatch.setattr(routes.settings_service, "get_trading_settings", get_trading_settings)
+        monkeypatch.setattr(routes.binance_service, "get_all_positions", get_all_positions)
+        monkeypatch.setattr(routes.binance_service, "create_orders", create_orders)
+        monkeypatch.setattr(routes.binance_service, "_cached_mark_price", lambda symbol: PRICE if symbol == "BTCUSDT" else None)
+        monkeypatch.setattr(routes.binance_service.account_store, "is_synced", True)
+
+        response = await routes.create_orders([
+            order(symbol="DOGEUSDT"),
+            order(),
+            order(symbol="ETHUSDT"),
+            order(),
+            order()
+        ])
+        statuses = [result["status"] for result in response["results"]]
+        assert statuses == ["rejected", "accepted", "rejected", "failed", "rejected"]
+        assert [result["index"] for result in response["results"]] == list(range(5))
+        assert len(sent) == 2
+        # 거래소에서 실패한 주문의 슬롯은 반환
+        assert len(routes.risk_engine._order_times) == 1
+
+    async def test_unsynced_account_rejected(self, monkeypatch):
+        """계정 상태가 동기화되지 않았으면 REST 조회 없이 503으로 거부하는지 테스트"""
+        from fastapi import HTTPException
+        from src.api import routes
+        monkeypatch.setattr(routes.binance_service.account_store, "is_synced", False)
+        with pytest.raises(HTTPException) as e:
+            await routes.create_order(order())
+        assert e.value.status_code == 503
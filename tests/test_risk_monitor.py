@@ -0,0 +1,132 @@
+import pytest
+import asyncio
+from types import SimpleNamespace
+from src.services.account_store import AccountStore
+from src.services.market_data_hub import MarketDataHub
+from src.services.risk_monitor import PortfolioRiskMonitor
+
+class FakeStreams:
+    def __init__(self):
+        self.subscribed = set()
+
+    async def subscribe(self, stream, handler):
+        self.subscribed.add(stream)
+
+    async def unsubscribe(self, stream):
+        self.subscribed.discard(stream)
+
+class FakeNotification:
+    def __init__(self):
+        self.messages = []
+
+    def notify(self, message, alert_level="INFO"):
+        self.messages.append((message, alert_level))
+        return True
+
+def make_position(symbol, amount, entry, isolated_wallet=0.0, side="BOTH"):
+    return {
+        "symbol": symbol,
+        "positionAmt": amount,
+        "entryPrice": entry,
+        "markPrice": entry,
+        "unrealizedProfit": 0.0,
+        "liquidationPrice": 0.0,
+        "isolatedMargin": isolated_wallet,
+        "leverage": 10,
+        "positionSide": side
+    }
+
+def make_monitor(positions, wallet=1000.0):
+    store = AccountStore()
+    streams = FakeStreams()
+    binance = SimpleNamespace(
+        account_store=store,
+        market_data=MarketDataHub(streams),
+        get_leverage_brackets=lambda symbol: [
+            {"notionalFloor": 0, "notionalCap": 50000, "maintMarginRatio": 0.005, "cum": 0}
+        ]
+    )
+    notification = FakeNotification()
+    monitor = PortfolioRiskMonitor(binance, notification, liquidation_alert_percent=5.0, margin_ratio_alert=0.8)
+    account = {
+        "totalWalletBalance": wallet,
+        "totalUnrealizedProfit": 0,
+        "totalMarginBalance": wallet,
+        "availableBalance": wallet,
+        "maxWithdrawAmount": wallet,
+        "assets": [{"asset": "USDT", "walletBalance": wallet, "crossWalletBalance": wallet}]
+    }
+    store.load_snapshot(account, positions, [])
+    return monitor, binance, streams, notification
+
+async def tick(binance, symbol, price):
+    binance.market_data._refcounts.setdefault(symbol, 1)
+    await binance.market_data._on_mark_price({"s": symbol, "p": str(price)})
+    await asyncio.sleep(0)
+
+@pytest.mark.asyncio
+class TestPortfolioRiskMonitor:
+    async def test_vectorized_metrics(self):
+        """격리/교차 포지션 리스크 지표 일괄 계산 테스트"""
+        monitor, _, _, _ = make_monitor([
+            make_position("BTCUSDT", 1.0, 100.0, isolated_wallet=10.0),
+            make_position("ETHUSDT", -2.0, 50.0)
+        ])
+        summary = {p["symbol"]: p for p in monitor.get_summary()["positions"]}
+        btc = summary["BTCUSDT"]
+        # 격리 롱: (10 - 100) / (0.005 - 1)
+        assert btc["liquidation_price"] == pytest.approx(90 / 0.995)
+        assert btc["liquidation_distance"] == pytest.approx((100 - 90 / 0.995))
+        assert btc["margin_ratio"] == pytest.approx(0.5 / 10)
+        eth = summary["ETHUSDT"]
+        # 교차 숏: (1000 + 100) / (2 * 0.005 + 2)
+        assert eth["liquidation_price"] == pytest.approx(1100 / 2.01)
+        assert eth["margin_ratio"] == pytest.approx(0.5 / 1000)
+        assert monitor.get_summary()["notional"] == pytest.approx(200.0)
+
+    async def test_alert_on_threshold_cross_with_hysteresis(self):
+        """임계값 진입 시 한 번만 경보하고 충분히 회복한 뒤 재무장하는지 테스트"""
+        monitor, binance, _, notification = make_monitor([
+            make_position("BTCUSDT", 1.0, 100.0, isolated_wallet=10.0)
+        ])
+        await tick(binance, "BTCUSDT", 94.0)
+        assert len(notification.messages) == 1
+        assert monitor.unrealized[0] == pytest.approx(-6.0)
+
+        await tick(binance, "BTCUSDT", 93.5)
+        await tick(binance, "BTCUSDT", 95.5)
+        assert len(notification.messages) == 1
+
+        await tick(binance, "BTCUSDT", 100.0)
+        await tick(binance, "BTCUSDT", 94.0)
+        assert len(notification.messages) == 2
+        assert notification.messages[-1][1] == "WARNING"
+
+    async def test_batched_ticks_recompute_once(self):
+        """같은 루프 반복의 틱 묶음이 한 번의 재계산으로 병합되는지 테스트"""
+        monitor, binance, _, _ = make_monitor([
+            make_position("BTCUSDT", 1.0, 100.0),
+            make_position("ETHUSDT", 1.0, 50.0)
+        ])
+        calls = []
+        recompute = monitor.recompute
+        monitor.recompute = lambda: (calls.append(1), recompute())
+        binance.market_data._refcounts.update({"BTCUSDT": 1, "ETHUSDT": 1})
+        await binance.market_data._on_mark_price([
+            {"s": "BTCUSDT", "p": "110"},
+            {"s": "ETHUSDT", "p": "40"}
+        ])
+        await asyncio.sleep(0)
+        assert len(calls) == 1
+        assert monitor.get_summary()["unrealized_pnl"] == pytest.approx(0.0)
+
+    async def test_subscriptions_follow_positions(self):
+        """포지션 심볼만 마크 가격을 구독하고 청산 시 해제하는지 테스트"""
+        monitor, binance, streams, _ = make_monitor([make_position("BTCUSDT", 1.0, 100.0)])
+        await monitor.start()
+        assert streams.subscribed == {"btcusdt@markPrice@1s"}
+
+        binance.account_store.reconcile_positions("BTCUSDT", [])
+        await asyncio.sleep(0)
+        assert streams.subscribed == set()
+        await monitor.stop()
@@ -0,0 +1,56 @@
+import pytest
+import asyncio
+import json
+from src.services.account_store import AccountStore
+from src.services.user_stream_service import UserStreamService
+
+class FakeWebSocket:
+    def __init__(self, service, messages):
+        self.service = service
+        self.messages = list(messages)
+
+    async def recv(self):
+        if not self.messages:
+            self.service._running = False
+            await asyncio.sleep(0)
+            return json.dumps({"e": "noop"})
+        return json.dumps(self.messages.pop(0))
+
+class FakeBinance:
+    testnet = False
+
+    def __init__(self, store):
+        self.store = store
+        self.reconciled = []
+
+    def get_leverage(self, symbol):
+        return 10
+
+    async def reconcile_position(self, symbol):
+        self.reconciled.append(symbol)
+        self.store.reconcile_positions(symbol, [])
+        return None
+
+@pytest.mark.asyncio
+class TestUserStreamService:
+    async def test_fill_gap_reconciled(self):
+        """유저 스트림에서 체결 누락 감지 시 REST 대조 후 리스너에 반영하는지 테스트"""
+        store = AccountStore()
+        binance = FakeBinance(store)
+        service = UserStreamService(binance, store)
+        applied = []
+
+        async def apply_position(symbol, position):
+            applied.append((symbol, position))
+
+        service.add_reconcile_listener(apply_position)
+        order = {"s": "BTCUSDT", "i": 1, "S": "BUY", "o": "LIMIT", "q": "0.03", "p": "50000"}
+        ws = FakeWebSocket(service, [
+            {"e": "ORDER_TRADE_UPDATE", "E": 1, "o": {**order, "X": "NEW", "z": "0", "l": "0"}},
+            {"e": "ORDER_TRADE_UPDATE", "E": 3, "o": {**order, "X": "PARTIALLY_FILLED", "z": "0.02", "l": "0.01"}}
+        ])
+        service._running = True
+        await service._consume(ws)
+        await asyncio.gather(*service._reconcile_tasks)
+        assert binance.reconciled == ["BTCUSDT"]
+        assert applied == [("BTCUSDT", None)]
@@ -0,0 +1,83 @@
+import pytest
+import asyncio
+from src.services.webhook_queue import WebhookQueue
+
+@pytest.mark.asyncio
+class TestWebhookQueue:
+    async def test_coalesce_same_key(self):
+        """처리 중 도착한 같은 심볼 이벤트 합치기 테스트"""
+        batches = []
+        release = asyncio.Event()
+
+        async def handler(key, events):
+            batches.append((key, [e['id'] for e in events]))
+            await release.wait()
+
+        queue = WebhookQueue(max_size=10, workers=2)
+        await queue.start(handler)
+        queue.submit('BTCUSDT', {'id': 1})
+        await asyncio.sleep(0.01)
+        for i in range(2, 5):
+            queue.submit('BTCUSDT', {'id': i})
+        await asyncio.sleep(0.01)
+        # 같은 키는 다른 워커가 동시에 처리하지 않음
+        assert batches == [('BTCUSDT', [1])]
+        assert queue.depth == 3
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert batches == [('BTCUSDT', [1]), ('BTCUSDT', [2, 3, 4])]
+        assert queue.depth == 0
+        await queue.stop()
+
+    async def test_reject_when_full(self):
+        """큐 초과 시 거부 테스트"""
+        queue = WebhookQueue(max_size=2, workers=1)
+        assert queue.submit('BTCUSDT', {})
+        assert queue.submit('ETHUSDT', {})
+        assert not queue.submit('XRPUSDT', {})
+        assert queue.depth == 2
+
+    async def test_handler_error_keeps_worker(self):
+        """처리 실패 후에도 워커 유지 테스트"""
+        processed = []
+
+        async def handler(key, events):
+            if key == 'BAD':
+                raise RuntimeError("boom")
+            processed.append(key)
+
+        queue = WebhookQueue(max_size=10, workers=1, max_retries=0)
+        await queue.start(handler)
+        queue.submit('BAD', {})
+        queue.submit('BTCUSDT', {})
+        await asyncio.sleep(0.01)
+        assert processed == ['BTCUSDT']
+        assert [key for key, _, _ in queue.dead_letters] == ['BAD']
+        await queue.stop()
+
+    async def test_failed_batch_retried_in_order(self):
+        """실패한 배치가 이후 도착한 이벤트보다 먼저 재처리되는지 테스트"""
+        batches = []
+
+        async def handler(key, events):
+            batches.append([e['id'] for e in events])
+            if len(batches) == 1:
+                queue.submit('BTCUSDT', {'id': 2})
+                raise RuntimeError("temporary")
+
+        queue = WebhookQueue(max_size=10, workers=1, max_retries=2, retry_delay=0.01)
+        await queue.start(handler)
+        queue.submit('BTCUSDT', {'id': 1})
+        await asyncio.sleep(0.05)
+        assert batches == [[1], [1, 2]]
+        assert queue.depth == 0
+        assert not queue.dead_letters
+        await queue.stop()
+
+    async def test_submit_many_all_or_nothing(self):
+        """여러 이벤트 등록 시 자리가 부족하면 모두 거부하는지 테스트"""
+        queue = WebhookQueue(max_size=2, workers=1)
+        assert not queue.submit_many([('BTCUSDT', {}), ('ETHUSDT', {}), ('XRPUSDT', {})])
+        assert queue.depth == 0
+        assert queue.submit_many([('BTCUSDT', {}), ('ETHUSDT', {})])
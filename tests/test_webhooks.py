@@ -0,0 +1,144 @@
+import hashlib
+import hmac
+import json
+import time
+import pytest
+from types import SimpleNamespace
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api import webhooks
+from src.config.env import EnvConfig
+from src.services.account_store import AccountStore
+from src.utils.replay_cache import ReplayCache, ReplayCacheFull
+
+SECRET = "test-secret"
+
+def signed_headers(body: bytes, timestamp: int = None) -> dict:
+    timestamp = str(timestamp or int(time.time() * 1000))
+    signature = hmac.new(SECRET.encode(), timestamp.encode() + body, hashlib.sha256).hexdigest()
+    return {"X-Binance-Signature": signature, "X-Binance-Timestamp": timestamp}
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(EnvConfig, "WEBHOOK_SECRET", SECRET)
+    monkeypatch.setattr(webhooks, "replay_cache", ReplayCache(max_size=100, ttl=600))
+    monkeypatch.setattr(webhooks, "webhook_queue", webhooks.WebhookQueue(max_size=10, workers=1))
+    app = FastAPI()
+    app.include_router(webhooks.router)
+    return TestClient(app)
+
+class TestWebhooks:
+    def test_accept_and_reject_replay(self, client):
+        """서명 검증 후 접수, 같은 요청 재전송 거부 테스트"""
+        body = json.dumps({"e": "ORDER_TRADE_UPDATE", "o": {"s": "BTCUSDT"}}).encode()
+        headers = signed_headers(body)
+
+        response = client.post("/webhook/binance", content=body, headers=headers)
+        assert response.status_code == 202
+        assert webhooks.webhook_queue.depth == 1
+
+        response = client.post("/webhook/binance", content=body, headers=headers)
+        assert response.status_code == 409
+        assert webhooks.webhook_queue.depth == 1
+
+    def test_invalid_signature(self, client):
+        """잘못된 서명 거부 테스트"""
+        body = b'{"e":"ACCOUNT_UPDATE"}'
+        headers = signed_headers(body)
+        response = client.post("/webhook/binance", content=body + b" ", headers=headers)
+        assert response.status_code == 401
+
+    def test_stale_timestamp(self, client):
+        """허용 시간 창 밖 타임스탬프 거부 테스트"""
+        body = b'{"e":"ACCOUNT_UPDATE"}'
+        stale = int((time.time() - EnvConfig.WEBHOOK_TIMESTAMP_TOLERANCE - 60) * 1000)
+        response = client.post("/webhook/binance", content=body, headers=signed_headers(body, stale))
+        assert response.status_code == 401
+
+    def test_replay_cache_bounded(self):
+        """재전송 캐시 크기 제한 테스트"""
+        cache = ReplayCache(max_size=2, ttl=60)
+        assert cache.check_and_add("a")
+        assert not cache.check_and_add("a")
+        assert cache.check_and_add("b")
+        # 유효한 항목은 밀어내지 않고 거부
+        with pytest.raises(ReplayCacheFull):
+            cache.check_and_add("c")
+        assert len(cache) == 2
+        assert not cache.check_and_add("a")
+
+    def test_replay_cache_full_rejected(self, client, monkeypatch):
+        """재전송 캐시가 가득 차면 503으로 재시도 유도 테스트"""
+        monkeypatch.setattr(webhooks, "replay_cache", ReplayCache(max_size=1, ttl=600))
+        first = b'{"e":"ACCOUNT_UPDATE","a":{}}'
+        assert client.post("/webhook/binance", content=first, headers=signed_headers(first)).status_code == 202
+        second = b'{"e":"ACCOUNT_UPDATE","a":{"B":[]}}'
+        response = client.post("/webhook/binance", content=second, headers=signed_headers(second))
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+    def test_non_object_payload(self, client):
+        """객체가 아닌 JSON 본문은 400으로 거부하고 서명 등록 취소 테스트"""
+        body = b'[1, 2]'
+        response = client.post("/webhook/binance", content=body, headers=signed_headers(body))
+        assert response.status_code == 400
+        assert len(webhooks.replay_cache) == 0
+
+    def test_account_update_keyed_by_symbol(self):
+        """ACCOUNT_UPDATE가 같은 심볼 주문 이벤트와 같은 키로 직렬화되는지 테스트"""
+        order = {"e": "ORDER_TRADE_UPDATE", "o": {"s": "BTCUSDT"}}
+        account = {
+            "e": "ACCOUNT_UPDATE",
+            "a": {"B": [{"a": "USDT"}], "P": [{"s": "BTCUSDT"}, {"s": "ETHUSDT"}, {"s": "BTCUSDT", "ps": "SHORT"}]}
+        }
+        assert webhooks.split_webhook_event(order) == [("BTCUSDT", order)]
+        items = webhooks.split_webhook_event(account)
+        assert [key for key, _ in items] == ["BTCUSDT", "ETHUSDT"]
+        assert len(items[0][1]["a"]["P"]) == 2
+        assert items[0][1]["a"]["B"] == [{"a": "USDT"}]
+        assert items[1][1]["a"]["B"] == []
+        # 포지션 없는 잔고 변경은 공통 계정 키
+        assert webhooks.webhook_key({"e": "ACCOUNT_UPDATE", "a": {"B": [], "P": []}}) == webhooks.ACCOUNT_KEY
+
+class FakeReconcileBinance:
+    def __init__(self, failures: int = 0):
+        self.account_store = AccountStore()
+        self.failures = failures
+        self.reconciled = []
+
+    def get_leverage(self, symbol):
+        return 10
+
+    async def reconcile_position(self, symbol):
+        self.reconciled.append(symbol)
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("timeout")
+        self.account_store.reconcile_positions(symbol, [])
+        return None
+
+@pytest.mark.asyncio
+class TestProcessWebhookEvents:
+    async def test_reconcile_retried_after_failure(self):
+        """REST 대조 실패 후 같은 배치 재시도 시 대조를 다시 수행하는지 테스트"""
+        binance = FakeReconcileBinance(failures=1)
+        applied = []
+
+        async def apply_position(symbol, position):
+            applied.append(symbol)
+
+        trading = SimpleNamespace(binance=binance, apply_position=apply_position)
+        order = {"s": "BTCUSDT", "i": 1, "S": "BUY", "o": "LIMIT", "q": "0.03", "p": "50000"}
+        # 0.01 체결 이벤트가 누락된 부분 체결
+        events = [
+            {"e": "ORDER_TRADE_UPDATE", "E": 1, "o": {**order, "X": "NEW", "z": "0", "l": "0"}},
+            {"e": "ORDER_TRADE_UPDATE", "E": 3, "o": {**order, "X": "PARTIALLY_FILLED", "z": "0.02", "l": "0.01"}}
+        ]
+        with pytest.raises(RuntimeError):
+            await webhooks.process_webhook_events(trading, "BTCUSDT", events)
+        await webhooks.process_webhook_events(trading, "BTCUSDT", events)
+        assert binance.reconciled == ["BTCUSDT", "BTCUSDT"]
+        assert applied == ["BTCUSDT"]
+        # 대조가 끝나면 더 이상 반환하지 않음
+        await webhooks.process_webhook_events(trading, "BTCUSDT", events)
+        assert binance.reconciled == ["BTCUSDT", "BTCUSDT"]
@@ -0,0 +1,84 @@
+import pytest
+from types import SimpleNamespace
+from src.api import websocket as ws_api
+
+@pytest.fixture(autouse=True)
+def exchange_symbols(monkeypatch):
+    monkeypatch.setattr(ws_api.binance_service.exchange_info, "_symbols", {"BTCUSDT": object(), "ETHUSDT": object()})
+
+class TestSubscribeParsing:
+    def test_symbols_normalized(self):
+        """심볼 대문자 정규화 테스트"""
+        assert ws_api.parse_symbols(["btcusdt", "EthUsdt"]) == ["BTCUSDT", "ETHUSDT"]
+        assert ws_api.parse_symbols(None) == []
+
+    def test_unknown_symbol_rejected(self):
+        """거래소 정보에 없는 심볼 거부 테스트"""
+        with pytest.raises(ValueError):
+            ws_api.parse_symbols(["BTCUSDT", "NOPEUSDT"])
+        with pytest.raises(ValueError):
+            ws_api.parse_symbols([123])
+
+    def test_candle_keys_normalized(self):
+        """캔들 구독 키 심볼 정규화 테스트"""
+        assert ws_api.parse_candles(["btcusdt@1m"]) == ["BTCUSDT@1m"]
+        with pytest.raises(ValueError):
+            ws_api.parse_candles(["NOPEUSDT@1m"])
+        with pytest.raises(ValueError):
+            ws_api.parse_candles("BTCUSDT@1m")
+
+    def test_max_hz_must_be_finite(self):
+        """max_hz 유효 범위 테스트"""
+        assert ws_api.parse_max_hz(None) is None
+        assert ws_api.parse_max_hz(1000) == ws_api.EnvConfig.WS_MAX_HZ
+        for value in ("nan", "inf", 0, -1):
+            with pytest.raises(ValueError):
+                ws_api.parse_max_hz(value)
+
+    def test_lists_required(self):
+        """문자열 목록 값을 한 글자씩 순회하지 않고 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            ws_api.parse_symbols("BTCUSDT")
+        with pytest.raises(ValueError):
+            ws_api.parse_channels("positions")
+
+    def test_batch_ms(self):
+        """배치 주기 파싱 테스트"""
+        assert ws_api.parse_batch_ms("0") is None
+        assert ws_api.parse_batch_ms("250") == 250
+        with pytest.raises(ValueError):
+            ws_api.parse_batch_ms("fast")
+
+    def test_wrong_types_rejected(self):
+        """객체/배열 등 잘못된 타입 값을 ValueError로 거부하는지 테스트"""
+        with pytest.raises(ValueError):
+            ws_api.parse_max_hz({})
+        with pytest.raises(ValueError):
+            ws_api.parse_max_hz(True)
+        with pytest.raises(ValueError):
+            ws_api.parse_resume_from({"BTCUSDT": []}, ["BTCUSDT"])
+        with pytest.raises(ValueError):
+            ws_api.parse_resume_from([1], ["BTCUSDT"])
+        assert ws_api.parse_resume_from({"BTCUSDT": "5"}, ["BTCUSDT"]) == {"BTCUSDT": 5}
+        with pytest.raises(ValueError):
+            ws_api.parse_batch_ms([])
+        with pytest.raises(ValueError):
+            ws_api.parse_batch_ms(float("inf"))
+        with pytest.raises(ValueError):
+            ws_api.parse_channels([{}])
+        with pytest.raises(ValueError):
+            ws_api.parse_symbols([{"s": "BTCUSDT"}])
+
+class TestIdlePublishing:
+    def test_candles_and_indicators_buffered_without_subscribers(self, monkeypatch):
+        """구독자가 없어도 캔들/지표 시퀀스가 진행되어 재연결 시 누락 구간을 재전송하는지 테스트"""
+        manager = ws_api.WebSocketManager()
+        monkeypatch.setattr(ws_api, "ws_manager", manager)
+        series = SimpleNamespace(symbol="BTCUSDT", interval="1m")
+        ws_api.publish_candle(series, {"t": 0, "c": "1"}, closed=True)
+        ws_api.publish_indicators("BTCUSDT", [{"name": "rsi", "value": 50}])
+
+        candles = manager.get_channel(ws_api.candle_channel("BTCUSDT@1m"))
+        assert candles.seq == 1
+        assert [m['data']['closed'] for m in candles.since(0)] == [True]
+        assert manager.get_channel(ws_api.indicator_channel("BTCUSDT")).seq == 1
@@ -0,0 +1,75 @@
+import pytest
+import asyncio
+import json
+import msgpack
+from src.utils.wire_format import (
+    TICK_STRUCT, WireFormat, decode_tick, encode, join_frames, negotiate
+)
+from src.services.websocket_manager import WebSocketManager
+
+PRICE_MESSAGE = {
+    'type': 'price',
+    'data': {'symbol': 'BTCUSDT', 'price': '65000.10', 'timestamp': '1700000000000'}
+}
+
+class RecordingWebSocket:
+    client = None
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, data: str):
+        self.sent.append(data)
+
+    async def send_bytes(self, data: bytes):
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000):
+        pass
+
+class TestWireFormat:
+    def test_negotiate(self):
+        """서브프로토콜/쿼리 포맷 협상 테스트"""
+        assert negotiate([]) == (WireFormat.JSON, None)
+        assert negotiate(['wuya.msgpack']) == (WireFormat.MSGPACK, 'wuya.msgpack')
+        assert negotiate(['other', 'wuya.binary']) == (WireFormat.BINARY, 'wuya.binary')
+        assert negotiate([], 'MSGPACK') == (WireFormat.MSGPACK, None)
+        with pytest.raises(ValueError):
+            negotiate([], 'xml')
+
+    def test_binary_tick(self):
+        """고정 길이 바이너리 틱 인코딩 테스트"""
+        frame = encode(PRICE_MESSAGE, WireFormat.BINARY)
+        assert len(frame) == TICK_STRUCT.size
+        assert decode_tick(frame) == {
+            'symbol': 'BTCUSDT', 'price': 65000.10, 'timestamp': 1700000000000, 'seq': 0
+        }
+        # 가격 외 메시지는 JSON 텍스트
+        assert json.loads(encode({'type': 'subscribed'}, WireFormat.BINARY)) == {'type': 'subscribed'}
+
+    def test_join_msgpack_batch(self):
+        """MessagePack 배치 결합 테스트"""
+        frames = [encode(PRICE_MESSAGE, WireFormat.MSGPACK), encode({'type': 'x'}, WireFormat.MSGPACK)]
+        assert msgpack.unpackb(join_frames(frames, WireFormat.MSGPACK)) == {
+            'type': 'batch', 'data': [PRICE_MESSAGE, {'type': 'x'}]
+        }
+
+@pytest.mark.asyncio
+class TestBroadcastFormats:
+    async def test_broadcast_per_format(self):
+        """포맷별 직렬화 후 브로드캐스트 테스트"""
+        manager = WebSocketManager()
+        sockets = {fmt: RecordingWebSocket() for fmt in WireFormat}
+        for fmt, ws in sockets.items():
+            manager.register(ws, fmt)
+            await manager.subscribe(ws, 'BTCUSDT')
+
+        await manager.broadcast(PRICE_MESSAGE, 'BTCUSDT')
+        await manager.broadcast(PRICE_MESSAGE, 'BTCUSDT')
+        await asyncio.sleep(0.01)
+        for ws in sockets.values():
+            await manager.unregister(ws)
+
+        assert json.loads(sockets[WireFormat.JSON].sent[0]) == PRICE_MESSAGE
+        assert msgpack.unpackb(sockets[WireFormat.MSGPACK].sent[0]) == PRICE_MESSAGE
+        assert decode_tick(sockets[WireFormat.BINARY].sent[0])['symbol'] == 'BTCUSDT'